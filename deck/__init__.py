@@ -0,0 +1,90 @@
+"""
+SSML Prosody Control for French TTS — ICNLSP 2025 Presentation
+================================================================
+Refactored Manim animation (target: 9 minutes)
+
+Authors: Nassima Ould Ouali, Awais Hussain Sani, Tim Luka Horstmann,
+         Ruben Bueno, Jonah Dauvet, Eric Moulines
+Ref: https://aclanthology.org/2025.icnlsp-1.30/
+
+TIMING SCRIPT - TARGET: 9min (540s)
+====================================
+SCENE 0: Introduction                                    0s   –  40s   (~40s)
+SCENE 1: Audio Basics (waveform, spectrogram, F0)      40s  –  95s   (~55s)
+SCENE 1bis: Prosody Primer                              95s  – 150s   (~55s)
+SCENE 2A: TTS Expressivity Problem                     150s – 210s   (~60s)
+SCENE 2B: SSML Challenges                              210s – 260s   (~50s)
+SCENE 3A: Pipeline Interactive                         260s – 310s   (~50s)
+SCENE 3B: Pipeline Diagram (Manim)                     310s – 350s   (~40s)
+SCENE 4: Stage 1 – Break Prediction (QwenA)            350s – 400s   (~50s)
+SCENE 5: Stage 2 – Prosody Prediction (QwenB)          400s – 450s   (~50s)
+SCENE 6: Objective Evaluation                          450s – 490s   (~40s)
+SCENE 7: Subjective Evaluation (AB Test)               490s – 530s   (~40s)
+SCENE 8: Conclusions & Future Work                     530s – 560s   (~30s)
+
+Chaque scène porte son budget (TARGET_SECONDS) ; le calendrier mesuré
+s'obtient sans rendu avec « python -m manimtts timeline ».
+
+Une scène par module (deck/intro.py, deck/basics.py, ...), plus
+deck/theme.py (palette), deck/common.py (utilitaires) et deck/video.py
+(VideoComplet). Ce paquet n'importe rien : SCENES donne le module de chaque
+classe et ``load`` (ou ``deck.SceneOutro``) n'importe que le module demandé.
+Depuis la racine du dépôt :
+
+    python -m manim -qh deck/outro.py SceneOutro
+    python -m manimtts scenes          # liste, sans importer Manim
+"""
+
+import importlib
+
+# Classe de scène → module qui la définit.
+SCENES = {
+    "SceneIntro":               "deck.intro",
+    "SceneBasics":              "deck.basics",
+    "SceneProsodyPrimer":       "deck.primer",
+    "SceneProblemTTS":          "deck.problem_tts",
+    "SceneProblemSSML":         "deck.problem_ssml",
+    "ScenePipelineInteractive": "deck.pipeline",
+    "SceneCascadeInteractive":  "deck.cascade",
+    "SceneStage1":              "deck.stage1",
+    "SceneStage2":              "deck.stage2",
+    "SceneEvalObj":             "deck.eval_obj",
+    "SceneEvalSubj":            "deck.eval_subj",
+    "SceneOutro":               "deck.outro",
+    "TransitionCard":           "deck.common",
+    "VideoComplet":             "deck.video",
+}
+
+# ============================================================================
+# ORDRE DE LA VIDÉO : (scène, titre de la transition qui suit)
+# Partagé par VideoComplet et par l'orchestrateur (python -m manimtts render)
+# ============================================================================
+PLAYLIST = [
+    ("SceneIntro",               "Audio signal basics"),                  # 0) Introduction
+    ("SceneBasics",              "Prosody & SSML"),                       # 1) Audio Basics
+    ("SceneProsodyPrimer",       "The TTS expressivity problem"),         # 1bis) Prosody Primer
+    ("SceneProblemTTS",          "SSML challenges"),                      # 2A) TTS Expressivity Problem
+    ("SceneProblemSSML",         "Proposed SSML pipeline"),               # 2B) SSML Challenges
+    ("ScenePipelineInteractive", "Two-stage SSML cascade"),               # 3A) Pipeline – Interactive overview
+    ("SceneCascadeInteractive",  "Stage 1: break prediction (QwenA)"),    # 3B) Two-stage SSML cascade (image)
+    ("SceneStage1",              "Stage 2: prosody prediction (QwenB)"),  # 4) Stage 1 – Break prediction (QwenA)
+    ("SceneStage2",              "Objective evaluation"),                 # 5) Stage 2 – Prosody prediction (QwenB)
+    ("SceneEvalObj",             "Subjective evaluation (AB test)"),      # 6) Objective evaluation
+    ("SceneEvalSubj",            "Conclusions & future work"),            # 7) Subjective evaluation (AB test)
+    ("SceneOutro",               None),                                   # 8) Outro
+]
+
+
+def load(name: str):
+    """Classe de scène ``name`` (n'importe que son module)."""
+    try:
+        module = SCENES[name]
+    except KeyError:
+        raise LookupError(f"scène inconnue : {name!r} (voir deck.SCENES)") from None
+    return getattr(importlib.import_module(module), name)
+
+
+def __getattr__(name: str):
+    if name in SCENES:
+        return load(name)
+    raise AttributeError(f"module 'deck' has no attribute {name!r}")
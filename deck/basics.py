@@ -0,0 +1,169 @@
+"""
+Scène 1 : bases du signal audio (forme d'onde, spectrogramme, F0).
+"""
+
+from deck.common import *
+from manimtts.animations import SpectrogramReveal
+from manimtts.audiovis import (
+    f0_mobject, spectrogram_mobject, speech_sample, waveform_mobject, wav_seconds,
+)
+
+
+# ============================================================================
+# SCENE 1: Audio Basics (~40 s, sans padding)
+# ============================================================================
+class SceneBasics(DeckScene):
+    """
+    Waveform → Spectrogram → Pitch/F0
+    Même style que SceneIntro (T = DejaVu Sans, palette Hi! PARIS).
+    """
+    TARGET_SECONDS = 55.0
+    NARRATION = (
+        "<speak>"
+        'Let us start with the basics of an audio signal. '
+        '<break time="400ms"/> '
+        'A waveform shows amplitude over time. <break time="200ms"/> Its average energy, the R M S, is what we hear as loudness. '
+        '<mark name="spectrogram"/> '
+        'A spectrogram, computed with a short-time Fourier transform, <break time="200ms"/> shows how energy spreads across frequencies over time. '
+        '<mark name="pitch"/> '
+        'Finally, the pitch we perceive follows the fundamental frequency, <break time="150ms"/> F zero, '
+        'usually extracted with tools such as pyworld or Praat. '
+        "</speak>"
+    )
+
+    def construct(self):
+        # WAV analysé pour les trois figures (assets/speech.wav ou signal de démo)
+        sample = speech_sample()
+
+        # --- Titre principal ---
+        title = T(
+            "Audio Signal Basics",
+            font_size=48,
+            color=ACCENT_YELLOW,   # bleu Hi! PARIS
+            weight=BOLD,
+        ).to_edge(UP, buff=0.5)
+
+        self.play(Write(title), run_time=2.0)
+        self.wait(1.0)
+
+        # =====================================================================
+        # 1) WAVEFORM
+        # =====================================================================
+        waveform_title = T(
+            "Waveform: Amplitude vs Time",
+            font_size=32,
+            color=ACCENT_YELLOW,   # rouge Hi! PARIS pour les sous-titres
+            weight=BOLD,
+        ).next_to(title, DOWN, buff=0.6)
+
+        self.play(Write(waveform_title), run_time=1.2)
+
+        wf = waveform_mobject(sample, config.frame_width * 0.78, 2.6, ACCENT_CYAN)
+        wf.shift(DOWN * 0.3)
+
+        wf_desc = T(
+            "Loudness ≈ RMS amplitude (average energy)\n"
+            "Temporal variation of the audio signal.",
+            font_size=22,
+            color=TEXT_COLOR,
+            line_spacing=1.0,
+        ).next_to(wf, DOWN, buff=0.4)
+
+        # même source pour les trois figures : la citation reste jusqu'à la fin
+        citation = footer("Databootcamp TTS Course", font_size=16)
+
+        self.play(FadeIn(wf, shift=UP * 0.2), run_time=1.0)
+        self.play(FadeIn(wf_desc), FadeIn(citation), run_time=0.8)
+        self.wait(5.0, cue="spectrogram")
+
+        self.play(
+            FadeOut(waveform_title),
+            FadeOut(wf),
+            FadeOut(wf_desc),
+            run_time=0.8,
+        )
+        self.wait(0.3)
+
+        # =====================================================================
+        # 2) SPECTROGRAM
+        # =====================================================================
+        spect_title = T(
+            "Spectrogram: Frequency Energy over Time",
+            font_size=32,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        ).next_to(title, DOWN, buff=0.6)
+
+        self.play(Write(spect_title), run_time=1.2)
+
+        sp = spectrogram_mobject(sample, config.frame_width * 0.78, 3.0,
+                                 (BG_COLOR, ACCENT_CYAN, ACCENT_YELLOW, TEXT_COLOR))
+        sp.shift(DOWN * 0.2)
+
+        sp_desc = T(
+            "Short-Time Fourier Transform (STFT):\n"
+            "• Window: 20–30 ms, Hop: ≈10 ms, Hann window\n"
+            "• FFT: decomposes the signal into frequency bands\n"
+            "→ Time–frequency representation of speech.",
+            font_size=20,
+            color=TEXT_COLOR,
+            line_spacing=1.1,
+        ).next_to(sp, DOWN, buff=0.35)
+
+        # balayage en temps réel (plafonné), tête de lecture sur le bord dévoilé
+        playhead = Line(sp.get_corner(UL), sp.get_corner(DL)).set_stroke(TEXT_COLOR, width=3)
+        self.play(SpectrogramReveal(sp, playhead), run_time=min(wav_seconds(sample), 6.0))
+        self.play(FadeOut(playhead), run_time=0.3)
+        self.play(FadeIn(sp_desc), run_time=0.8)
+        self.wait(7.0, cue="pitch")
+
+        self.play(
+            FadeOut(spect_title),
+            FadeOut(sp),
+            FadeOut(sp_desc),
+            run_time=0.8,
+        )
+        self.wait(0.3)
+
+        # =====================================================================
+        # 3) PITCH / F0
+        # =====================================================================
+        pitch_title = T(
+            "Pitch & Fundamental Frequency (F0)",
+            font_size=32,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        ).next_to(title, DOWN, buff=0.6)
+
+        self.play(Write(pitch_title), run_time=1.2)
+
+        f0img = f0_mobject(sample, config.frame_width * 0.78, 2.8, ACCENT_YELLOW, HI_GREY)
+        f0img.shift(DOWN * 0.2)
+
+        pitch_desc = VGroup(
+            T(
+                "Perceived pitch ↔ F0 (fundamental frequency)",
+                font_size=26,
+                color=TEXT_COLOR,
+            ),
+            T(
+                "Typical extraction: pyworld, Praat, with outlier post-processing",
+                font_size=22,
+                color=HI_GREY,
+                slant=ITALIC,
+            ),
+        ).arrange(DOWN, buff=0.25).next_to(f0img, DOWN, buff=0.45)
+
+        self.play(FadeIn(f0img, shift=UP * 0.2), run_time=1.0)
+        self.play(FadeIn(pitch_desc), run_time=0.8)
+        self.wait(8.0, cue=END)
+
+        self.play(
+            FadeOut(title),
+            FadeOut(pitch_title),
+            FadeOut(f0img),
+            FadeOut(pitch_desc),
+            FadeOut(citation),
+            run_time=1.2,
+        )
+        self.wait(0.3)
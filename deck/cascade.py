@@ -0,0 +1,59 @@
+"""
+Scène 3B : la cascade SSML en deux étapes (image seule).
+"""
+
+from deck.common import *
+
+
+# ============================================================================
+# SCENE X: Two-stage SSML cascade (image seule, sans interaction)
+# ============================================================================
+class SceneCascadeInteractive(DeckScene):
+    TARGET_SECONDS = 40.0
+    NARRATION = (
+        "<speak>"
+        'The enrichment itself is a two-stage cascade. '
+        '<break time="400ms"/> '
+        '<mark name="cascade"/> '
+        'The first model decides where the pauses go. <break time="300ms"/> '
+        'The second one fills in the prosodic values: <break time="150ms"/> pitch, volume and rate. '
+        '<break time="500ms"/> '
+        '<prosody rate="95%">Splitting the task keeps each model small, <break time="150ms"/> and each output easy to check.</prosody> '
+        "</speak>"
+    )
+
+    def construct(self):
+        # ------------------------------------------------------------------
+        # 1) Titre harmonisé
+        # ------------------------------------------------------------------
+        title = title_bar("Two-stage SSML cascade", buff=0.65)
+
+        self.play(FadeIn(title, shift=DOWN * 0.4), run_time=1.6)
+        self.wait(0.8, cue="cascade")
+
+        # ------------------------------------------------------------------
+        # 2) Image de la cascade (sans encadrement, juste affichée)
+        # ------------------------------------------------------------------
+        cascade_img = load_img("cascade")
+
+        # On contrôle largeur / hauteur pour que ça tienne bien sous le titre
+        max_w = config.frame_width * 0.9
+        max_h = config.frame_height * 0.65   # laisse de l’air en bas
+        cascade_img.scale_to_fit_width(max_w)
+        if cascade_img.height > max_h:
+            cascade_img.scale_to_fit_height(max_h)
+
+        cascade_img.next_to(title, DOWN, buff=0.4)
+
+        self.play(FadeIn(cascade_img, shift=UP * 0.2), run_time=2.0)
+        self.wait(8.0, cue=END)
+
+        # ------------------------------------------------------------------
+        # 3) Sortie propre
+        # ------------------------------------------------------------------
+        self.play(
+            FadeOut(cascade_img),
+            FadeOut(title),
+            run_time=1.6,
+        )
+        self.wait(0.4)
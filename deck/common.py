@@ -0,0 +1,106 @@
+"""
+Thème, configuration et utilitaires partagés par toutes les scènes du deck.
+
+Chaque module de scène commence par ``from deck.common import *`` : il
+reçoit Manim, la palette de deck/theme.py (éventuellement remplacée par une
+variante, voir manimtts/variants.py) et les utilitaires T, under_title,
+title_bar, footer, step_box, load_img, ainsi que la carte de transition.
+Les caches d'outils (images, textes, composants) ne sont importés qu'au
+premier appel de l'utilitaire qui s'en sert.
+"""
+
+from manim import *
+import numpy as np
+from pathlib import Path
+
+from deck.theme import *
+from manimtts.narration import END
+from manimtts.timeline import DeckScene
+
+# ============================================================================
+# UTILITIES
+# ============================================================================
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+
+def load_img(stem: str, exts=(".png", ".jpg", ".jpeg", ".gif", ".ico")) -> ImageMobject:
+    """Charge une image depuis assets/ avec fallback (décodée une fois, voir manimtts/assets.py)."""
+    from manimtts.assets import image_mobject, resolve
+    return image_mobject(resolve(stem, ASSETS_DIR, exts))
+
+
+def T(s, **kw):
+    """Wrapper Text : force la même police partout (mémoïsé, voir TEXT_CACHE)."""
+    from manimtts.textcache import TEXT_CACHE
+    kw.setdefault("font", FONT_SANS)
+    return TEXT_CACHE.get(s, **kw)
+
+
+def under_title(txt: str, color=ACCENT_BLUE, font_size=46, font: str = FONT_SANS):
+    """Titre avec soulignement courbe (sans rectangle)."""
+    t = T(txt, font=font, weight=BOLD, font_size=font_size, color=color)
+    underline = Line(
+        t.get_bottom() + DOWN*0.06 + LEFT*0.1,
+        t.get_bottom() + DOWN*0.06 + RIGHT*0.1,
+        stroke_width=3
+    ).set_color(color)
+    return VGroup(t, underline).arrange(DOWN, buff=0.08)
+
+
+def title_bar(txt: str, color=ACCENT_YELLOW, font_size=46, buff=0.55):
+    """Titre souligné en haut de l'écran (partagé, voir manimtts/components.py)."""
+    from manimtts.components import COMPONENTS
+    return COMPONENTS.get(
+        ("title", txt, color, font_size, buff, FONT_SANS, config.frame_height),
+        lambda: under_title(txt, color=color, font_size=font_size).to_edge(UP, buff=buff),
+    )
+
+
+def footer(txt: str, font_size=18):
+    """Citation en bas à droite (partagée, voir manimtts/components.py)."""
+    from manimtts.components import COMPONENTS
+    return COMPONENTS.get(
+        ("footer", txt, font_size, HI_GREY, FONT_SANS, config.frame_width, config.frame_height),
+        lambda: T(txt, font_size=font_size, color=HI_GREY, slant=ITALIC).to_corner(DR),
+    )
+
+
+def step_box(title: str, lines: list[str], color=ACCENT_BLUE, title_size=28, body_size=20):
+    """Boîte arrondie pour un step de pipeline ou architecture."""
+    head = T(title, font_size=title_size, color=color, weight=BOLD)
+    body = VGroup(*[
+        T(line, font_size=body_size, color=TEXT_COLOR)
+        for line in lines
+    ]).arrange(DOWN, aligned_edge=LEFT, buff=0.10)
+    content = VGroup(head, body).arrange(DOWN, aligned_edge=LEFT, buff=0.22)
+    rect = RoundedRectangle(corner_radius=0.20, stroke_color=color, stroke_width=3)
+    rect.surround(content, buff=0.25)
+    return VGroup(rect, content)
+
+
+# ============================================================================
+# TRANSITIONS
+# ============================================================================
+def play_transition(scene: Scene, next_scene_name: str):
+    """
+    Petit écran intermédiaire sobre entre deux scènes.
+    """
+    t = T(
+        next_scene_name,
+        font_size=40,
+        color=ACCENT_YELLOW,
+        weight=BOLD,
+    )
+    t.move_to(ORIGIN)
+    scene.play(FadeIn(t, scale=1.1), run_time=1.0)
+    scene.wait(0.8)
+    scene.play(FadeOut(t, scale=0.9), run_time=1.0)
+    scene.wait(0.4)
+
+
+class TransitionCard(DeckScene):
+    """Carte de transition seule (utilisée par le rendu parallèle)."""
+    title = ""
+
+    def construct(self):
+        play_transition(self, self.title)
@@ -0,0 +1,181 @@
+"""
+Scène 6 : évaluation objective.
+"""
+
+from deck.common import *
+from manimtts.data import deck_data
+
+
+# ============================================================================
+# SCENE 6: Objective Evaluation (F1 + MAE, clair et interactif)
+# ============================================================================
+class SceneEvalObj(DeckScene):
+    TARGET_SECONDS = 40.0
+    DATA = ("pdf_data.evaluation_objective",)
+    NARRATION = (
+        "<speak>"
+        'First, the objective evaluation. '
+        '<break time="400ms"/> '
+        '<mark name="breaks"/> '
+        'For breaks, Qwen A outperforms the BERT baseline in F one score. '
+        '<break time="300ms"/> '
+        '<mark name="prosody"/> '
+        'For prosody, Qwen B lowers the mean absolute error by twenty-five to forty percent '
+        '<break time="150ms"/> compared with a BiLSTM, on pitch, volume and rate. '
+        "</speak>"
+    )
+
+    def construct(self):
+        obj = deck_data().objective
+
+        # ------------------------------------------------------------------
+        # 1) Titre harmonisé
+        # ------------------------------------------------------------------
+        title = title_bar("Objective evaluation")
+
+        self.play(FadeIn(title, shift=DOWN * 0.3), run_time=1.4)
+        self.wait(0.6, cue="breaks")
+
+        # ------------------------------------------------------------------
+        # 2) Bloc gauche : Break prediction accuracy (F1)
+        # ------------------------------------------------------------------
+        f1_heading = T(
+            "Break prediction accuracy",
+            font_size=30,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        f1_qwen = T(
+            f"QwenA (ours): {obj.qwen_a.f1_score:.2f}% F₁",
+            font_size=26,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        f1_bert = T(
+            f"BERT baseline: {obj.bert.f1_score:.2f}% F₁",
+            font_size=24,
+            color=HI_GREY,
+        )
+
+        f1_block = VGroup(
+            f1_heading,
+            f1_qwen,
+            f1_bert,
+        ).arrange(
+            DOWN,
+            aligned_edge=LEFT,
+            buff=0.22,
+        )
+
+        # Position du panneau gauche
+        f1_block.next_to(title, DOWN, buff=0.8).to_edge(LEFT, buff=0.9)
+
+        # Cadre autour du bloc, créé APRÈS positionnement
+        f1_frame = SurroundingRectangle(
+            f1_block,
+            color=ACCENT_YELLOW,
+            buff=0.30,
+            stroke_width=3,
+        )
+
+        # Apparition interactive bloc F1
+        self.play(
+            FadeIn(f1_block, shift=UP * 0.1),
+            Create(f1_frame),
+            run_time=1.4,
+        )
+        self.wait(0.4)
+
+        self.play(Indicate(f1_qwen, scale_factor=1.03), run_time=0.5)
+        self.wait(0.3)
+        self.play(Indicate(f1_bert, scale_factor=1.03), run_time=0.5)
+        self.wait(0.5, cue="prosody")
+
+        # ------------------------------------------------------------------
+        # 3) Bloc droit : MAE prosodique (Pitch, Volume, Rate)
+        # ------------------------------------------------------------------
+        mae_heading = T(
+            "Prosody MAE (Stage 2 – QwenB)",
+            font_size=30,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        mae_pitch = T(
+            f"Pitch: {obj.qwen_b.pitch_mae_percent:.2f}% vs {obj.bilstm.pitch_mae_percent:.2f}% (BiLSTM)",
+            font_size=24,
+            color=TEXT_COLOR,
+        )
+        mae_vol = T(
+            f"Volume: {obj.qwen_b.volume_mae_percent:.2f}% vs {obj.bilstm.volume_mae_percent:.2f}% (BiLSTM)",
+            font_size=24,
+            color=TEXT_COLOR,
+        )
+        mae_rate = T(
+            f"Rate: {obj.qwen_b.rate_mae_percent:.2f}% vs {obj.bilstm.rate_mae_percent:.2f}% (BiLSTM)",
+            font_size=24,
+            color=TEXT_COLOR,
+        )
+        mae_key = T(
+            "≈25–40% MAE reduction vs baselines",
+            font_size=24,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        mae_block = VGroup(
+            mae_heading,
+            mae_pitch,
+            mae_vol,
+            mae_rate,
+            mae_key,
+        ).arrange(
+            DOWN,
+            aligned_edge=LEFT,
+            buff=0.18,
+        )
+
+        # Position panneau droit (après avoir posé le bloc gauche)
+        mae_block.next_to(f1_block, RIGHT, buff=1.4).align_to(f1_block, UP)
+
+        mae_frame = SurroundingRectangle(
+            mae_block,
+            color=ACCENT_YELLOW,
+            buff=0.30,
+            stroke_width=3,
+        )
+
+        # Apparition bloc MAE
+        self.play(
+            FadeIn(mae_block, shift=UP * 0.1),
+            Create(mae_frame),
+            run_time=1.6,
+        )
+
+        with self.batched():
+            for m in [mae_pitch, mae_vol, mae_rate]:
+                self.play(Indicate(m, scale_factor=1.03), run_time=0.4)
+                self.wait(0.2)
+
+        self.play(Indicate(mae_key, scale_factor=1.04), run_time=0.5)
+        self.wait(0.8)
+
+        # ------------------------------------------------------------------
+        # 4) Citation + sortie propre
+        # ------------------------------------------------------------------
+        citation = footer("Ref: Ouali et al., ICNLSP 2025 – Table 4–5")
+
+        self.play(FadeIn(citation), run_time=0.7)
+        self.wait(1.0, cue=END)
+
+        self.play(
+            FadeOut(citation),
+            FadeOut(f1_frame),
+            FadeOut(mae_frame),
+            FadeOut(f1_block),
+            FadeOut(mae_block),
+            FadeOut(title),
+            run_time=1.6,
+        )
+        self.wait(0.4)
@@ -0,0 +1,165 @@
+"""
+Scène 7 : évaluation subjective (test AB).
+"""
+
+from deck.common import *
+from manimtts.data import deck_data
+
+
+# ============================================================================
+# SCENE 7: Subjective evaluation (AB test, clair et interactif, sans padding)
+# ============================================================================
+class SceneEvalSubj(DeckScene):
+    TARGET_SECONDS = 40.0
+    DATA = ("pdf_data.evaluation_subjective",)
+    NARRATION = (
+        "<speak>"
+        'Then, listeners were asked. '
+        '<break time="400ms"/> '
+        'In an A B test, the SSML-enhanced voice is compared with the baseline. '
+        '<break time="300ms"/> '
+        'Its mean opinion score is higher, <break time="150ms"/> the difference is significant, '
+        '<break time="200ms"/> and most listeners prefer it. '
+        "</speak>"
+    )
+
+    def construct(self):
+        subj = deck_data().subjective
+
+        # ------------------------------------------------------------------
+        # 1) Titre harmonisé
+        # ------------------------------------------------------------------
+        title = title_bar("Subjective evaluation (AB test)")
+
+        self.play(FadeIn(title, shift=DOWN * 0.3), run_time=1.4)
+        self.wait(0.6)
+
+        # ------------------------------------------------------------------
+        # 2) Panneau gauche : Study design
+        # ------------------------------------------------------------------
+        design_heading = T(
+            "Study design",
+            font_size=30,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        d_n = T(f"{subj.participants} participants", font_size=24, color=TEXT_COLOR)
+        d_pairs = T(f"{subj.audio_pairs} AB pairs (≈1 min)", font_size=24, color=TEXT_COLOR)
+        d_cond = T("Baseline vs SSML-enhanced", font_size=24, color=TEXT_COLOR)
+
+        design_block = VGroup(
+            design_heading,
+            d_n,
+            d_pairs,
+            d_cond,
+        ).arrange(
+            DOWN,
+            aligned_edge=LEFT,
+            buff=0.22,
+        )
+
+        design_block.next_to(title, DOWN, buff=0.8).to_edge(LEFT, buff=0.9)
+
+        design_frame = SurroundingRectangle(
+            design_block,
+            color=ACCENT_YELLOW,
+            buff=0.30,
+            stroke_width=3,
+        )
+
+        self.play(
+            FadeIn(design_block, shift=UP * 0.1),
+            Create(design_frame),
+            run_time=1.5,
+        )
+        self.wait(0.4)
+
+        with self.batched():
+            for line in [d_n, d_pairs, d_cond]:
+                self.play(Indicate(line, scale_factor=1.03), run_time=0.4)
+                self.wait(0.2)
+
+        # ------------------------------------------------------------------
+        # 3) Panneau droit : MOS + préférence
+        # ------------------------------------------------------------------
+        mos_heading = T(
+            "Listening results",
+            font_size=30,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        mos_base = T(f"Baseline: {subj.mos_baseline:.2f} MOS", font_size=24, color=HI_GREY)
+        mos_enh = T(
+            f"Enhanced: {subj.mos_enhanced:.2f} ({subj.mos_delta:+.2f}, {subj.mos_improvement_percent:+g}%)",
+            font_size=24,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        mos_p = T(
+            f"p {subj.p_value} (significant)",
+            font_size=22,
+            color=ACCENT_YELLOW,
+            slant=ITALIC,
+        )
+        n_pref, n_total = subj.preference
+        mos_pref = T(
+            f"{n_pref} / {n_total} listeners prefer enhanced",
+            font_size=24,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        mos_block = VGroup(
+            mos_heading,
+            mos_base,
+            mos_enh,
+            mos_p,
+            mos_pref,
+        ).arrange(
+            DOWN,
+            aligned_edge=LEFT,
+            buff=0.18,
+        )
+
+        mos_block.next_to(design_block, RIGHT, buff=1.4).align_to(design_block, UP)
+
+        mos_frame = SurroundingRectangle(
+            mos_block,
+            color=ACCENT_YELLOW,
+            buff=0.30,
+            stroke_width=3,
+        )
+
+        self.play(
+            FadeIn(mos_block, shift=UP * 0.1),
+            Create(mos_frame),
+            run_time=1.6,
+        )
+
+        self.play(Indicate(mos_enh, scale_factor=1.04), run_time=0.5)
+        self.wait(0.2)
+        self.play(Indicate(mos_p, scale_factor=1.03), run_time=0.5)
+        self.wait(0.2)
+        self.play(Indicate(mos_pref, scale_factor=1.04), run_time=0.5)
+        self.wait(0.8)
+
+        # ------------------------------------------------------------------
+        # 4) Citation + sortie propre
+        # ------------------------------------------------------------------
+        citation = footer("Ref: Ouali et al., ICNLSP 2025 – Section 5")
+
+        self.play(FadeIn(citation), run_time=0.7)
+        self.wait(1.0)
+
+        self.play(
+            FadeOut(citation),
+            FadeOut(design_frame),
+            FadeOut(mos_frame),
+            FadeOut(design_block),
+            FadeOut(mos_block),
+            FadeOut(title),
+            run_time=1.6,
+        )
+        self.wait(0.4)
@@ -0,0 +1,101 @@
+"""
+Scène 0 : introduction (titre, auteurs, référence de l'article).
+"""
+
+from deck.common import *
+from manimtts.data import deck_data
+
+
+# ============================================================================
+# SCENE 0: Introduction (~28–30 s, sans padding)
+# ============================================================================
+class SceneIntro(DeckScene):
+    TARGET_SECONDS = 40.0
+    DATA = ("pdf_data.title", "pdf_data.authors", "pdf_data.affiliations", "pdf_data.conference")
+    NARRATION = (
+        "<speak>"
+        'Improving French synthetic speech quality <break time="300ms"/> through SSML prosody control. '
+        '<break time="600ms"/> '
+        'This work was presented at I C N L S P, twenty twenty-five. '
+        '<mark name="outline"/> '
+        '<prosody rate="95%">In the next few minutes, we show how a language model can write the markup '
+        'that tells a speech synthesizer where to pause, <break time="200ms"/> and how to shape its voice.</prosody> '
+        "</speak>"
+    )
+
+    def construct(self):
+        paper = deck_data().paper
+
+        # --- Titre sans ombre ni fond noir ---
+        title = T(
+            "\n".join(filter(None, paper.title_lines)),   # titre d’un seul mot : une ligne
+            font_size=44,
+            color=ACCENT_YELLOW,   # ton rouge Hi! PARIS
+            weight=BOLD,
+        )
+        title.scale_to_fit_width(min(config.frame_width * 0.9, title.width))
+        title.to_edge(UP, buff=0.55)
+        # ⛔ On supprime ceci :
+        # title.set_stroke(BLACK, width=2.2, opacity=0.75)
+        # title.add_background_rectangle(color=BLACK, opacity=0.18, buff=0.12)
+        title.set_z_index(10)
+
+        # Titre un peu plus lent
+        self.play(Write(title), run_time=2.5)
+        self.wait(1.5)
+
+        # --- Auteurs (plus lent) ---
+        authors_lines = VGroup(*[
+            T(line, font_size=26, color=TEXT_COLOR)
+            for line in paper.author_lines if line   # un seul auteur : une ligne
+        ]).arrange(DOWN, aligned_edge=LEFT, buff=0.05)
+        authors_lines.next_to(title, DOWN, buff=0.55).set_z_index(9)
+
+        self.play(
+            LaggedStart(
+                *[FadeIn(line, shift=UP * 0.1) for line in authors_lines],
+                lag_ratio=0.45,
+            ),
+            run_time=4.0,  # apparition plus lente des deux lignes
+        )
+        self.wait(1.5)
+
+        # --- Affiliations (plus basses + plus lente) ---
+        affiliations = T(
+            paper.institutions,
+            font_size=22,
+            color=HI_GREY,
+            slant=ITALIC,
+        )
+        # on les "baisse" en augmentant le buff
+        affiliations.next_to(authors_lines, DOWN, buff=0.9).set_z_index(9)
+
+        self.play(FadeIn(affiliations, shift=UP * 0.1), run_time=3.0)
+        self.wait(1.5)
+
+        # --- Conférence (plus lente, laisse le temps de lire) ---
+        conference = T(
+            paper.conference,
+            font_size=28,
+            color=ACCENT_YELLOW,   # bleu Hi! PARIS
+            weight=BOLD,
+        ).next_to(affiliations, DOWN, buff=0.5).set_z_index(9)
+
+        self.play(FadeIn(conference, shift=UP * 0.1), run_time=3.0)
+        self.wait(3.0, cue="outline")
+
+        # --- Petit effet sur le titre ---
+        self.play(Flash(title, flash_radius=0.32), run_time=1.2)
+        self.wait(2.0, cue=END)
+
+        # --- Sortie sans padding artificiel ---
+        self.play(
+            LaggedStart(
+                FadeOut(conference),
+                FadeOut(affiliations),
+                *[FadeOut(l) for l in authors_lines],
+                lag_ratio=0.12,
+            ),
+            run_time=2.5,
+        )
+        self.play(FadeOut(title), run_time=2.0)
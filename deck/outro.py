@@ -0,0 +1,176 @@
+"""
+Scène 8 : conclusions et travaux futurs.
+"""
+
+from deck.common import *
+from manimtts.data import deck_data
+
+
+# ============================================================================
+# SCENE 8: Conclusions & Future Work (clair, interactif, sans padding)
+# ============================================================================
+class SceneOutro(DeckScene):
+    TARGET_SECONDS = 30.0
+    DATA = ("pdf_data.evaluation_objective.qwen_a_break_prediction",
+            "pdf_data.evaluation_subjective")
+    NARRATION = (
+        "<speak>"
+        'To conclude. '
+        '<break time="400ms"/> '
+        'This is the first SSML pipeline for French, <break time="200ms"/> with a twenty-five to forty percent reduction in prosody error. '
+        '<break time="500ms"/> '
+        '<prosody rate="95%">Next steps are a unified end-to-end model, richer multimodal embeddings, '
+        '<break time="200ms"/> and more languages.</prosody> '
+        '<break time="400ms"/> '
+        'Thank you for watching. '
+        "</speak>"
+    )
+
+    def construct(self):
+        data = deck_data()
+
+        # ------------------------------------------------------------------
+        # 1) Titre harmonisé
+        # ------------------------------------------------------------------
+        title = title_bar("Conclusions & future work")
+
+        self.play(FadeIn(title, shift=DOWN * 0.3), run_time=1.4)
+        self.wait(0.6)
+
+        # ------------------------------------------------------------------
+        # 2) Panneau gauche : Key achievements
+        # ------------------------------------------------------------------
+        ach_heading = T(
+            "Key achievements",
+            font_size=30,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        qwen_a, subj = data.objective.qwen_a, data.subjective
+        ach1 = T(f"✓ {qwen_a.f1_score_percent:.1f}% F₁ break placement", font_size=24, color=TEXT_COLOR)
+        ach2 = T("✓ 25–40% MAE reduction",     font_size=24, color=TEXT_COLOR)
+        ach3 = T(f"✓ MOS {subj.mos_baseline:.2f} → {subj.mos_enhanced:.2f} ({subj.mos_improvement_percent:+g}%)",
+                 font_size=24, color=TEXT_COLOR)
+        ach4 = T("✓ First French SSML pipeline", font_size=24, color=TEXT_COLOR)
+
+        ach_block = VGroup(
+            ach_heading,
+            ach1,
+            ach2,
+            ach3,
+            ach4,
+        ).arrange(
+            DOWN,
+            aligned_edge=LEFT,
+            buff=0.22,
+        )
+
+        ach_block.next_to(title, DOWN, buff=0.8).to_edge(LEFT, buff=0.9)
+
+        ach_frame = SurroundingRectangle(
+            ach_block,
+            color=ACCENT_YELLOW,
+            buff=0.30,
+            stroke_width=3,
+        )
+
+        self.play(
+            FadeIn(ach_block, shift=UP * 0.1),
+            Create(ach_frame),
+            run_time=1.6,
+        )
+        self.wait(0.4)
+
+        with self.batched():
+            for line in [ach1, ach2, ach3, ach4]:
+                self.play(Indicate(line, scale_factor=1.03), run_time=0.35)
+                self.wait(0.15)
+
+        # ------------------------------------------------------------------
+        # 3) Panneau droit : Future work
+        # ------------------------------------------------------------------
+        fw_heading = T(
+            "Future work",
+            font_size=30,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        fw1 = T("→ Unified end-to-end model",         font_size=24, color=TEXT_COLOR)
+        fw2 = T("→ Richer multimodal embeddings",     font_size=24, color=TEXT_COLOR)
+        fw3 = T("→ Extension to more languages",      font_size=24, color=TEXT_COLOR)
+
+        fw_block = VGroup(
+            fw_heading,
+            fw1,
+            fw2,
+            fw3,
+        ).arrange(
+            DOWN,
+            aligned_edge=LEFT,
+            buff=0.22,
+        )
+
+        fw_block.next_to(ach_block, RIGHT, buff=1.6).align_to(ach_block, UP)
+
+        fw_frame = SurroundingRectangle(
+            fw_block,
+            color=ACCENT_YELLOW,
+            buff=0.30,
+            stroke_width=3,
+        )
+
+        self.play(
+            FadeIn(fw_block, shift=UP * 0.1),
+            Create(fw_frame),
+            run_time=1.6,
+        )
+        self.wait(0.6)
+
+        with self.batched():
+            for line in [fw1, fw2, fw3]:
+                self.play(Indicate(line, scale_factor=1.03), run_time=0.35)
+                self.wait(0.15)
+
+        # ------------------------------------------------------------------
+        # 4) Lien GitHub en bas
+        # ------------------------------------------------------------------
+        github = T(
+            "github.com/hi-paris/Prosody-Control-French-TTS",
+            font_size=20,
+            color=ACCENT_YELLOW,
+            slant=ITALIC,
+        )
+        github.to_edge(DOWN, buff=1.2)
+
+        self.play(FadeIn(github, shift=UP * 0.1), run_time=1.0)
+        self.wait(0.8)
+
+        # ------------------------------------------------------------------
+        # 5) Citation + sortie vers “Merci / Thank you”
+        # ------------------------------------------------------------------
+        citation = footer("Ref: Ouali et al., ICNLSP 2025 – Conclusions")
+
+        self.play(FadeIn(citation), run_time=0.8)
+        self.wait(1.0)
+
+        thanks = T(
+            "Merci / Thank you",
+            font_size=48,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        self.play(
+            FadeOut(citation),
+            FadeOut(github),
+            FadeOut(ach_frame),
+            FadeOut(fw_frame),
+            FadeOut(ach_block),
+            FadeOut(fw_block),
+            FadeOut(title),
+            run_time=1.6,
+        )
+        self.play(FadeIn(thanks, shift=UP * 0.2), run_time=1.4)
+        self.wait(2.0, cue=END)
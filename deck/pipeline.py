@@ -0,0 +1,175 @@
+"""
+Scène 3A : le pipeline SSML proposé (figure, zones mises en avant).
+"""
+
+from deck.common import *
+
+
+# ============================================================================
+# SCENE 3: Proposed SSML pipeline (figure + zones mises en avant)
+# ============================================================================
+class ScenePipelineInteractive(DeckScene):
+    TARGET_SECONDS = 50.0
+    NARRATION = (
+        "<speak>"
+        'Here is the proposed pipeline. '
+        '<break time="400ms"/> '
+        'Raw French text is first enriched with SSML, <break time="200ms"/> then validated, '
+        '<break time="200ms"/> and finally sent to the speech synthesizer. '
+        '<break time="500ms"/> '
+        'Each step can be inspected on its own, <break time="150ms"/> which keeps the markup well formed from end to end. '
+        "</speak>"
+    )
+
+    def construct(self):
+        # ------------------------------------------------------------------
+        # 1) Titre harmonisé
+        # ------------------------------------------------------------------
+        title = title_bar("Proposed SSML pipeline", buff=0.75)
+
+        self.play(FadeIn(title, shift=DOWN * 0.4), run_time=1.6)
+        self.wait(0.9)
+
+        # ------------------------------------------------------------------
+        # 2) Image du pipeline
+        # ------------------------------------------------------------------
+        pipeline_img = load_img("pipeline")
+        pipeline_img.scale_to_fit_width(config.frame_width * 0.9)
+        pipeline_img.next_to(title, DOWN, buff=0.8)
+
+        self.play(FadeIn(pipeline_img, shift=UP * 0.2), run_time=2.0)
+        self.wait(2.0)  # vue globale
+
+        # ------------------------------------------------------------------
+        # 3) Définition des 3 zones avec rectangles *vides*
+        # ------------------------------------------------------------------
+        w = pipeline_img.width
+        h = pipeline_img.height
+
+        left_box = Rectangle(
+            width=w * 0.32,
+            height=h * 0.9,
+            stroke_color=ACCENT_YELLOW,
+            stroke_width=3,
+            fill_opacity=0.0,   # aucune couleur de fond
+        )
+        center_box = Rectangle(
+            width=w * 0.32,
+            height=h * 0.9,
+            stroke_color=ACCENT_YELLOW,
+            stroke_width=3,
+            fill_opacity=0.0,
+        )
+        right_box = Rectangle(
+            width=w * 0.32,
+            height=h * 0.9,
+            stroke_color=ACCENT_YELLOW,
+            stroke_width=3,
+            fill_opacity=0.0,
+        )
+
+        # Positionnement relatif à l'image
+        left_box.move_to(pipeline_img.get_left() + RIGHT * (w * 0.16))
+        center_box.move_to(pipeline_img.get_center())
+        right_box.move_to(pipeline_img.get_right() + LEFT * (w * 0.16))
+
+        # ------------------------------------------------------------------
+        # 4) Labels sous CHAQUE rectangle, avec de l'air
+        # ------------------------------------------------------------------
+        lbl_left = T(
+            "Input & preprocessing",
+            font_size=24,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        lbl_center = T(
+            "Prosody analysis\n& features",
+            font_size=24,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        lbl_right = T(
+            "SSML generation\n& improved TTS",
+            font_size=24,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        # On les place sous chaque box, avec un buff assez large
+        lbl_left.next_to(left_box, DOWN, buff=0.4)
+        lbl_center.next_to(center_box, DOWN, buff=0.4)
+        lbl_right.next_to(right_box, DOWN, buff=0.4)
+
+        # ------------------------------------------------------------------
+        # 5) CORRECTION : On ajoute seulement l'image au départ
+        # ------------------------------------------------------------------
+        self.add(pipeline_img)  # Seulement l'image au début
+
+        # ------------------------------------------------------------------
+        # 6) Mise en avant zone par zone (sans masquer l'image)
+        # ------------------------------------------------------------------
+
+        # ---- Zone gauche : audio + baseline ----
+        # Ajouter la box et le label en même temps qu'on les anime
+        self.play(
+            FadeIn(left_box),
+            FadeIn(lbl_left, shift=UP * 0.1),
+            run_time=1.0,
+        )
+        self.play(Indicate(left_box, scale_factor=1.02), run_time=0.8)
+        self.wait(1.6)
+
+        # Laisser le contour légèrement visible, moins fort
+        self.play(left_box.animate.set_stroke(opacity=0.6), run_time=0.6)
+
+        # ---- Zone centrale : syntagmes + features ----
+        self.play(
+            FadeIn(center_box),
+            FadeIn(lbl_center, shift=UP * 0.1),
+            run_time=1.0,
+        )
+        self.play(Indicate(center_box, scale_factor=1.02), run_time=0.7)
+        self.wait(1.6)
+        self.play(center_box.animate.set_stroke(opacity=0.6), run_time=0.6)
+
+        # ---- Zone droite : SSML + output ----
+        self.play(
+            FadeIn(right_box),
+            FadeIn(lbl_right, shift=UP * 0.1),
+            run_time=1.1,
+        )
+        self.play(Indicate(right_box, scale_factor=1.02), run_time=0.7)
+        self.wait(1.8)
+
+        # ------------------------------------------------------------------
+        # 7) Récap global : tous les contours légèrement visibles
+        # ------------------------------------------------------------------
+        self.play(
+            left_box.animate.set_stroke(opacity=0.6),
+            center_box.animate.set_stroke(opacity=0.6),
+            right_box.animate.set_stroke(opacity=0.6),
+            run_time=0.8,
+        )
+        self.wait(1.5)
+
+        # ------------------------------------------------------------------
+        # 8) Citation + sortie propre
+        # ------------------------------------------------------------------
+        citation = footer("Ref: Ouali et al., ICNLSP 2025 – Section 3, Figure 1")
+
+        self.play(FadeIn(citation), run_time=0.8)
+        self.wait(1.5)
+
+        self.play(
+            FadeOut(citation),
+            FadeOut(left_box),
+            FadeOut(center_box),
+            FadeOut(right_box),
+            FadeOut(lbl_left),
+            FadeOut(lbl_center),
+            FadeOut(lbl_right),
+            FadeOut(pipeline_img),
+            FadeOut(title),
+            run_time=1.6,
+        )
+        self.wait(0.4)
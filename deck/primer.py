@@ -0,0 +1,255 @@
+"""
+Scène 1bis : la prosodie en bref (exemple SSML, quatre paramètres).
+"""
+
+from deck.common import *
+
+
+# ============================================================================
+# SCENE 1bis: Prosody Primer (SSML example + 4 paramètres, 2 "pages")
+# ============================================================================
+class SceneProsodyPrimer(DeckScene):
+    TARGET_SECONDS = 55.0
+    NARRATION = (
+        "<speak>"
+        'Prosody is the music of speech, <break time="300ms"/> and SSML is the markup that controls it. '
+        '<break time="500ms"/> '
+        '<prosody pitch="+10%">Pitch</prosody> carries intonation, questions and emphasis. '
+        '<break time="300ms"/> '
+        '<prosody volume="+6dB">Volume</prosody> marks prominence and emotional strength. '
+        '<break time="300ms"/> '
+        '<prosody rate="80%">Rate</prosody> trades urgency against clarity. '
+        '<break time="300ms"/> '
+        'And breaks, <break time="500ms"/> give the listener time to follow. '
+        "</speak>"
+    )
+
+    def construct(self):
+        # ------------------------------------------------------------------
+        # SLIDE 1 : Prosody & SSML + exemple de code
+        # ------------------------------------------------------------------
+        title_text = T(
+            "Prosody & SSML",
+            font_size=44,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        underline = Line(
+            title_text.get_bottom() + DOWN * 0.06 + LEFT * 0.1,
+            title_text.get_bottom() + DOWN * 0.06 + RIGHT * 0.1,
+            stroke_width=3,
+        ).set_color(ACCENT_BLUE)
+
+        title = VGroup(title_text, underline).arrange(DOWN, buff=0.08)
+        title.to_edge(UP, buff=0.6)
+
+        subtitle = T(
+            "SSML example and prosodic controls",
+            font_size=22,
+            color=HI_GREY,
+        ).next_to(title, DOWN, buff=0.25)
+
+        self.play(
+            FadeIn(title, shift=DOWN * 0.2),
+            FadeIn(subtitle, shift=DOWN * 0.2),
+            run_time=2.0,
+        )
+        self.wait(1.0)
+
+        # -- Label à gauche
+        ssml_label = T(
+            "SSML example",
+            font_size=28,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        ).next_to(subtitle, DOWN, buff=0.5)
+
+        # -- Code SSML (monospace)
+        line1 = T(
+            "<speak>",
+            font="DejaVu Sans Mono",
+            font_size=24,
+            color=HI_GREY,
+        )
+        line2 = T(
+            '  Bonjour, <break time="250ms"/> je m\'appelle Alice.',
+            font="DejaVu Sans Mono",
+            font_size=24,
+            color=HI_GREY,
+        )
+        line3 = T(
+            '  <prosody rate="slow" pitch="+5%">Je vous souhaite la bienvenue !</prosody>',
+            font="DejaVu Sans Mono",
+            font_size=24,
+            color=HI_GREY,
+        )
+        line4 = T(
+            "</speak>",
+            font="DejaVu Sans Mono",
+            font_size=24,
+            color=HI_GREY,
+        )
+
+        code_group = VGroup(line1, line2, line3, line4).arrange(
+            DOWN, aligned_edge=LEFT, buff=0.12
+        )
+        code_group.to_edge(LEFT, buff=0.8).shift(DOWN * 0.3)
+
+        self.play(FadeIn(ssml_label, shift=DOWN * 0.1), run_time=0.9)
+        self.play(
+            LaggedStart(
+                *[FadeIn(l, shift=RIGHT * 0.1) for l in code_group],
+                lag_ratio=0.22,
+            ),
+            run_time=3.0,
+        )
+        self.wait(1.5)  # temps pour lire le code complet
+
+        # -- Focus 1 : <break time="250ms"/>
+        br_rect = SurroundingRectangle(
+            line2,
+            color=ACCENT_YELLOW,
+            buff=0.18,
+            stroke_width=3,
+        )
+        br_caption = T(
+            '<break time="250ms"/> → explicit pause between syntagms.',
+            font_size=22,
+            color=TEXT_COLOR,
+        ).next_to(code_group, DOWN, buff=0.55).align_to(code_group, LEFT)
+
+        self.play(Create(br_rect), run_time=0.8)
+        self.play(FadeIn(br_caption, shift=UP * 0.1), run_time=0.9)
+        self.wait(2.0)
+        self.play(FadeOut(br_rect), run_time=0.5)
+
+        # -- Focus 2 : <prosody rate="slow" pitch="+5%">
+        pr_rect = SurroundingRectangle(
+            line3,
+            color=ACCENT_CYAN,
+            buff=0.18,
+            stroke_width=3,
+        )
+        pr_caption = T(
+            '<prosody rate="slow" pitch="+5%"> → local control of tempo & pitch.',
+            font_size=22,
+            color=TEXT_COLOR,
+        ).next_to(br_caption, DOWN, buff=0.30).align_to(code_group, LEFT)
+
+        self.play(Create(pr_rect), run_time=0.8)
+        self.play(FadeIn(pr_caption, shift=UP * 0.1), run_time=0.9)
+        self.wait(2.5)
+
+        # -- Légende colorée en bas
+        def legend_item(label: str, color):
+            dot = Dot(radius=0.06, color=color)
+            txt = T(label, font_size=18, color=HI_GREY)
+            return VGroup(dot, txt).arrange(RIGHT, buff=0.15)
+
+        legend = VGroup(
+            legend_item("Pitch (F0)", ACCENT_YELLOW),
+            legend_item("Volume", ACCENT_YELLOW),
+            legend_item("Rate", ACCENT_YELLOW),
+            legend_item("Breaks", ACCENT_YELLOW),
+        ).arrange(RIGHT, buff=0.7)
+        legend.to_edge(DOWN, buff=0.6)
+
+        self.play(FadeIn(legend, shift=UP * 0.1), run_time=0.9)
+        self.wait(1.8)
+
+        # ------------------------------------------------------------------
+        # CLEAR PAGE : on efface tout le premier slide
+        # ------------------------------------------------------------------
+        self.play(
+            FadeOut(legend),
+            FadeOut(br_caption),
+            FadeOut(pr_caption),
+            FadeOut(pr_rect),
+            FadeOut(ssml_label),
+            FadeOut(code_group),
+            FadeOut(subtitle),
+            FadeOut(title),
+            run_time=1.4,
+        )
+        self.wait(0.2)
+
+        # ------------------------------------------------------------------
+        # SLIDE 2 : "How SSML controls prosody" + définitions des 4 paramètres
+        # ------------------------------------------------------------------
+        big_title_text = T(
+            "How SSML controls prosody ?",
+            font_size=44,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        big_underline = Line(
+            big_title_text.get_bottom() + DOWN * 0.06 + LEFT * 0.1,
+            big_title_text.get_bottom() + DOWN * 0.06 + RIGHT * 0.1,
+            stroke_width=3,
+        ).set_color(ACCENT_BLUE)
+
+        big_title = VGroup(big_title_text, big_underline).arrange(DOWN, buff=0.08)
+        big_title.to_edge(UP, buff=0.7)
+
+        self.play(FadeIn(big_title, shift=DOWN * 0.2), run_time=1.6)
+        self.wait(0.8)
+
+        params_data = [
+            ("Pitch (F0)", ACCENT_YELLOW,
+             "Perceived height of the voice.",
+             "Intonation, questions, emphasis."),
+            ("Volume (Loudness)", ACCENT_YELLOW,
+             "Perceived intensity of speech.",
+             "Prominence, emotional strength."),
+            ("Rate (Tempo)", ACCENT_YELLOW,
+             "Speed of articulation.",
+             "Urgency vs clarity, rhythm."),
+            ("Breaks (Pauses)", ACCENT_YELLOW,
+             "Short silences between phrases.",
+             "Structure, emphasis, comprehension."),
+        ]
+
+        cards = []
+        for label, color, l1, l2 in params_data:
+            head = T(label, font_size=26, color=color, weight=BOLD)
+            line_a = T(l1, font_size=22, color=TEXT_COLOR)
+            line_b = T(l2, font_size=20, color=HI_GREY)
+            card = VGroup(head, line_a, line_b).arrange(
+                DOWN, aligned_edge=LEFT, buff=0.16
+            )
+            cards.append(card)
+
+        # ORGANISATION EN 2 COLONNES
+        left_column = VGroup(cards[0], cards[1]).arrange(DOWN, buff=0.35, aligned_edge=LEFT)
+        right_column = VGroup(cards[2], cards[3]).arrange(DOWN, buff=0.35, aligned_edge=LEFT)
+
+        # Positionner les colonnes côte à côte
+        columns_group = VGroup(left_column, right_column).arrange(RIGHT, buff=1.5, aligned_edge=UP)
+        columns_group.next_to(big_title, DOWN, buff=0.8)
+
+        # Apparition interactive : première colonne puis deuxième colonne
+        self.play(
+            LaggedStartMap(FadeIn, left_column, shift=RIGHT * 0.2, lag_ratio=0.4),
+            run_time=1.5
+        )
+        self.wait(0.3)
+
+        self.play(
+            LaggedStartMap(FadeIn, right_column, shift=LEFT * 0.2, lag_ratio=0.4),
+            run_time=1.5
+        )
+
+        # Indicate chaque élément
+        with self.batched():
+            for card in cards:
+                self.play(Indicate(card[0], scale_factor=1.03), run_time=0.4)
+                self.wait(0.3)
+
+        self.wait(1.0)
+
+        # Sortie propre
+        self.play(
+            FadeOut(columns_group),
+            FadeOut(big_title),
+            run_time=2.3,
+        )
@@ -0,0 +1,202 @@
+"""
+Scène 2B : les difficultés de la génération SSML.
+"""
+
+from deck.common import *
+
+
+# ============================================================================
+# SCENE 2B: SSML Challenges (clair, interactif, sans padding)
+# ============================================================================
+class SceneProblemSSML(DeckScene):
+    TARGET_SECONDS = 50.0
+    NARRATION = (
+        "<speak>"
+        'SSML could fix this, <break time="200ms"/> but it is hard to use in practice. '
+        '<break time="500ms"/> '
+        'Manual tags do not scale. <break time="300ms"/> Language models often break the XML syntax. '
+        '<break time="300ms"/> And every engine handles SSML differently. '
+        '<break time="500ms"/> '
+        '<prosody rate="95%">Typical failures are unclosed tags, unsupported attributes, conflicting prosody, '
+        '<break time="200ms"/> and evaluations that rely on listening tests alone.</prosody> '
+        "</speak>"
+    )
+
+    def construct(self):
+        # ------------------------------------------------------------------
+        # TITRE
+        # ------------------------------------------------------------------
+        title_text = T(
+            "SSML challenges",
+            font_size=44,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        underline = Line(
+            title_text.get_bottom() + DOWN * 0.06 + LEFT * 0.1,
+            title_text.get_bottom() + DOWN * 0.06 + RIGHT * 0.1,
+            stroke_width=3,
+        ).set_color(ACCENT_BLUE)
+
+        title = VGroup(title_text, underline).arrange(DOWN, buff=0.08)
+        title.to_edge(UP, buff=0.55)
+
+        self.play(FadeIn(title, shift=DOWN * 0.2), run_time=1.4)
+        self.wait(0.6)
+
+        # ------------------------------------------------------------------
+        # SLIDE 1 : "Why SSML is hard"
+        # ------------------------------------------------------------------
+        heading = T(
+            "Why SSML is hard in practice ?",
+            font_size=32,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        heading.next_to(title, DOWN, buff=0.8).to_edge(LEFT, buff=1.2)
+
+        bullet_texts = [
+            "Manual tags do not scale",
+            "LLMs often break XML syntax",
+            "Engines handle SSML differently",
+        ]
+        bullets = VGroup(*[
+            T(f"• {txt}", font_size=26, color=TEXT_COLOR)
+            for txt in bullet_texts
+        ]).arrange(DOWN, aligned_edge=LEFT, buff=0.30)
+        bullets.next_to(heading, DOWN, buff=0.45)
+
+        self.play(FadeIn(heading, shift=UP * 0.1), run_time=1.2)
+
+        # Apparition interactive des bullets
+        with self.batched():
+            for b in bullets:
+                self.play(FadeIn(b, shift=RIGHT * 0.15), run_time=0.7)
+                self.play(Indicate(b, scale_factor=1.03), run_time=0.35)
+                self.wait(0.3)
+
+        self.wait(0.8)
+
+        # Petite synthèse visuelle : encadrer la liste
+        box = SurroundingRectangle(
+            bullets,
+            color=ACCENT_YELLOW,
+            buff=0.25,
+            stroke_width=3,
+        )
+        self.play(Create(box), run_time=0.8)
+        self.wait(0.7)
+
+        # Transition vers le slide 2 : on garde le titre, on efface le reste
+        self.play(
+            FadeOut(box),
+            FadeOut(heading),
+            FadeOut(bullets),
+            run_time=1.0,
+        )
+        self.wait(0.4)
+
+
+        # ------------------------------------------------------------------
+        # SLIDE 2 : "Typical failure patterns"
+        # ------------------------------------------------------------------
+        heading2 = T(
+            "Typical failure patterns",
+            font_size=32,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        heading2.next_to(title, DOWN, buff=0.8).to_edge(LEFT, buff=1.2)
+        self.play(FadeIn(heading2, shift=UP * 0.1), run_time=1.0)
+        self.wait(0.4)
+
+         # 4 cartes avec sauts de ligne pour que le texte tienne
+        def pattern_card(title_str: str, line1: str, line2: str = ""):
+            head = T(title_str, font_size=28, color=ACCENT_YELLOW, weight=BOLD)
+            line1_text = T(line1, font_size=24, color=TEXT_COLOR)
+            if line2:
+                line2_text = T(line2, font_size=22, color=TEXT_COLOR)
+                card = VGroup(head, line1_text, line2_text).arrange(
+                    DOWN, aligned_edge=LEFT, buff=0.16
+                )
+            else:
+                card = VGroup(head, line1_text).arrange(
+                    DOWN, aligned_edge=LEFT, buff=0.18
+                )
+            return card
+
+        card_syntax = pattern_card(
+            "Syntax",
+            "Unclosed tags, bad nesting,",
+            "escaping issues."
+        )
+        card_sem = pattern_card(
+            "Semantics", 
+            "Unsupported attributes or units,",
+            "clipped ranges."
+        )
+        card_ctrl = pattern_card(
+            "Control",
+            "Conflicting <prosody>,",
+            "unclear global vs local."
+        )
+        card_eval = pattern_card(
+            "Evaluation",
+            "MOS only, no automatic",
+            "SSML validation."
+        )
+        # ORGANISATION EN 2 COLONNES ÉQUILIBRÉES
+        left_col = VGroup(card_syntax, card_sem).arrange(
+            DOWN, buff=0.4, aligned_edge=LEFT
+        )
+        right_col = VGroup(card_ctrl, card_eval).arrange(
+            DOWN, buff=0.4, aligned_edge=LEFT
+        )
+        
+        # Centrer le groupe des colonnes
+        columns_group = VGroup(left_col, right_col).arrange(
+            RIGHT, buff=1.7, aligned_edge=UP
+        )
+        columns_group.next_to(heading2, DOWN, buff=1.2)
+        
+        # Centrer horizontalement
+        columns_group.move_to(ORIGIN).align_to(heading2, UP).shift(DOWN * 0.9)
+
+        # On pose la grille mais invisible au départ
+        for card in [card_syntax, card_sem, card_ctrl, card_eval]:
+            card.set_opacity(0.0)
+        self.add(columns_group)
+
+        # Apparition interactive des 4 cartes avec encadrement léger
+        cards_order = [card_syntax, card_sem, card_ctrl, card_eval]
+        with self.batched():
+            for card in cards_order:
+                self.play(card.animate.set_opacity(1.0), run_time=0.7)
+                rect = SurroundingRectangle(
+                    card,
+                    color=ACCENT_YELLOW,
+                    buff=0.15,
+                    stroke_width=2,
+                )
+                self.play(Create(rect), run_time=0.4)
+                self.play(Indicate(card[0], scale_factor=1.03), run_time=0.35)
+                self.wait(0.4)
+                self.play(FadeOut(rect), run_time=0.4)
+
+        self.wait(1.1)
+
+        # ------------------------------------------------------------------
+        # Citation + sortie propre
+        # ------------------------------------------------------------------
+        citation = footer("Ref: ICNLSP 2025 (pp. 1–2)")
+        self.play(FadeIn(citation), run_time=0.8)
+        self.wait(1.0)
+
+        self.play(
+            FadeOut(citation),
+            FadeOut(columns_group),
+            FadeOut(heading2),
+            FadeOut(title),
+            run_time=1.6,
+        )
+        self.wait(0.5)
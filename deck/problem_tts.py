@@ -0,0 +1,187 @@
+"""
+Scène 2A : le problème d'expressivité des TTS.
+"""
+
+from deck.common import *
+
+
+# ============================================================================
+# SCENE 2A: TTS Expressivity Problem (60s)
+# ============================================================================
+class SceneProblemTTS(DeckScene):
+    TARGET_SECONDS = 60.0
+    NARRATION = (
+        "<speak>"
+        'Modern text-to-speech is highly intelligible, <break time="200ms"/> but rarely expressive. '
+        '<break time="500ms"/> '
+        '<prosody rate="95%">French voices in particular sound flat: '
+        'pauses fall in the wrong places, <break time="150ms"/> and intonation barely moves.</prosody> '
+        '<break time="500ms"/> '
+        'The consequence is listening fatigue, <break time="200ms"/> and audiences that disengage. '
+        "</speak>"
+    )
+
+    def construct(self):
+        title = title_bar("The TTS Expressivity Problem")
+        self.play(FadeIn(title, shift=DOWN*0.2), run_time=1.2)
+        self.wait(0.4)
+
+        # Baromètre
+        lbl_intel = T("Intelligibility", font_size=22, color=HI_GREY)
+        lbl_expr  = T("Expressivity",  font_size=22, color=HI_GREY)
+        bar_w = 4.8
+
+        bar_i_bg = Line(ORIGIN, RIGHT*bar_w, stroke_width=8).set_color(HI_GREY).set_opacity(0.25)
+        bar_i_fg = Line(ORIGIN, RIGHT*(bar_w*0.86), stroke_width=10).set_color(ACCENT_YELLOW)
+        g_i = VGroup(lbl_intel, VGroup(bar_i_bg, bar_i_fg).arrange(DOWN, buff=0.12)).arrange(DOWN, buff=0.16)
+
+        bar_e_bg = Line(ORIGIN, RIGHT*bar_w, stroke_width=8).set_color(HI_GREY).set_opacity(0.25)
+        bar_e_fg = Line(ORIGIN, RIGHT*(bar_w*0.28), stroke_width=10).set_color(ACCENT_PURPLE)
+        g_e = VGroup(lbl_expr, VGroup(bar_e_bg, bar_e_fg).arrange(DOWN, buff=0.12)).arrange(DOWN, buff=0.16)
+
+        meter = VGroup(g_i, g_e).arrange(DOWN, buff=0.5).to_edge(LEFT, buff=0.8).shift(DOWN*0.2)
+        self.play(FadeIn(meter, shift=UP*0.1), run_time=1.2)
+
+        # SLIDE 1
+        heading = T("Current State", font_size=32, color=ACCENT_YELLOW, weight=BOLD)
+        bullet_items = [
+            "• Commercial TTS prioritizes clarity",
+            "• Prosodic variation is limited",
+            "• Leads to monotonous speech",
+            "• French prosody particularly affected",
+        ]
+        bullets = VGroup(*[
+            T(item, font_size=26, color=TEXT_COLOR)
+            for item in bullet_items
+        ]).arrange(DOWN, aligned_edge=LEFT, buff=0.26)
+        col_state = VGroup(heading, bullets).arrange(DOWN, aligned_edge=LEFT, buff=0.42)
+
+        heading2 = T("Consequences", font_size=32, color=ACCENT_CYAN, weight=BOLD)
+        cons_items = [
+            "↓ Engagement & naturalness",
+            "↓ Perceived speaker intent",
+            "↑ Listening fatigue",
+        ]
+        cons = VGroup(*[
+            T(s, font_size=24, color=TEXT_COLOR) for s in cons_items
+        ]).arrange(DOWN, aligned_edge=LEFT, buff=0.22)
+        col_cons = VGroup(heading2, cons).arrange(DOWN, aligned_edge=LEFT, buff=0.35)
+
+        col_state.next_to(meter, RIGHT, buff=1.2).align_to(meter, UP)
+        sep = Line(ORIGIN, DOWN*3.8, stroke_width=2).set_color(HI_GREY).set_opacity(0.20)
+        sep.next_to(col_state, RIGHT, buff=0.7).align_to(col_state, UP)
+        col_cons.next_to(sep, RIGHT, buff=0.7).align_to(col_state, UP)
+
+        slide1 = VGroup(col_state, sep, col_cons)
+
+        self.play(
+            FadeIn(col_state, shift=UP*0.12),
+            FadeIn(sep,       shift=UP*0.05),
+            FadeIn(col_cons,  shift=UP*0.12),
+            run_time=1.2
+        )
+        self.play(LaggedStart(*[FadeIn(b, shift=UP*0.08) for b in bullets], lag_ratio=0.22), run_time=2.5)
+        self.play(LaggedStart(*[FadeIn(c, shift=UP*0.08) for c in cons],    lag_ratio=0.22), run_time=2.0)
+        self.wait(2.0)
+
+        # TRANSITION : on nettoie TOUT ce qui appartient à la première "page"
+        self.play(
+            FadeOut(slide1),
+            FadeOut(meter),
+            run_time=1.0
+        )
+
+        # On enlève aussi le titre de la première page avant d'afficher le nouveau
+        self.play(FadeOut(title), run_time=0.8)
+
+        # ------------------------------------------------------------------
+        # SLIDE 2 : "Prosody control" (gros titre) + définitions
+        # ------------------------------------------------------------------
+        big_title_text = T(
+            "Prosody control",
+            font_size=44,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        big_underline = Line(
+            big_title_text.get_bottom() + DOWN * 0.06 + LEFT * 0.1,
+            big_title_text.get_bottom() + DOWN * 0.06 + RIGHT * 0.1,
+            stroke_width=3,
+        ).set_color(ACCENT_BLUE)
+
+        big_title = VGroup(big_title_text, big_underline).arrange(DOWN, buff=0.08)
+        big_title.to_edge(UP, buff=0.7)
+
+        self.play(FadeIn(big_title, shift=DOWN * 0.2), run_time=1.6)
+        self.wait(0.8)
+
+        # Petit sous-titre explicatif sous "Prosody control"
+        prosody_subtitle = T(
+            "Pitch, volume, rate and pauses",
+            font_size=22,
+            color=HI_GREY,
+        ).next_to(big_title, DOWN, buff=0.5)
+
+        self.play(FadeIn(prosody_subtitle, shift=DOWN * 0.1), run_time=1.0)
+        self.wait(0.6)
+
+        params_data = [
+            ("Pitch (F0)", ACCENT_YELLOW,
+             "Perceived height of the voice.",
+             "Intonation, questions, emphasis."),
+            ("Volume (Loudness)", ACCENT_YELLOW,
+             "Perceived intensity of speech.",
+             "Prominence, emotional strength."),
+            ("Rate (Tempo)", ACCENT_YELLOW,
+             "Speed of articulation.",
+             "Urgency vs clarity, rhythm."),
+            ("Breaks (Pauses)", ACCENT_YELLOW,
+             "Short silences between phrases.",
+             "Structure, emphasis, comprehension."),
+        ]
+
+        cards = []
+        for label, color, l1, l2 in params_data:
+            head = T(label, font_size=26, color=color, weight=BOLD)
+            line_a = T(l1, font_size=22, color=TEXT_COLOR)
+            line_b = T(l2, font_size=20, color=HI_GREY)
+            card = VGroup(head, line_a, line_b).arrange(
+                DOWN, aligned_edge=LEFT, buff=0.16
+            )
+            cards.append(card)
+
+        # ORGANISATION EN 2 COLONNES
+        left_column = VGroup(cards[0], cards[1]).arrange(DOWN, buff=0.35, aligned_edge=LEFT)
+        right_column = VGroup(cards[2], cards[3]).arrange(DOWN, buff=0.35, aligned_edge=LEFT)
+
+        columns_group = VGroup(left_column, right_column).arrange(
+            RIGHT, buff=1.5, aligned_edge=UP
+        )
+        columns_group.next_to(prosody_subtitle, DOWN, buff=0.8)
+
+        # Apparition interactive
+        self.play(
+            LaggedStartMap(FadeIn, left_column, shift=RIGHT * 0.2, lag_ratio=0.4),
+            run_time=1.5
+        )
+        self.wait(0.3)
+
+        self.play(
+            LaggedStartMap(FadeIn, right_column, shift=LEFT * 0.2, lag_ratio=0.4),
+            run_time=1.5
+        )
+
+        with self.batched():
+            for card in cards:
+                self.play(Indicate(card[0], scale_factor=1.03), run_time=0.4)
+                self.wait(0.3)
+
+        self.wait(1.0)
+
+        # Sortie propre
+        self.play(
+            FadeOut(columns_group),
+            FadeOut(prosody_subtitle),
+            FadeOut(big_title),
+            run_time=2.3,
+        )
@@ -0,0 +1,150 @@
+"""
+Scène 4 : étape 1, prédiction des pauses (QwenA).
+"""
+
+from deck.common import *
+from manimtts.data import deck_data
+
+
+# ============================================================================
+# SCENE 4: Stage 1 – Break Prediction (QwenA)
+# ============================================================================
+class SceneStage1(DeckScene):
+    TARGET_SECONDS = 50.0
+    DATA = ("pdf_data.evaluation_objective.qwen_a_break_prediction",
+            "pdf_data.evaluation_objective.bert_baseline")
+    NARRATION = (
+        "<speak>"
+        'Stage one is break prediction, with Qwen A. '
+        '<break time="400ms"/> '
+        '<mark name="model"/> '
+        'It is Qwen two point five, seven billion parameters, fine-tuned with four-bit Q LoRA. '
+        '<break time="300ms"/> '
+        'It reads a French paragraph of up to two hundred words, <break time="200ms"/> and places break tags in it. '
+        '<break time="500ms"/> '
+        '<mark name="results"/> '
+        'Against a BERT baseline, <break time="150ms"/> its F one score is clearly higher. '
+        "</speak>"
+    )
+
+    def construct(self):
+        obj = deck_data().objective
+
+        # ------------------------------------------------------------------
+        # 1) Titre harmonisé
+        # ------------------------------------------------------------------
+        title = title_bar("Stage 1: Break Prediction (QwenA)")
+
+        self.play(FadeIn(title, shift=DOWN * 0.3), run_time=1.6)
+        self.wait(0.6, cue="model")
+
+        # ------------------------------------------------------------------
+        # 2) Bloc gauche : modèle & tâche
+        # ------------------------------------------------------------------
+        heading_model = T(
+            "QwenA: text → breaks",
+            font_size=32,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        b1 = T("Qwen 2.5–7B, QLoRA 4-bit", font_size=26, color=TEXT_COLOR)
+        b2 = T("Input: ≤ 200-word French paragraph", font_size=24, color=TEXT_COLOR)
+        b3 = T("Output: <break> tag placement", font_size=24, color=TEXT_COLOR)
+
+        bullets_model = VGroup(b1, b2, b3).arrange(
+            DOWN, aligned_edge=LEFT, buff=0.22
+        )
+
+        left_panel = VGroup(heading_model, bullets_model).arrange(
+            DOWN, aligned_edge=LEFT, buff=0.40
+        )
+        left_panel.next_to(title, DOWN, buff=0.8).to_edge(LEFT, buff=0.9)
+
+        # Apparition progressive
+        self.play(FadeIn(heading_model, shift=UP * 0.1), run_time=1.0)
+        with self.batched():
+            for b in bullets_model:
+                self.play(FadeIn(b, shift=RIGHT * 0.15), run_time=0.6)
+                self.play(Indicate(b, scale_factor=1.02), run_time=0.3)
+                self.wait(0.2)
+
+        self.wait(0.6, cue="results")
+
+        # ------------------------------------------------------------------
+        # 3) Bloc droit : performance (positionné AVANT de créer le cadre)
+        # ------------------------------------------------------------------
+        heading_perf = T(
+            "Performance (dev set)",
+            font_size=30,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        f1_text = T(
+            f"F₁ score: {obj.qwen_a.f1_score:.2f}%",
+            font_size=30,
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+        ppl_text = T(
+            f"Perplexity: {obj.qwen_a.perplexity:g}",
+            font_size=26,
+            color=TEXT_COLOR,
+        )
+        baseline_text = T(
+            f"BERT baseline: {obj.bert.f1_score:.2f}% F₁",
+            font_size=22,
+            color=HI_GREY,
+        )
+
+        perf_box = VGroup(
+            heading_perf,
+            f1_text,
+            ppl_text,
+            baseline_text,
+        ).arrange(DOWN, aligned_edge=LEFT, buff=0.20)
+
+        # On place d'abord le bloc à sa position finale
+        perf_box.next_to(left_panel, RIGHT, buff=1.4).align_to(left_panel, UP)
+
+        # Maintenant seulement on crée le cadre autour
+        perf_frame = SurroundingRectangle(
+            perf_box,
+            color=ACCENT_YELLOW,
+            buff=0.30,
+            stroke_width=3,
+        )
+
+        # Apparition interactive du bloc de performance
+        self.play(
+            FadeIn(perf_box, shift=UP * 0.1),
+            Create(perf_frame),
+            run_time=1.4,
+        )
+        self.wait(0.4)
+
+        # Mise en avant des chiffres clés
+        self.play(Indicate(f1_text, scale_factor=1.05), run_time=0.6)
+        self.wait(0.3)
+        self.play(Indicate(ppl_text, scale_factor=1.03), run_time=0.5)
+        self.wait(0.3)
+        self.play(Indicate(baseline_text, scale_factor=1.03), run_time=0.5)
+        self.wait(0.8)
+
+        # ------------------------------------------------------------------
+        # 4) Citation + sortie propre
+        # ------------------------------------------------------------------
+        citation = footer("Ref: ICNLSP 2025 – Table 4 (Stage 1: QwenA)")
+
+        self.play(FadeIn(citation), run_time=0.7)
+        self.wait(1.0, cue=END)
+
+        self.play(
+            FadeOut(citation),
+            FadeOut(perf_frame),
+            FadeOut(perf_box),
+            FadeOut(left_panel),
+            FadeOut(title),
+            run_time=1.6,
+        )
+        self.wait(0.4)
@@ -0,0 +1,193 @@
+"""
+Scène 5 : étape 2, prédiction de la prosodie (QwenB).
+"""
+
+from deck.common import *
+
+
+# ============================================================================
+# SCENE 5: Stage 2 – Prosody Prediction (QwenB)
+# ============================================================================
+class SceneStage2(DeckScene):
+    TARGET_SECONDS = 50.0
+    NARRATION = (
+        "<speak>"
+        'Stage two is prosody prediction, with Qwen B. '
+        '<break time="400ms"/> '
+        '<mark name="model"/> '
+        'A second instance of the same model receives the SSML skeleton from Qwen A, '
+        '<break time="200ms"/> and predicts numeric prosodic attributes. '
+        '<break time="500ms"/> '
+        '<mark name="features"/> '
+        '<prosody rate="95%">Pitch is expressed in semitones, volume as a gain, rate as a tempo, '
+        '<break time="200ms"/> and breaks as silences of a few hundred milliseconds.</prosody> '
+        "</speak>"
+    )
+
+    def construct(self):
+        # ------------------------------------------------------------------
+        # 1) Titre harmonisé, même style que Stage 1
+        # ------------------------------------------------------------------
+        title = title_bar("Stage 2: Prosody Prediction (QwenB)", font_size=42)  # Légèrement réduit
+
+        self.play(FadeIn(title, shift=DOWN * 0.3), run_time=1.6)
+        self.wait(0.6, cue="model")
+
+        # ------------------------------------------------------------------
+        # 2) ORGANISATION EN 2 COLONNES AVEC POLICE RÉDUITE
+        # ------------------------------------------------------------------
+
+        # Colonne gauche : Modèle QwenB
+        heading_model = T(
+            "QwenB: SSML → prosody values",
+            font_size=28,  # Réduit
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        b1 = T(
+            "Qwen 2.5–7B (second instance)",
+            font_size=22,  # Réduit
+            color=TEXT_COLOR,
+        )
+        b2 = T(
+            "QLoRA adapter fine-tuning",
+            font_size=22,
+            color=TEXT_COLOR,
+        )
+        b3 = T(
+            "Input: SSML skeleton from QwenA",
+            font_size=22,
+            color=TEXT_COLOR,
+        )
+        b4 = T(
+            "Output: numeric prosodic attributes",
+            font_size=22,
+            color=TEXT_COLOR,
+        )
+
+        bullets_model = VGroup(b1, b2, b3, b4).arrange(
+            DOWN,
+            aligned_edge=LEFT,
+            buff=0.18,  # Espacement réduit
+        )
+
+        left_column = VGroup(heading_model, bullets_model).arrange(
+            DOWN,
+            aligned_edge=LEFT,
+            buff=0.30,  # Espacement réduit
+        )
+
+        # Colonne droite : Features prosodiques
+        heading_feat = T(
+            "Prosodic features",
+            font_size=28,  # Réduit
+            color=ACCENT_YELLOW,
+            weight=BOLD,
+        )
+
+        f_pitch = T(
+            "Pitch: f₀ → semitone → %",
+            font_size=22,  # Réduit et texte raccourci
+            color=TEXT_COLOR,
+        )
+        f_vol = T(
+            "Volume: LUFS → gain %",
+            font_size=22,
+            color=TEXT_COLOR,
+        )
+        f_rate = T(
+            "Rate: words/sec → tempo %",
+            font_size=22,
+            color=TEXT_COLOR,
+        )
+        f_break = T(
+            "Breaks: 250-500 ms silence",
+            font_size=22,  # Texte simplifié
+            color=TEXT_COLOR,
+        )
+
+        features_list = VGroup(f_pitch, f_vol, f_rate, f_break).arrange(
+            DOWN,
+            aligned_edge=LEFT,
+            buff=0.18,  # Espacement réduit
+        )
+
+        right_column = VGroup(heading_feat, features_list).arrange(
+            DOWN,
+            aligned_edge=LEFT,
+            buff=0.30,  # Espacement réduit
+        )
+
+        # Positionner les deux colonnes plus centrées
+        columns_group = VGroup(left_column, right_column).arrange(
+            RIGHT, 
+            buff=0.8,  # Espacement réduit entre colonnes
+            aligned_edge=UP
+        )
+        columns_group.next_to(title, DOWN, buff=0.6).shift(LEFT * 0.3)  # Décalé vers la gauche
+
+        # ------------------------------------------------------------------
+        # 3) ANIMATION DES DEUX COLONNES
+        # ------------------------------------------------------------------
+
+        # Apparition de la colonne gauche
+        self.play(FadeIn(heading_model, shift=UP * 0.1), run_time=0.9)
+        self.wait(0.2)
+        
+        with self.batched():
+            for b in bullets_model:
+                self.play(FadeIn(b, shift=RIGHT * 0.15), run_time=0.4)
+                self.play(Indicate(b, scale_factor=1.02), run_time=0.2)
+                self.wait(0.1)
+
+        self.wait(0.3, cue="features")
+
+        # Apparition de la colonne droite
+        self.play(FadeIn(heading_feat, shift=UP * 0.1), run_time=0.7)
+        self.wait(0.2)
+
+        # Animation groupée des features
+        features_animations = []
+        for feat in features_list:
+            features_animations.append(FadeIn(feat, shift=RIGHT * 0.15))
+        
+        self.play(LaggedStart(*features_animations, lag_ratio=0.2), run_time=1.0)
+        
+        # Indicate chaque feature
+        with self.batched():
+            for feat in features_list:
+                self.play(Indicate(feat, scale_factor=1.03), run_time=0.3)
+                self.wait(0.1)
+
+        self.wait(0.5)
+
+        # ------------------------------------------------------------------
+        # 4) Cadre autour de la colonne droite
+        # ------------------------------------------------------------------
+        features_frame = SurroundingRectangle(
+            right_column,
+            color=ACCENT_BLUE,
+            buff=0.20,  # Buff réduit
+            stroke_width=2,
+        )
+
+        self.play(Create(features_frame), run_time=0.6)
+        self.wait(0.6)
+
+        # ------------------------------------------------------------------
+        # 5) Citation + sortie propre
+        # ------------------------------------------------------------------
+        citation = footer("Ref: ICNLSP 2025 – Section 4", font_size=16)
+
+        self.play(FadeIn(citation), run_time=0.6)
+        self.wait(0.8, cue=END)
+
+        self.play(
+            FadeOut(citation),
+            FadeOut(features_frame),
+            FadeOut(columns_group),
+            FadeOut(title),
+            run_time=1.4,
+        )
+        self.wait(0.4)
@@ -0,0 +1,48 @@
+"""
+Thème et réglages Manim du deck, sans aucun outil manimtts.
+
+Importé par deck/common.py (et donc par chaque scène) ; les outils qui
+n'ont besoin que de la palette ou de ``apply_config`` l'importent seul.
+Une variante (python -m manimtts batch) remplace les constantes de thème
+par MANIMTTS_THEME, voir manimtts/variants.py.
+"""
+
+import json
+import os
+
+import numpy as np
+from manim import config
+
+# ============================================================================
+# CONFIGURATION & THEME
+# ============================================================================
+BG_COLOR      = "#004178"
+ACCENT_BLUE   = "#004178"
+ACCENT_YELLOW = "#FF0049"
+TEXT_COLOR    = "#F4F6FA"
+ACCENT_PURPLE = "#FF0049"
+ACCENT_CYAN   = "#14B8FF"
+HI_GREY       = "#EFEFEF"
+
+FONT_SANS = "DejaVu Sans"
+
+DECK_TARGET_SECONDS = 540.0   # 9 min ; budgets par scène : TARGET_SECONDS
+
+# Palette / police de la variante active (posée par manimtts.variants.activate)
+globals().update(json.loads(os.environ.get("MANIMTTS_THEME") or "{}"))
+
+
+def apply_config():
+    """Réglages Manim du deck et graine aléatoire.
+
+    Rappelée par ``manimtts.scenes.deck_tempconfig`` au début de chaque job :
+    un worker réutilisé ne réimporte pas ce module, et le tempconfig de son
+    premier job a effacé ces réglages en sortant.
+    """
+    config.text_backend = "pango"
+    config.disable_latex = False  # on garde LaTeX dispo pour les formules
+    config.background_color = BG_COLOR
+    np.random.seed(7)
+
+
+apply_config()
@@ -0,0 +1,29 @@
+"""
+VideoComplet : toutes les scènes de PLAYLIST, avec les transitions.
+"""
+
+from deck import PLAYLIST, load
+from deck.common import *
+
+
+# ============================================================================
+# VIDEO COMPLET (enchaîne toutes les scènes avec transitions)
+# ============================================================================
+class VideoComplet(DeckScene):
+    TARGET_SECONDS = DECK_TARGET_SECONDS
+
+    def setup(self):
+        super().setup()
+        for scene_name, _ in PLAYLIST:   # toute la narration se synthétise pendant le rendu
+            load(scene_name).prefetch_narration()
+
+    def construct(self):
+        for scene_name, next_scene_name in PLAYLIST:
+            # même renderer et même calendrier ; scène libérée une fois jouée
+            with self.embedded(load(scene_name)) as sub:
+                sub.construct()
+            if next_scene_name:
+                self._transition(next_scene_name)
+
+    def _transition(self, next_scene_name: str):
+        play_transition(self, next_scene_name)
@@ -0,0 +1,5 @@
+"""
+Outils de production de la vidéo ManimTTS (rendu parallèle, caches, ...).
+
+Les scènes sont dans le paquet ``deck`` (voir ``manimtts.scenes``).
+"""
@@ -0,0 +1,225 @@
+"""
+Ligne de commande : ``python -m manimtts <commande>`` (depuis la racine du dépôt).
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+from manimtts.scenes import ROOT
+
+
+def _cmd_render(args):
+    from manimtts.cache import RenderCache
+    from manimtts.orchestrator import QUALITIES, RenderOptions, render_video, stream_video
+
+    options = RenderOptions(quality=QUALITIES[args.quality], frame_rate=args.fps,
+                            encoder=args.encoder, narration=False if args.no_narration else None,
+                            split_seconds=args.split)
+    if args.stream:
+        print(stream_video(args.output, options, jobs=args.jobs,
+                           prewarm_texts=not args.no_prewarm))
+        return
+    cache = None if args.no_cache else RenderCache()
+    out = render_video(args.output, options, jobs=args.jobs, cache=cache,
+                       prewarm_texts=not args.no_prewarm)
+    print(out)
+
+
+def _cmd_batch(args):
+    from manimtts.cache import RenderCache
+    from manimtts.orchestrator import QUALITIES, RenderOptions, render_variants
+    from manimtts.variants import load_variants
+
+    options = RenderOptions(quality=QUALITIES[args.quality], frame_rate=args.fps,
+                            encoder=args.encoder, narration=False if args.no_narration else None,
+                            split_seconds=args.split)
+    cache = None if args.no_cache else RenderCache()
+    outputs = {v: args.output_dir / f"{v.name}.mp4" for v in load_variants(args.variants)}
+    done = render_variants(outputs, options, jobs=args.jobs, cache=cache,
+                           prewarm_texts=not args.no_prewarm)
+    for out in done.values():
+        print(out)
+
+
+def _cmd_scenes(args):
+    from manimtts.scenes import registry
+
+    deck = registry()
+    for name, module in deck.SCENES.items():
+        print(f"{name:<28} {module.replace('.', '/')}.py")
+
+
+def _cmd_timeline(args):
+    import json
+
+    from manimtts.scenes import load_common
+    from manimtts.timeline import format_report, measure_video
+
+    timings = measure_video()
+    target = load_common().DECK_TARGET_SECONDS
+    if args.json:
+        print(json.dumps({"target": target, "scenes": [t.as_dict() for t in timings]}, indent=2))
+    else:
+        print(format_report(timings, target, args.tolerance))
+    if args.strict and any(t.over_budget(args.tolerance) for t in timings):
+        raise SystemExit(1)
+
+
+def _cmd_lint(args):
+    import json
+
+    from manimtts.lint import lint_scene
+    from manimtts.orchestrator import plan_jobs, scene_class
+
+    jobs = [job for job in plan_jobs() if not args.scenes or job.scene in args.scenes]
+    report, issues = [], []
+    for job in jobs:
+        timing, found = lint_scene(scene_class(job))
+        report.append({"scene": timing.scene, "total": round(timing.total, 3),
+                       "issues": [i.as_dict() for i in found]})
+        issues += found
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        for entry in report:
+            print(f"{entry['scene']:<28} {entry['total']:7.1f}s  {len(entry['issues'])} défaut(s)")
+        for issue in issues:
+            print(f"  {issue.scene} #{issue.segment} @{issue.time:.1f}s  {issue.kind:<8} {issue.detail}")
+    if args.strict and issues:
+        raise SystemExit(1)
+
+
+def _cmd_keyframes(args):
+    from manimtts.keyframes import export_keyframes
+    from manimtts.orchestrator import QUALITIES
+
+    print(export_keyframes(args.output_dir, QUALITIES[args.quality], jobs=args.jobs))
+
+
+def _cmd_profile(args):
+    from manimtts.orchestrator import QUALITIES, RenderOptions
+    from manimtts.profiling import profile_video
+
+    options = RenderOptions(quality=QUALITIES[args.quality], frame_rate=args.fps)
+    print(profile_video(args.output_dir, options, jobs=args.jobs, scenes=args.scenes))
+
+
+def _cmd_bench(args):
+    from manimtts.bench import format_rows, run_bench
+
+    rows = run_bench(construct=not args.no_construct, render=not args.no_render,
+                     helpers=not args.no_helpers, scenes=args.scenes,
+                     history=args.history, threshold=args.threshold)
+    print(format_rows(rows))
+    if args.strict and any(row["regression"] for row in rows):
+        raise SystemExit(1)
+
+
+def _cmd_prewarm(args):
+    from manimtts.prewarm import prewarm
+
+    print(prewarm(jobs=args.jobs))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m manimtts")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("render", help="rendu parallèle de VideoComplet")
+    p.add_argument("-q", "--quality", choices="lmhpk", default="h")
+    p.add_argument("--fps", type=float, default=None)
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    p.add_argument("-o", "--output", type=Path,
+                   default=ROOT / "media" / "videos" / "VideoComplet.mp4")
+    p.add_argument("--no-cache", action="store_true",
+                   help="ignore le cache de scènes (media/scene_cache)")
+    p.add_argument("--no-prewarm", action="store_true",
+                   help="ne pré-génère pas les SVG de texte avant le rendu")
+    p.add_argument("--stream", action="store_true",
+                   help="un seul processus et un seul tube ffmpeg, sans films partiels")
+    p.add_argument("--encoder", choices=("draft", "review", "final", "stock"), default=None,
+                   help="profil x264 (défaut : selon -q ; final = film reproductible)")
+    p.add_argument("--no-narration", action="store_true",
+                   help="film muet (pas de synthèse SSML, voir MANIMTTS_TTS)")
+    p.add_argument("--split", type=float, default=None, metavar="SECONDS",
+                   help="découpe les scènes plus longues en parties rendues en parallèle")
+    p.set_defaults(func=_cmd_render)
+
+    p = sub.add_parser("batch", help="rendu de plusieurs variantes (données / palette)")
+    p.add_argument("variants", type=Path, help="fichier JSON des variantes")
+    p.add_argument("-q", "--quality", choices="lmhpk", default="h")
+    p.add_argument("--fps", type=float, default=None)
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    p.add_argument("-o", "--output-dir", type=Path,
+                   default=ROOT / "media" / "videos" / "variants")
+    p.add_argument("--encoder", choices=("draft", "review", "final", "stock"), default=None,
+                   help="profil x264 (défaut : selon -q ; final = film reproductible)")
+    p.add_argument("--no-narration", action="store_true",
+                   help="film muet (pas de synthèse SSML, voir MANIMTTS_TTS)")
+    p.add_argument("--split", type=float, default=None, metavar="SECONDS",
+                   help="découpe les scènes plus longues en parties rendues en parallèle")
+    p.add_argument("--no-cache", action="store_true",
+                   help="ignore le cache de scènes (media/scene_cache)")
+    p.add_argument("--no-prewarm", action="store_true",
+                   help="ne pré-génère pas les SVG de texte avant le rendu")
+    p.set_defaults(func=_cmd_batch)
+
+    p = sub.add_parser("scenes", help="scènes disponibles et leur module (sans importer Manim)")
+    p.set_defaults(func=_cmd_scenes)
+
+    p = sub.add_parser("timeline", help="durée de chaque scène sans rendu, comparée aux budgets")
+    p.add_argument("--tolerance", type=float, default=0.10,
+                   help="écart relatif toléré par scène (défaut 0.10)")
+    p.add_argument("--json", action="store_true", help="calendrier détaillé en JSON")
+    p.add_argument("--strict", action="store_true",
+                   help="code de sortie 1 si une scène sort de son budget")
+    p.set_defaults(func=_cmd_timeline)
+
+    p = sub.add_parser(
+        "lint",
+        help="mise en page sans rastérisation : débordements, chevauchements, DATA "
+             "(construit les mobjects de chaque scène : ~15 s pour la PLAYLIST)",
+    )
+    p.add_argument("scenes", nargs="*",
+                   help="scènes à vérifier, plus rapide qu'un passage complet "
+                        "(défaut : toute la PLAYLIST)")
+    p.add_argument("--json", action="store_true")
+    p.add_argument("--strict", action="store_true", help="code de sortie 1 au moindre défaut")
+    p.set_defaults(func=_cmd_lint)
+
+    p = sub.add_parser("keyframes", help="dernière image de chaque play() en PNG + planche contact")
+    p.add_argument("-q", "--quality", choices="lmhpk", default="m")
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    p.add_argument("-o", "--output-dir", type=Path, default=ROOT / "media" / "keyframes")
+    p.set_defaults(func=_cmd_keyframes)
+
+    p = sub.add_parser("profile", help="temps par play (rastérisation, encodage) et mémoire")
+    p.add_argument("scenes", nargs="*", help="scènes à profiler (défaut : toute la PLAYLIST)")
+    p.add_argument("-q", "--quality", choices="lmhpk", default="h")
+    p.add_argument("--fps", type=float, default=None)
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    p.add_argument("-o", "--output-dir", type=Path, default=ROOT / "media" / "profile")
+    p.set_defaults(func=_cmd_profile)
+
+    p = sub.add_parser("bench", help="benchmarks construct / rendu -ql / utilitaires, avec historique")
+    p.add_argument("scenes", nargs="*", help="scènes mesurées (défaut : toute la PLAYLIST)")
+    p.add_argument("--no-construct", action="store_true")
+    p.add_argument("--no-render", action="store_true")
+    p.add_argument("--no-helpers", action="store_true")
+    p.add_argument("--history", type=Path, default=ROOT / "media" / "bench" / "history.jsonl")
+    p.add_argument("--threshold", type=float, default=0.15,
+                   help="hausse relative signalée comme régression (défaut 0.15)")
+    p.add_argument("--strict", action="store_true", help="code de sortie 1 en cas de régression")
+    p.set_defaults(func=_cmd_bench)
+
+    p = sub.add_parser("prewarm", help="génère en parallèle les SVG de media/texts et media/Tex")
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    p.set_defaults(func=_cmd_prewarm)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Animations propres au deck.
+"""
+
+import inspect
+import math
+
+from manim import (
+    Animation, AnimationGroup, Group, ImageMobject, Mobject, Succession, Wait, config, linear,
+)
+from manim.animation.animation import prepare_animation
+from manim.utils.family import extract_mobject_family_members
+
+
+def _flatten(args):
+    for arg in args:
+        if isinstance(arg, (list, tuple)) or inspect.isgenerator(arg):
+            yield from arg
+        else:
+            yield arg
+
+
+def compile_play(*args, **kwargs):
+    """Une animation équivalente à ``scene.play(*args, **kwargs)``."""
+    for key in ("subcaption", "subcaption_duration", "subcaption_offset"):
+        kwargs.pop(key, None)
+    animations = [prepare_animation(arg) for arg in _flatten(args)]
+    for animation in animations:
+        for key, value in kwargs.items():
+            setattr(animation, key, value)
+    return animations[0] if len(animations) == 1 else AnimationGroup(*animations)
+
+
+class Batch(Succession):
+    """Suite de play()/wait() jouée en un seul segment (voir DeckScene.batched).
+
+    Chaque sous-animation entre en scène à son tour, comme avec des play()
+    successifs : ses mobjects sont ajoutés à la scène et redessinés à chaque
+    image à partir de ce moment-là seulement (un Succession ordinaire ajoute
+    d'emblée tous les mobjects non introduits).
+
+    La durée de chaque sous-animation est arrondie au nombre d'images que
+    Manim rendrait pour ce play() seul : le segment dure autant d'images que
+    les plays successifs, et chaque play commence sur la même image.
+    """
+
+    def __init__(self, *animations: Animation, **kwargs):
+        step = 1 / config.frame_rate
+        for animation in animations:   # même compte que np.arange(0, run_time, step) dans Scene
+            animation.run_time = math.ceil(animation.run_time / step) * step
+        super().__init__(*animations, **kwargs)
+
+    def is_introducer(self) -> bool:
+        return True   # la scène n'ajoute pas self.group : les sous-animations s'en chargent
+
+    def _setup_scene(self, scene):
+        self.scene = scene
+
+    def update_active_animation(self, index: int):
+        scene = getattr(self, "scene", None)
+        if scene is None:
+            return super().update_active_animation(index)
+        before = {id(m) for m in scene.mobjects}
+        if index < len(self.animations):
+            animation = self.animations[index]
+            if not animation.is_introducer() and not isinstance(animation, Wait):
+                scene.add_mobjects_from_animations([animation])
+        super().update_active_animation(index)
+        moving = {id(m) for m in extract_mobject_family_members(scene.moving_mobjects)}
+        added = [m for m in scene.mobjects if id(m) not in before and id(m) not in moving]
+        if added:
+            scene.moving_mobjects = scene.moving_mobjects + added
+
+    def leaves(self) -> list:
+        """Sous-animations élémentaires (groupes dépliés), pour le tri mobiles / fixes."""
+        out, stack = [], list(reversed(self.animations))
+        while stack:
+            animation = stack.pop()
+            if isinstance(animation, AnimationGroup):
+                stack.extend(reversed(animation.animations))
+            else:
+                out.append(animation)
+        return out
+
+
+class SpectrogramReveal(Animation):
+    """Dévoile une image colonne par colonne (spectrogramme), avec une tête de lecture.
+
+    Le tampon de pixels de l'ImageMobject est modifié en place : seul le canal
+    alpha des colonnes franchies depuis l'image précédente est réécrit. Le
+    coût par image ne dépend donc pas de la durée de l'audio, et aucune copie
+    du tampon n'est faite (pas de mobject de départ). ``playhead`` (une ligne
+    verticale, facultative) suit le bord de la zone dévoilée.
+    """
+
+    def __init__(self, image: ImageMobject, playhead: Mobject | None = None,
+                 rate_func=linear, **kwargs):
+        self.image = image
+        self.playhead = playhead
+        group = Group(image, playhead) if playhead is not None else image
+        super().__init__(group, rate_func=rate_func, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        return Mobject()   # l'état de départ est le tampon lui-même
+
+    def begin(self):
+        pixels = self.image.pixel_array
+        if not pixels.flags.writeable:
+            self.image.pixel_array = pixels = pixels.copy()
+        self.opacity = pixels[..., 3].copy()   # alpha d'origine, restauré colonne par colonne
+        pixels[..., 3] = 0
+        self.shown = 0
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        pixels = self.image.pixel_array
+        column = int(round(self.rate_func(alpha) * pixels.shape[1]))
+        if column > self.shown:
+            pixels[:, self.shown:column, 3] = self.opacity[:, self.shown:column]
+        elif column < self.shown:
+            pixels[:, column:self.shown, 3] = 0
+        self.shown = column
+        if self.playhead is not None:
+            left = self.image.get_left()[0]
+            self.playhead.set_x(left + self.image.width * column / pixels.shape[1])
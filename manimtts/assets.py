@@ -0,0 +1,77 @@
+"""
+Images de assets/ : index des fichiers, décodage unique et réduction.
+
+Le dossier est indexé une fois (nom de base → fichier, par ordre de
+préférence des extensions). Chaque image est décodée une seule fois par
+processus et, si elle dépasse la définition de rendu courante
+(``config.pixel_width`` × ``config.pixel_height``), réduite à cette taille :
+une exportation de diapositive en 4000 px n'est plus rééchantillonnée à
+chaque image. La taille à l'écran ne change pas : ``scale_to_resolution``
+compense la réduction.
+"""
+
+import functools
+from pathlib import Path
+
+import numpy as np
+from manim import ImageMobject, config
+from manim.constants import DEFAULT_QUALITY, QUALITIES
+from PIL import Image
+
+from manimtts.scenes import ROOT
+
+ASSETS_DIR = ROOT / "assets"
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".gif", ".ico")
+NATIVE_RESOLUTION = QUALITIES[DEFAULT_QUALITY]["pixel_height"]   # défaut d'ImageMobject
+
+
+@functools.lru_cache(maxsize=None)
+def asset_index(directory: Path = ASSETS_DIR) -> dict[str, tuple[Path, ...]]:
+    """{nom de base: fichiers}, dans l'ordre de IMAGE_EXTS puis les autres."""
+    rank = {ext: i for i, ext in enumerate(IMAGE_EXTS)}
+    index: dict[str, list[Path]] = {}
+    for path in sorted(Path(directory).iterdir()) if Path(directory).is_dir() else ():
+        if path.is_file():
+            index.setdefault(path.stem, []).append(path)
+    return {
+        stem: tuple(sorted(paths, key=lambda p: rank.get(p.suffix.lower(), len(rank))))
+        for stem, paths in index.items()
+    }
+
+
+def resolve(stem: str, directory: Path = ASSETS_DIR, exts=IMAGE_EXTS) -> Path:
+    """Fichier image de ``stem`` (ré-indexe une fois si le dossier a changé)."""
+    for _ in range(2):
+        for path in asset_index(directory).get(stem, ()):
+            if path.suffix.lower() in exts:
+                return path
+        asset_index.cache_clear()
+    raise FileNotFoundError(f"Image introuvable pour '{stem}' dans {directory} ({exts})")
+
+
+@functools.lru_cache(maxsize=64)
+def _decode(path: Path, mtime_ns: int, max_width: int, max_height: int) -> tuple[np.ndarray, int]:
+    with Image.open(path) as im:
+        im = im.convert("RGBA")
+        rows = im.height
+        if im.width > max_width or im.height > max_height:
+            ratio = min(max_width / im.width, max_height / im.height)
+            size = (max(1, round(im.width * ratio)), max(1, round(im.height * ratio)))
+            im = im.resize(size, Image.LANCZOS)
+        pixels = np.asarray(im)
+    pixels.setflags(write=False)   # partagé : chaque ImageMobject en fait sa copie
+    return pixels, rows
+
+
+def decoded(path: Path) -> tuple[np.ndarray, int]:
+    """(pixels RGBA réduits à la définition courante, hauteur d'origine en px)."""
+    path = Path(path)
+    return _decode(path, path.stat().st_mtime_ns, config.pixel_width, config.pixel_height)
+
+
+def image_mobject(path: Path, **kwargs) -> ImageMobject:
+    """ImageMobject à partir du cache, à la même taille qu'ImageMobject(path)."""
+    pixels, rows = decoded(path)
+    kwargs.setdefault("scale_to_resolution", NATIVE_RESOLUTION)
+    kwargs["scale_to_resolution"] *= pixels.shape[0] / rows
+    return ImageMobject(pixels, **kwargs)
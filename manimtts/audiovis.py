@@ -0,0 +1,237 @@
+"""
+Visuels audio procéduraux de SceneBasics : forme d'onde, spectrogramme, F0.
+
+Les trois figures sont calculées en NumPy vectorisé à partir d'un WAV
+(``assets/speech.wav`` s'il existe, sinon un signal voisé de démonstration) :
+- enveloppe min/max par tranche (``np.minimum.reduceat``) ;
+- STFT à fenêtre de Hann, 25 ms / pas de 10 ms comme sur la diapositive ;
+- F0 par autocorrélation (FFT) de chaque trame, NaN hors voisement.
+Les tableaux sont rangés en ``.npy`` dans media/audiovis, sous le hash du
+fichier et des paramètres. À l'écran, chaque figure reste un seul mobject
+(polygone décimé, texture unique, polyligne) quelle que soit la durée.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import wave
+from pathlib import Path
+
+import numpy as np
+from manim import DOWN, LEFT, ImageMobject, Line, ManimColor, Rectangle, VGroup, VMobject
+
+from manimtts.assets import ASSETS_DIR, resolve
+from manimtts.scenes import ROOT
+
+CACHE_DIR = ROOT / "media" / "audiovis"
+SAMPLE_STEM = "speech"       # assets/speech.wav
+DEMO_RATE = 16000
+WINDOW_S = 0.025
+HOP_S = 0.010
+F0_WINDOW_S = 0.040          # au moins deux périodes à F0_RANGE[0]
+F0_RANGE = (60.0, 400.0)
+MAX_POINTS = 800             # sommets d'un contour de forme d'onde
+MAX_COLUMNS = 1024           # colonnes de la texture du spectrogramme
+
+
+# ---------------------------------------------------------------------------
+# Fichiers
+# ---------------------------------------------------------------------------
+def read_wav(path: Path) -> tuple[np.ndarray, int]:
+    """(échantillons mono en float32 dans [-1, 1], fréquence)."""
+    with wave.open(str(path), "rb") as wav:
+        rate, width, channels = wav.getframerate(), wav.getsampwidth(), wav.getnchannels()
+        raw = wav.readframes(wav.getnframes())
+    if width == 1:
+        x = (np.frombuffer(raw, np.uint8).astype(np.float32) - 128) / 128
+    elif width in (2, 4):
+        x = np.frombuffer(raw, f"<i{width}").astype(np.float32) / float(2 ** (8 * width - 1))
+    else:
+        raise ValueError(f"{path} : échantillons de {8 * width} bits non pris en charge")
+    return x.reshape(-1, channels).mean(axis=1), rate
+
+
+def read_wav_rate(path: Path) -> int:
+    with wave.open(str(path), "rb") as wav:
+        return wav.getframerate()
+
+
+def wav_seconds(path: Path) -> float:
+    with wave.open(str(path), "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def write_wav(path: Path, x: np.ndarray, rate: int):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with wave.open(str(tmp), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes((np.clip(x, -1, 1) * 32767).astype("<i2").tobytes())
+    os.replace(tmp, path)
+
+
+def demo_signal(rate: int = DEMO_RATE, seconds: float = 3.0) -> np.ndarray:
+    """Voix synthétique : F0 en arche, harmoniques filtrées, syllabes et une pause."""
+    t = np.arange(round(rate * seconds)) / rate
+    f0 = 110 + 60 * np.sin(np.pi * t / seconds) + 12 * np.sin(2 * np.pi * 1.7 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / rate
+    k = np.arange(1, 21)[:, None]
+    freqs = k * f0
+    gain = (np.exp(-((freqs - 700) / 300) ** 2)
+            + 0.6 * np.exp(-((freqs - 1200) / 400) ** 2) + 0.15) / k
+    voiced = (gain * np.sin(k * phase)).sum(axis=0)
+    syllables = np.sin(np.pi * ((t * 4) % 1)) ** 2
+    syllables[(t > 1.3) & (t < 1.7)] = 0.0
+    noise = 0.01 * np.random.default_rng(0).standard_normal(t.size)
+    x = voiced * syllables + noise
+    return (0.8 * x / np.abs(x).max()).astype(np.float32)
+
+
+def speech_sample() -> Path:
+    """WAV analysé : assets/speech.wav, sinon le signal de démonstration."""
+    try:
+        return resolve(SAMPLE_STEM, ASSETS_DIR, (".wav",))
+    except FileNotFoundError:
+        path = CACHE_DIR / "demo_speech.wav"
+        if not path.exists():
+            write_wav(path, demo_signal(), DEMO_RATE)
+        return path
+
+
+@functools.lru_cache(maxsize=32)
+def _file_hash(path: Path, mtime_ns: int) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def cached(kind: str, path: Path, params: dict, compute) -> np.ndarray:
+    """``compute(x, rate)`` mis en cache sous le hash du fichier et de ``params``."""
+    path = Path(path)
+    blob = json.dumps({"kind": kind, "file": _file_hash(path, path.stat().st_mtime_ns),
+                       **params}, sort_keys=True)
+    target = CACHE_DIR / f"{kind}_{hashlib.sha256(blob.encode()).hexdigest()[:24]}.npy"
+    if target.exists():
+        return np.load(target)
+    array = compute(*read_wav(path))
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, target)
+    return array
+
+
+# ---------------------------------------------------------------------------
+# Analyse (NumPy pur)
+# ---------------------------------------------------------------------------
+def frames(x: np.ndarray, size: int, hop: int) -> np.ndarray:
+    """Trames (vue, sans copie) de ``size`` échantillons tous les ``hop``."""
+    if x.size < size:
+        x = np.pad(x, (0, size - x.size))
+    return np.lib.stride_tricks.sliding_window_view(x, size)[::hop]
+
+
+def envelope(x: np.ndarray, rate: int, bins: int = MAX_POINTS // 2) -> np.ndarray:
+    """(bins, 2) : minimum et maximum de chaque tranche du signal."""
+    starts = np.linspace(0, x.size, min(bins, x.size) + 1).astype(int)[:-1]
+    return np.stack([np.minimum.reduceat(x, starts), np.maximum.reduceat(x, starts)], axis=1)
+
+
+def stft_db(x: np.ndarray, rate: int, window_s: float = WINDOW_S,
+            hop_s: float = HOP_S) -> np.ndarray:
+    """(trames, fréquences) : module de la STFT (fenêtre de Hann) en dB."""
+    size, hop = round(window_s * rate), round(hop_s * rate)
+    hann = 0.5 - 0.5 * np.cos(2 * np.pi * np.arange(size) / size)
+    nfft = 1 << (size - 1).bit_length()
+    spectrum = np.abs(np.fft.rfft(frames(x, size, hop) * hann, nfft, axis=1))
+    return (20 * np.log10(spectrum + 1e-10)).astype(np.float32)
+
+
+def f0_contour(x: np.ndarray, rate: int, window_s: float = F0_WINDOW_S, hop_s: float = HOP_S,
+               f_range: tuple[float, float] = F0_RANGE, threshold: float = 0.45) -> np.ndarray:
+    """F0 (Hz) par trame ; NaN pour les trames silencieuses ou non voisées.
+
+    Autocorrélation normalisée de chaque trame (par FFT) ; la période est le
+    plus petit maximum local proche du plus haut (évite les erreurs d'octave).
+    """
+    size, hop = round(window_s * rate), round(hop_s * rate)
+    fr = frames(x, size, hop)
+    fr = fr - fr.mean(axis=1, keepdims=True)
+    power = np.abs(np.fft.rfft(fr, 2 * size, axis=1)) ** 2
+    ac = np.fft.irfft(power, axis=1)[:, :size]
+    energy = ac[:, 0]
+    ac = ac / np.maximum(energy, 1e-12)[:, None]
+    lo, hi = int(rate / f_range[1]), min(int(np.ceil(rate / f_range[0])), size - 1)
+    band = ac[:, lo:hi]
+    inner = band[:, 1:-1]
+    maxima = np.where((inner > band[:, :-2]) & (inner >= band[:, 2:]), inner, -np.inf)
+    peak = maxima.max(axis=1)
+    lag = lo + 1 + np.argmax(maxima >= 0.9 * peak[:, None], axis=1)
+    voiced = (peak > threshold) & (energy > 0.01 * energy.max())
+    return np.where(voiced, rate / lag, np.nan).astype(np.float32)
+
+
+# ---------------------------------------------------------------------------
+# Mobjects
+# ---------------------------------------------------------------------------
+def waveform_mobject(path: Path, width: float, height: float, color) -> VMobject:
+    """Enveloppe min/max en un seul polygone plein (MAX_POINTS sommets au plus)."""
+    env = cached("envelope", path, {"bins": MAX_POINTS // 2}, envelope)
+    env = env / max(np.abs(env).max(), 1e-6) * height / 2
+    xs = np.linspace(-width / 2, width / 2, len(env))
+    outline = np.concatenate([np.c_[xs, env[:, 1]], np.c_[xs[::-1], env[::-1, 0]]])
+    shape = VMobject().set_points_as_corners(np.c_[outline, np.zeros(len(outline))])
+    shape.close_path()
+    return shape.set_fill(color, opacity=0.85).set_stroke(color, width=1)
+
+
+def spectrogram_mobject(path: Path, width: float, height: float, colors,
+                        max_hz: float = 5000.0, dynamic_db: float = 70.0) -> ImageMobject:
+    """Spectrogramme en une seule texture (fréquences graves en bas).
+
+    Au-delà de MAX_COLUMNS trames, les trames voisines sont fusionnées (maximum) :
+    la taille de la texture ne dépend pas de la durée de l'audio.
+    """
+    db = cached("stft", path, {"window": WINDOW_S, "hop": HOP_S}, stft_db)
+    if len(db) > MAX_COLUMNS:
+        db = np.maximum.reduceat(db, np.linspace(0, len(db), MAX_COLUMNS + 1).astype(int)[:-1])
+    rate = read_wav_rate(path)
+    keep = int(db.shape[1] * min(max_hz / (rate / 2), 1.0))
+    level = np.clip((db[:, :keep] - (db.max() - dynamic_db)) / dynamic_db, 0.0, 1.0)
+    stops = np.array([ManimColor(c).to_rgb() for c in colors])
+    grid = np.linspace(0.0, 1.0, len(stops))
+    rgb = np.stack([np.interp(level, grid, stops[:, c]) for c in range(3)], axis=-1)
+    pixels = np.concatenate([rgb, np.ones_like(rgb[..., :1])], axis=-1)
+    pixels = (pixels.transpose(1, 0, 2)[::-1] * 255).astype(np.uint8)
+    image = ImageMobject(pixels)
+    return image.stretch_to_fit_width(width).stretch_to_fit_height(height)
+
+
+def f0_mobject(path: Path, width: float, height: float, color, grid_color,
+               f_range: tuple[float, float] = F0_RANGE, grid_hz=(100, 200, 300)) -> VGroup:
+    """Cadre, repères en Hz et contour de F0 (une polyligne, un sous-chemin par zone voisée)."""
+    f0 = cached("f0", path, {"window": F0_WINDOW_S, "hop": HOP_S, "range": f_range}, f0_contour)
+    frame = Rectangle(width=width, height=height).set_stroke(grid_color, width=1.5, opacity=0.6)
+    origin = frame.get_corner(DOWN + LEFT)
+
+    def y(hz):
+        return (np.asarray(hz) - f_range[0]) / (f_range[1] - f_range[0]) * height
+
+    grid = VGroup(*[
+        Line(origin + [0, y(hz), 0], origin + [width, y(hz), 0])
+        .set_stroke(grid_color, width=1, opacity=0.25)
+        for hz in grid_hz
+    ])
+    xs = np.linspace(0, width, len(f0))
+    voiced = ~np.isnan(f0)
+    edges = np.flatnonzero(np.diff(np.r_[False, voiced, False].astype(np.int8)))
+    contour = VMobject().set_stroke(color, width=4).set_fill(opacity=0)
+    for start, stop in zip(edges[::2], edges[1::2]):
+        if stop - start < 2:
+            continue
+        pts = origin + np.c_[xs[start:stop], y(f0[start:stop]), np.zeros(stop - start)]
+        contour.start_new_path(pts[0])
+        contour.add_points_as_corners(pts[1:])
+    return VGroup(frame, grid, contour)
@@ -0,0 +1,186 @@
+"""
+Benchmarks : construct() de chaque scène, rendus basse qualité et
+micro-benchmarks des utilitaires (T, under_title, step_box, load_img).
+
+« À froid » : caches de processus vidés (Text, images) et dossier media
+neuf (Pango/LaTeX régénèrent leurs SVG, aucun film partiel en cache).
+« À chaud » : même mesure juste après, tous caches remplis.
+
+Chaque exécution est ajoutée à un historique JSONL ; les mesures sont
+comparées à la médiane des dernières exécutions sur la même machine, et
+une hausse au-delà du seuil est signalée comme régression.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import timeit
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import manim
+from manim import logger, tempconfig
+
+from manimtts import assets, audiovis, narration
+from manimtts.components import COMPONENTS
+from manimtts.orchestrator import RenderOptions, plan_jobs, render_job, scene_class
+from manimtts.scenes import ROOT, load_common
+from manimtts.textcache import TEXT_CACHE
+from manimtts.timeline import measure_scene
+
+HISTORY_FILE = ROOT / "media" / "bench" / "history.jsonl"
+REGRESSION_THRESHOLD = 0.15   # +15 % par rapport à la médiane de référence
+BASELINE_RUNS = 5
+
+
+def _clear_process_caches():
+    TEXT_CACHE.clear()
+    COMPONENTS.clear()
+    assets._decode.cache_clear()
+    narration._pending.clear()
+    narration._cues.clear()
+
+
+@contextmanager
+def _fresh_media():
+    """media/ temporaire, y compris les clips de narration et les analyses audio."""
+    with tempfile.TemporaryDirectory(prefix="manimtts-bench-") as tmp:
+        media = Path(tmp)
+        saved, audiovis.CACHE_DIR = audiovis.CACHE_DIR, media / "audiovis"
+        try:
+            with tempconfig({"media_dir": tmp}):   # clips de narration : voir narration_dir
+                yield media
+        finally:
+            audiovis.CACHE_DIR = saved
+
+
+def _elapsed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def _per_call(fn, repeat: int = 5) -> float:
+    """Meilleur temps par appel (s), nombre d'appels calibré par timeit."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def bench_construct(jobs) -> dict[str, float]:
+    results = {}
+    for job in jobs:
+        cls = scene_class(job)
+        _clear_process_caches()
+        with _fresh_media():
+            results[f"construct.{job.name}.cold"] = _elapsed(lambda: measure_scene(cls))
+            results[f"construct.{job.name}.warm"] = _elapsed(lambda: measure_scene(cls))
+    return results
+
+
+def bench_render(jobs) -> dict[str, float]:
+    results = {}
+    for job in jobs:
+        _clear_process_caches()
+        with _fresh_media() as media:
+            options = RenderOptions(quality="low_quality", media_dir=media)
+            results[f"render_l.{job.name}.cold"] = render_job(job, options)[1]
+            results[f"render_l.{job.name}.warm"] = render_job(job, options)[1]
+    return results
+
+
+def bench_helpers() -> dict[str, float]:
+    module = load_common()
+    results = {}
+    with _fresh_media():
+        results["micro.T.hit"] = _per_call(lambda: module.T("Benchmark", font_size=24))
+
+        def miss():
+            TEXT_CACHE.clear()
+            module.T("Benchmark", font_size=24)
+        results["micro.T.miss"] = _per_call(miss)
+        results["micro.under_title"] = _per_call(lambda: module.under_title("Benchmark title"))
+        results["micro.step_box"] = _per_call(
+            lambda: module.step_box("Step", ["first line", "second line"])
+        )
+        stems = sorted(assets.asset_index(module.ASSETS_DIR))
+        if stems:
+            results["micro.load_img"] = _per_call(lambda: module.load_img(stems[0]))
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def load_history(path: Path = HISTORY_FILE) -> list[dict]:
+    if not Path(path).exists():
+        return []
+    return [json.loads(line) for line in Path(path).read_text().splitlines() if line.strip()]
+
+
+def compare(results: dict[str, float], history: list[dict],
+            threshold: float = REGRESSION_THRESHOLD) -> list[dict]:
+    """Écart de chaque mesure à la médiane des BASELINE_RUNS dernières exécutions."""
+    same_machine = [run for run in history if run.get("machine") == platform.node()]
+    rows = []
+    for name, value in sorted(results.items()):
+        past = [run["results"][name] for run in same_machine[-BASELINE_RUNS:]
+                if name in run["results"]]
+        baseline = statistics.median(past) if past else None
+        ratio = value / baseline - 1 if baseline else None
+        rows.append({"name": name, "value": value, "baseline": baseline, "ratio": ratio,
+                     "regression": ratio is not None and ratio > threshold})
+    return rows
+
+
+def run_bench(construct: bool = True, render: bool = True, helpers: bool = True,
+              scenes=(), history: Path = HISTORY_FILE,
+              threshold: float = REGRESSION_THRESHOLD) -> list[dict]:
+    """Exécute les benchmarks, les compare à l'historique puis les y ajoute."""
+    jobs = [job for job in plan_jobs() if not scenes or job.scene in scenes]
+    results = {}
+    if helpers:
+        results.update(bench_helpers())
+    if construct:
+        results.update(bench_construct(jobs))
+    if render:
+        results.update(bench_render(jobs))
+
+    rows = compare(results, load_history(history), threshold)
+    run = {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "manim": manim.__version__,
+        "results": results,
+    }
+    history = Path(history)
+    history.parent.mkdir(parents=True, exist_ok=True)
+    with history.open("a") as f:
+        f.write(json.dumps(run) + "\n")
+    for row in rows:
+        if row["regression"]:
+            logger.warning(f"régression : {row['name']} {row['ratio']:+.0%}")
+    return rows
+
+
+def format_rows(rows: list[dict]) -> str:
+    lines = [f"{'mesure':<44} {'valeur':>12} {'référence':>12} {'écart':>8}"]
+    for row in rows:
+        value = f"{row['value'] * 1e3:10.2f}ms"
+        base = f"{row['baseline'] * 1e3:10.2f}ms" if row["baseline"] else f"{'-':>12}"
+        ratio = f"{row['ratio']:+8.1%}" if row["ratio"] is not None else f"{'':>8}"
+        flag = "  !" if row["regression"] else ""
+        lines.append(f"{row['name']:<44} {value} {base} {ratio}{flag}")
+    return "\n".join(lines)
@@ -0,0 +1,257 @@
+"""
+Cache de rendu par scène, adressé par contenu.
+
+La clé d'une scène couvre tout ce qui peut changer ses pixels :
+- le source de la classe (et de ses classes parentes du paquet deck),
+- le source des fonctions utilitaires qu'elle appelle (T, under_title,
+  step_box, load_img, ...), récursivement,
+- les constantes de module qu'elle lit (BG_COLOR, ACCENT_YELLOW, FONT_SANS, ...)
+  et les réglages globaux du fichier (config.*, graine aléatoire),
+- le contenu des images chargées depuis assets/ (et du WAV de speech_sample),
+- le source des modules manimtts qu'elle utilise (DeckScene, SpectrogramReveal,
+  audiovis, ...) et de ceux qu'ils importent, limités à FRAME_MODULES : les
+  outils (orchestrator, cache, bench, lint, ...) ne changent pas les pixels,
+- les sections du fichier de données déclarées dans ``DATA`` (voir data.py),
+- la configuration de rendu (qualité, fps, version de Manim).
+"""
+
+import ast
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import shutil
+import sys
+import textwrap
+from pathlib import Path
+
+import manim
+
+from manimtts.audiovis import SAMPLE_STEM
+from manimtts.data import data_sections
+from manimtts.scenes import ROOT, is_deck_module, load_theme
+
+CACHE_DIR = ROOT / "media" / "scene_cache"
+ASSETS_DIR = ROOT / "assets"
+
+# Modules manimtts dont le source peut changer les images ou le son d'une scène
+FRAME_MODULES = frozenset(f"manimtts.{name}" for name in (
+    "animations", "assets", "audiovis", "components", "data", "encoding",
+    "narration", "renderers", "textcache", "timeline",
+))
+_SIMPLE_TYPES = (str, int, float, bool, tuple, list, dict, type(None))
+
+
+@functools.lru_cache(maxsize=None)
+def _file_digest(path: Path, mtime_ns: int, size: int) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """Empreinte du contenu d'un fichier ("missing" s'il n'existe pas)."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return "missing"
+    return _file_digest(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _module_layout(path: Path, mtime_ns: int):
+    """(noms des constantes de module, instructions globales hors définitions)."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    constants, prelude = set(), []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.ClassDef)):
+            continue
+        targets = node.targets if isinstance(node, ast.Assign) else [getattr(node, "target", None)]
+        names = [t.id for t in targets if isinstance(t, ast.Name)]
+        if names:
+            constants.update(names)
+        else:
+            prelude.append(ast.unparse(node))   # config.xxx = ..., np.random.seed(...)
+    return frozenset(constants), tuple(prelude)
+
+
+def _layout(module):
+    path = Path(module.__file__)
+    return _module_layout(path, path.stat().st_mtime_ns)
+
+
+def _imported(node) -> list[str]:
+    """Modules (ou attributs de module) nommés par un ``import``."""
+    if isinstance(node, ast.Import):
+        return [alias.name for alias in node.names]
+    if isinstance(node, ast.ImportFrom) and node.module and not node.level:
+        return [node.module, *(f"{node.module}.{alias.name}" for alias in node.names)]
+    return []
+
+
+@functools.lru_cache(maxsize=None)
+def _module_imports(path: Path, mtime_ns: int) -> tuple[str, ...]:
+    """Imports d'un fichier, y compris ceux faits à l'usage dans les fonctions
+    (filtrés ensuite par FRAME_MODULES : timeline importe orchestrator dans
+    measure_video)."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    return tuple(sorted({name for node in ast.walk(tree) for name in _imported(node)}))
+
+
+def _tooling(name):
+    """Module ``name`` de FRAME_MODULES (importé au besoin), sinon None."""
+    if name not in FRAME_MODULES:
+        return None
+    return _import_tooling(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_tooling(name: str):
+    return importlib.import_module(name)
+
+
+class _Dependencies:
+    """Parcourt le source d'une scène et collecte ce dont elle dépend.
+
+    Les fonctions et classes suivies sont celles des modules du deck
+    (la scène elle-même, deck/common.py, ...), chacune lue dans son module.
+    """
+
+    def __init__(self):
+        self.sources: dict[str, str] = {}
+        self.constants: dict[str, str] = {}
+        self.attributes: dict[str, str] = {}
+        self.preludes: dict[str, tuple] = {}
+        self.assets: set[Path] = set()
+        self.tooling: dict[str, str] = {}
+        self.constant_names = frozenset().union(*(
+            _layout(module)[0] for name, module in list(sys.modules.items())
+            if is_deck_module(name) and getattr(module, "__file__", None)
+        ))
+
+    def _is_local(self, obj) -> bool:
+        return is_deck_module(getattr(obj, "__module__", None))
+
+    def use_tooling(self, module):
+        """Fichier d'un module de FRAME_MODULES utilisé, et de ceux qu'il importe."""
+        if module.__name__ in self.tooling or not getattr(module, "__file__", None):
+            return
+        path = Path(module.__file__)
+        self.tooling[module.__name__] = file_digest(path)
+        for name in _module_imports(path, path.stat().st_mtime_ns):
+            imported = _tooling(name)
+            if imported is not None:
+                self.use_tooling(imported)
+
+    def use_module(self, module):
+        """Instructions globales du module (config.*, graine, thème)."""
+        if module.__name__ in self.preludes:
+            return
+        prelude = _layout(module)[1]
+        self.preludes[module.__name__] = prelude
+        for stmt in prelude:   # config.background_color = BG_COLOR, ...
+            self._walk(ast.parse(stmt), module)
+
+    def visit(self, obj):
+        key = f"{obj.__module__}.{obj.__qualname__}"
+        if key in self.sources:
+            return
+        try:
+            source = textwrap.dedent(inspect.getsource(obj))
+        except (OSError, TypeError):   # classe créée dynamiquement
+            source = ""
+        self.sources[key] = source
+        module = sys.modules[obj.__module__]
+        self.use_module(module)
+        if inspect.isclass(obj):
+            for name, value in vars(obj).items():
+                if not name.startswith("_") and isinstance(value, _SIMPLE_TYPES):
+                    self.attributes[f"{key}.{name}"] = repr(value)
+        if source:
+            self._walk(ast.parse(source), module)
+
+    def _walk(self, tree, module):
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                self._name(node.id, module)
+            elif isinstance(node, ast.Call) and getattr(node.func, "id", None) == "load_img":
+                if node.args and isinstance(node.args[0], ast.Constant):
+                    self.assets.update(ASSETS_DIR.glob(f"{node.args[0].value}.*"))
+            elif isinstance(node, ast.Call) and getattr(node.func, "id", None) == "speech_sample":
+                self.assets.update(ASSETS_DIR.glob(f"{SAMPLE_STEM}.wav"))
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                if node.value.startswith("assets/"):
+                    self.assets.add(ROOT / node.value)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):   # import à l'usage
+                for name in _imported(node):
+                    imported = _tooling(name)
+                    if imported is not None:
+                        self.use_tooling(imported)
+
+    def _name(self, name: str, module):
+        value = module.__dict__.get(name)
+        if name in self.constant_names:
+            if isinstance(value, _SIMPLE_TYPES):
+                self.constants[name] = repr(value)
+        elif (inspect.isfunction(value) or inspect.isclass(value)) and self._is_local(value):
+            self.visit(value)
+        elif _tooling_module(value) is not None:   # SpectrogramReveal, audiovis, ...
+            self.use_tooling(_tooling_module(value))
+
+
+def _tooling_module(value):
+    """Module manimtts d'où vient ``value`` (module, fonction, classe), sinon None."""
+    return _tooling(value.__name__ if inspect.ismodule(value) else getattr(value, "__module__", None))
+
+
+def scene_fingerprint(scene_cls, render_settings: dict) -> str:
+    """Clé de cache d'une classe de scène pour une configuration de rendu."""
+    deps = _Dependencies()
+    deps.use_module(load_theme())   # thème et config.* valent pour toutes les scènes
+    for cls in scene_cls.__mro__:
+        if deps._is_local(cls):
+            deps.visit(cls)
+        elif _tooling_module(cls) is not None:   # DeckScene
+            deps.use_tooling(_tooling_module(cls))
+    payload = {
+        "data": data_sections(getattr(scene_cls, "DATA", ())),
+        "scene": scene_cls.__name__,
+        "sources": deps.sources,
+        "constants": deps.constants,
+        "attributes": deps.attributes,
+        "prelude": deps.preludes,
+        "assets": {
+            str(p.relative_to(ROOT)): file_digest(p) for p in sorted(deps.assets)
+        },
+        "tooling": deps.tooling,
+        "render": render_settings,
+        "manim": manim.__version__,
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()[:32]
+
+
+class RenderCache:
+    """Films de scènes rangés par clé : ``<dossier>/<clé>.mp4``."""
+
+    def __init__(self, directory: Path | None = None):
+        self.directory = Path(directory or CACHE_DIR)
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.mp4"
+
+    def get(self, key: str) -> Path | None:
+        p = self.path(key)
+        return p if p.exists() else None
+
+    def put(self, key: str, movie: Path) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        dest = self.path(key)
+        tmp = dest.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(movie, tmp)
+        os.replace(tmp, dest)   # atomique : jamais de film tronqué dans le cache
+        return dest
@@ -0,0 +1,45 @@
+"""
+Composants partagés entre scènes : citations en pied de page et titres.
+
+Chaque composant est construit une fois par processus puis rendu par
+référence à toutes les scènes qui le demandent : VideoComplet n'en garde
+qu'un arbre au lieu d'un par scène. FadeIn / FadeOut / Write / Indicate
+laissent le mobject dans son état d'origine ; une scène qui le modifie
+durablement (déplacement, Transform, ``.animate``) le garde pour elle :
+son empreinte ne correspond plus et l'appel suivant reçoit un exemplaire
+neuf (copie à l'écriture).
+
+Un même composant n'apparaît qu'une fois à l'écran : pour deux exemplaires
+simultanés, prendre ``.copy()`` du second.
+"""
+
+from manimtts.fingerprint import mobject_fingerprint
+
+
+class ComponentCache:
+    """Composants par clé, avec compteurs de réutilisations / constructions."""
+
+    def __init__(self):
+        self.hits = 0
+        self.builds = 0
+        self._live: dict = {}   # clé → (mobject, empreinte à la construction)
+
+    def get(self, key, build):
+        entry = self._live.get(key)
+        if entry is not None and mobject_fingerprint(entry[0]) == entry[1]:
+            self.hits += 1
+            return entry[0]
+        mob = build()
+        self.builds += 1
+        self._live[key] = (mob, mobject_fingerprint(mob))
+        return mob
+
+    def clear(self):
+        self._live.clear()
+        self.hits = self.builds = 0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "builds": self.builds, "size": len(self._live)}
+
+
+COMPONENTS = ComponentCache()
@@ -0,0 +1,219 @@
+"""
+Données affichées par les scènes, lues dans extracted_data/data_extraction.json.
+
+Le fichier est chargé au premier accès puis gardé en mémoire. Chaque scène
+déclare les sections qu'elle lit dans un attribut de classe ``DATA``
+(chemins pointés, p. ex. ``"pdf_data.evaluation_subjective"``) : seules ces
+sections entrent dans sa clé de cache de rendu. Les champs lus pendant
+``recording_reads`` sont notés par leur chemin JSON : ``python -m manimtts
+lint`` signale ceux qu'une scène lit sans les déclarer (voir ``undeclared``).
+
+MANIMTTS_DATA permet de pointer vers un autre fichier (autre article, autre
+langue) sans toucher aux scènes ; il est relu à chaque appel, ce qui permet
+au rendu par lots de changer de variante dans un même processus.
+"""
+
+import functools
+import json
+import os
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+from manimtts.scenes import ROOT
+
+DATA_FILE = ROOT / "extracted_data" / "data_extraction.json"
+
+_reads: set[str] | None = None   # chemins lus pendant recording_reads()
+
+
+def data_file() -> Path:
+    """Fichier de données courant (MANIMTTS_DATA, relu à chaque appel)."""
+    return Path(os.environ.get("MANIMTTS_DATA", DATA_FILE))
+
+
+def _build(cls, d: dict, path: str):
+    """Construit une section à partir des clés du JSON qui lui correspondent."""
+    return _at(cls(**{f.name: d[f.name] for f in fields(cls) if f.name in d}), path)
+
+
+def _at(section, path: str):
+    object.__setattr__(section, "_path", path)   # dataclass gelée
+    return section
+
+
+class _Section:
+    """Section du JSON (chemin ``_path``) : ses champs lus sont notés."""
+
+    _path = ""
+
+    def __getattribute__(self, name):
+        if _reads is not None and name in type(self).__dataclass_fields__:
+            _reads.add(f"{object.__getattribute__(self, '_path')}.{name}")
+        return object.__getattribute__(self, name)
+
+
+@contextmanager
+def recording_reads():
+    """Ensemble des chemins JSON lus dans le bloc (``"pdf_data.title"``, ...)."""
+    global _reads
+    saved, _reads = _reads, set()
+    try:
+        yield _reads
+    finally:
+        _reads = saved
+
+
+def undeclared(reads, declared) -> list[str]:
+    """Chemins lus qu'aucune entrée de ``DATA`` ne couvre."""
+    return sorted(path for path in reads
+                  if not any(path == key or path.startswith(key + ".") for key in declared))
+
+
+@dataclass(frozen=True)
+class Paper(_Section):
+    title: str
+    authors: tuple[str, ...]
+    affiliations: tuple[str, ...]
+    conference: str
+    paper_id: str = ""
+
+    @property
+    def title_lines(self) -> tuple[str, str]:
+        """Titre sur deux lignes, coupé avant un mot-outil (« via », « for », ...)."""
+        words = self.title.split()
+        cuts = range(1, len(words))
+        if not cuts:   # un seul mot
+            return self.title.strip(), ""
+        preferred = [i for i in cuts if words[i][:1].islower()] or list(cuts)
+        best = min(preferred, key=lambda i: max(len(" ".join(words[:i])), len(" ".join(words[i:]))))
+        return " ".join(words[:best]), " ".join(words[best:])
+
+    @property
+    def author_lines(self) -> tuple[str, str]:
+        """Auteurs sur deux lignes ; la virgule de fin de la première seulement s'il y a une seconde."""
+        half = (len(self.authors) + 1) // 2
+        first, second = ", ".join(self.authors[:half]), ", ".join(self.authors[half:])
+        return (first + "," if second else first), second
+
+    @property
+    def institutions(self) -> str:
+        """Affiliations sans le pays (« École Polytechnique, France » → « École Polytechnique »)."""
+        return ", ".join(a.rsplit(", ", 1)[0] for a in self.affiliations)
+
+
+@dataclass(frozen=True)
+class BreakPrediction(_Section):
+    f1_score: float   # déjà en pourcents (99.24)
+    perplexity: float
+    f1_score_percent: float | None = None   # arrondi affiché ; déduit de f1_score s'il manque
+    source_page: str = ""
+
+    def __post_init__(self):
+        if object.__getattribute__(self, "f1_score_percent") is None:   # sans noter de lecture
+            object.__setattr__(self, "f1_score_percent",
+                               round(object.__getattribute__(self, "f1_score"), 1))
+
+
+@dataclass(frozen=True)
+class ProsodyErrors(_Section):
+    pitch_mae_percent: float
+    volume_mae_percent: float
+    rate_mae_percent: float
+    pitch_rmse_percent: float | None = None
+    volume_rmse_percent: float | None = None
+    rate_rmse_percent: float | None = None
+    break_time_mae_ms: float | None = None
+    break_time_rmse_ms: float | None = None
+    source_page: str = ""
+
+
+@dataclass(frozen=True)
+class ObjectiveEval:
+    qwen_a: BreakPrediction
+    bert: BreakPrediction
+    qwen_b: ProsodyErrors
+    bilstm: ProsodyErrors
+
+
+@dataclass(frozen=True)
+class SubjectiveEval(_Section):
+    mos_baseline: float
+    mos_enhanced: float
+    mos_improvement_percent: float
+    p_value: str
+    participants: int
+    audio_pairs: int
+    preference_count: str
+    source_page: str = ""
+
+    @property
+    def mos_delta(self) -> float:
+        return self.mos_enhanced - self.mos_baseline
+
+    @property
+    def preference(self) -> tuple[int, int]:
+        """« 15 of 18 » → (15, 18)."""
+        a, b = re.findall(r"\d+", self.preference_count)[:2]
+        return int(a), int(b)
+
+
+@dataclass(frozen=True)
+class DeckData:
+    paper: Paper
+    objective: ObjectiveEval
+    subjective: SubjectiveEval
+
+
+@functools.lru_cache(maxsize=None)
+def _read(path: Path, mtime_ns: int) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def raw_data(path: Path | None = None) -> dict:
+    path = Path(path or data_file())
+    return _read(path, path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _deck(path: Path, mtime_ns: int) -> DeckData:
+    pdf = _read(path, mtime_ns)["pdf_data"]
+    obj = pdf["evaluation_objective"]
+    section = "pdf_data.evaluation_objective."
+    return DeckData(
+        paper=_at(Paper(
+            title=pdf["title"],
+            authors=tuple(pdf["authors"]),
+            affiliations=tuple(pdf["affiliations"]),
+            conference=pdf["conference"],
+            paper_id=pdf.get("paper_id", ""),
+        ), "pdf_data"),
+        objective=ObjectiveEval(
+            qwen_a=_build(BreakPrediction, obj["qwen_a_break_prediction"],
+                          section + "qwen_a_break_prediction"),
+            bert=_build(BreakPrediction, obj["bert_baseline"], section + "bert_baseline"),
+            qwen_b=_build(ProsodyErrors, obj["qwen_b_prosody"], section + "qwen_b_prosody"),
+            bilstm=_build(ProsodyErrors, obj["bilstm_baseline"], section + "bilstm_baseline"),
+        ),
+        subjective=_build(SubjectiveEval, pdf["evaluation_subjective"],
+                          "pdf_data.evaluation_subjective"),
+    )
+
+
+def deck_data(path: Path | None = None) -> DeckData:
+    """Données typées du fichier courant (chargées une fois par processus)."""
+    path = Path(path or data_file())
+    return _deck(path, path.stat().st_mtime_ns)
+
+
+def data_sections(keys, path: Path | None = None) -> dict:
+    """Sous-arbres JSON désignés par des chemins pointés (pour les clés de cache)."""
+    raw = raw_data(path)
+    out = {}
+    for key in keys:
+        node = raw
+        for part in key.split("."):
+            node = node.get(part) if isinstance(node, dict) else None
+        out[key] = node
+    return out
@@ -0,0 +1,241 @@
+"""
+Écriture des films partiels : la commande ffmpeg est construite ici.
+
+DeckFileWriter reprend le tube rawvideo → ffmpeg de SceneFileWriter, avec
+un raccourci pour les wait() figés : au lieu de pousser N fois la même
+image dans le tube (8 Mo par image en 1080p), on n'en envoie qu'une et
+ffmpeg la répète lui-même (filtre tpad, ``-frames:v N``). L'encodeur reçoit
+exactement les mêmes N images : le film produit est identique.
+
+MANIMTTS_HOLD_STATIC=0 revient à l'écriture image par image.
+
+StreamingFileWriter écrit toute une scène (VideoComplet compris) dans un
+seul processus ffmpeg et un seul fichier, sans films partiels ni concat.
+
+Les réglages x264 viennent d'un profil (ENCODER_PROFILES) : celui de
+``encoder_profile()``, sinon MANIMTTS_ENCODER, sinon celui associé à la
+qualité de rendu (QUALITY_PROFILES). « stock » garde les réglages de Manim.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from manim import __version__, config, logger
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_png_format, is_webm_format
+
+
+@dataclass(frozen=True)
+class EncoderProfile:
+    name: str
+    preset: str
+    crf: int
+    threads: int                 # 0 = automatique (dépend de la machine)
+    keyint_seconds: float
+    bitexact: bool = False       # aucun champ variable (version, date) dans le film
+
+    def x264_args(self, fps: float) -> list[str]:
+        args = [
+            "-preset", self.preset,
+            "-crf", str(self.crf),
+            "-threads", str(self.threads),
+            "-g", str(max(1, round(self.keyint_seconds * fps))),
+        ]
+        if self.bitexact:
+            args += ["-fflags", "+bitexact", "-flags:v", "+bitexact"]
+        return args
+
+
+ENCODER_PROFILES = {
+    # aperçus : encodage le plus rapide, qualité suffisante pour relire
+    "draft": EncoderProfile("draft", "ultrafast", 28, 0, 10.0),
+    # relecture : proche du rendu final, plusieurs fois plus rapide que medium
+    "review": EncoderProfile("review", "veryfast", 21, 0, 5.0),
+    # livrable : nombre de threads fixe → même film octet pour octet d'une
+    # machine à l'autre (à version de ffmpeg / x264 égale)
+    "final": EncoderProfile("final", "slow", 18, 8, 2.0, bitexact=True),
+}
+
+QUALITY_PROFILES = {
+    "low_quality": "draft",
+    "medium_quality": "draft",
+    "high_quality": "review",
+    "production_quality": "final",
+    "fourk_quality": "final",
+}
+
+_override: str | None = None
+
+
+@contextmanager
+def encoder_profile(name: str | None):
+    """Impose un profil (ou « stock ») pour les films écrits dans le bloc."""
+    global _override
+    if name is not None and name != "stock" and name not in ENCODER_PROFILES:
+        raise ValueError(f"profil d'encodage inconnu : {name!r}")
+    saved, _override = _override, name
+    try:
+        yield
+    finally:
+        _override = saved
+
+
+def active_profile() -> EncoderProfile | None:
+    """Profil des films écrits maintenant (None : réglages de Manim)."""
+    name = _override or os.environ.get("MANIMTTS_ENCODER") or QUALITY_PROFILES.get(config.quality)
+    return ENCODER_PROFILES.get(name)
+
+
+class DeckFileWriter(SceneFileWriter):
+    """SceneFileWriter dont le tube ffmpeg s'ouvre à la première image."""
+
+    hold_static = os.environ.get("MANIMTTS_HOLD_STATIC", "1") != "0"
+
+    _pending: tuple | None = None   # (file_path,) du tube à ouvrir
+
+    # -- commande ffmpeg ------------------------------------------------------
+    def codec_args(self) -> list[str]:
+        if is_webm_format():
+            return ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+        if config.transparent:
+            return ["-vcodec", "qtrle"]
+        args = ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+        profile = active_profile()
+        if profile is not None:
+            args += profile.x264_args(config.frame_rate)
+        return args
+
+    def filter_args(self, hold_frames: int) -> list[str]:
+        if not hold_frames:
+            return []
+        tpad = "tpad=stop=-1:stop_mode=clone"
+        if not (is_webm_format() or config.transparent):
+            tpad = f"format=yuv420p,{tpad}"   # conversion une seule fois, avant la répétition
+        return ["-vf", tpad, "-frames:v", str(hold_frames)]
+
+    def combine_files(self, input_files, output_file, *args, **kwargs):
+        # liste ffmpeg propre à ce film : les parties d'une même scène (et les
+        # variantes) se combinent en parallèle depuis le même dossier partiel
+        shared = self.partial_movie_directory
+        self.partial_movie_directory = Path(tempfile.mkdtemp(prefix="manimtts_concat_"))
+        try:
+            super().combine_files(input_files, output_file, *args, **kwargs)
+        finally:
+            shutil.rmtree(self.partial_movie_directory, ignore_errors=True)
+            self.partial_movie_directory = shared
+
+    def ffmpeg_command(self, file_path, hold_frames: int = 0) -> list[str]:
+        fps = config.frame_rate
+        if fps == int(fps):
+            fps = int(fps)
+        return [
+            config.ffmpeg_executable,
+            "-y",
+            "-f", "rawvideo",
+            "-s", f"{config.pixel_width}x{config.pixel_height}",
+            "-pix_fmt", "rgba",
+            "-r", str(fps),
+            "-i", "-",
+            "-an",
+            "-loglevel", config.ffmpeg_loglevel.lower(),
+            "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+            *self.filter_args(hold_frames),
+            *self.codec_args(),
+            str(file_path),
+        ]
+
+    def open_movie_pipe(self, file_path=None, hold_frames: int = 0):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        self.writing_process = subprocess.Popen(
+            self.ffmpeg_command(file_path, hold_frames), stdin=subprocess.PIPE
+        )
+
+    # -- ouverture différée ---------------------------------------------------
+    def begin_animation(self, allow_write: bool = False, file_path=None):
+        if config.write_to_movie and allow_write:
+            self._pending = (file_path,)
+
+    def _open_pending(self, hold_frames: int = 0):
+        if self._pending is not None:
+            (file_path,), self._pending = self._pending, None
+            self.open_movie_pipe(file_path, hold_frames)
+
+    def write_frame(self, frame_or_renderer, num_frames: int = 1):
+        self._open_pending()
+        for _ in range(num_frames):   # SceneFileWriter.write_frame (0.18) : une image par appel
+            super().write_frame(frame_or_renderer)
+
+    def hold_frame(self, frame, num_frames: int):
+        """Écrit ``num_frames`` fois la même image (un wait() figé)."""
+        if self.hold_static and self._pending is not None and num_frames > 1 \
+                and not is_png_format():
+            self._open_pending(hold_frames=num_frames)
+            super().write_frame(frame)
+            logger.debug(f"wait figé : 1 image envoyée pour {num_frames}")
+        else:
+            self.write_frame(frame, num_frames)
+
+    def end_animation(self, allow_write: bool = False):
+        self._open_pending()   # segment sans image : même film vide qu'avant
+        super().end_animation(allow_write)
+
+
+class StreamingFileWriter(DeckFileWriter):
+    """Un seul tube ffmpeg pour toute la scène, directement vers le film final.
+
+    Aucun film partiel n'est écrit ni relu : le cache de films partiels de
+    Manim est donc sans objet (chaque play est rendu) et un wait() figé
+    repasse par le tube image par image. Le son éventuel (add_sound) est
+    multiplexé à la fin, sans ré-encoder la vidéo.
+    """
+
+    def is_already_cached(self, hash_invocation: str) -> bool:
+        return False
+
+    def begin_animation(self, allow_write: bool = False, file_path=None):
+        if config.write_to_movie and allow_write and not hasattr(self, "writing_process"):
+            self._pending = (self.movie_file_path,)
+
+    def hold_frame(self, frame, num_frames: int):
+        self.write_frame(frame, num_frames)
+
+    def end_animation(self, allow_write: bool = False):
+        pass   # le tube reste ouvert jusqu'à finish()
+
+    def finish(self):
+        if not config.write_to_movie:
+            return super().finish()
+        self._open_pending()
+        if hasattr(self, "writing_process"):
+            self.writing_process.stdin.close()
+            self.writing_process.wait()
+        if self.includes_sound:
+            self._mux_audio(Path(self.movie_file_path))
+        if self.subcaptions:
+            self.write_subcaption_file()
+        logger.info(f"Film écrit en un seul passage : {self.movie_file_path}")
+
+    def _mux_audio(self, movie: Path):
+        sound = movie.with_suffix(".wav")
+        muxed = movie.with_suffix(".muxed" + movie.suffix)
+        self.audio_segment.export(str(sound), format="wav")
+        subprocess.run(
+            [
+                config.ffmpeg_executable, "-y",
+                "-loglevel", config.ffmpeg_loglevel.lower(),
+                "-i", str(movie), "-i", str(sound),
+                "-map", "0:v:0", "-map", "1:a:0",
+                "-c:v", "copy", "-c:a", "aac", "-b:a", "320k",
+                str(muxed),
+            ],
+            check=True,
+        )
+        os.replace(muxed, movie)
+        sound.unlink()
@@ -0,0 +1,140 @@
+"""
+Empreinte structurelle d'un play() : clé des films partiels du DeckRenderer.
+
+Manim hache chaque play en sérialisant en JSON la caméra, les animations et
+tous les mobjects de la scène (``get_hash_from_play_call``), ce qui coûte
+cher sur les grands arbres (chaque point passe par une liste Python). Ici,
+chaque mobject est réduit à son type, à ses attributs simples et au contenu
+brut de ses tableaux numpy (points, couleurs, pixels), passé tel quel à
+blake2b ; chaque objet n'est visité qu'une fois par play.
+
+Deux plays de même empreinte produisent les mêmes images : le film partiel
+déjà écrit est réutilisé et seuls les plays modifiés sont rastérisés, puis
+Manim recolle la liste des segments de la scène. Un objet que l'empreinte
+ne sait pas décrire (repr ``<... at 0x...>``) la rend unique : le play est
+rastérisé de nouveau plutôt que de risquer un film partiel périmé.
+"""
+
+import enum
+import functools
+import hashlib
+import inspect
+import types
+import uuid
+
+import numpy as np
+from manim import Mobject, config
+from manim.animation.animation import Animation
+
+# Attributs sans effet sur l'image (ou parcourus à part).
+SKIPPED_ATTRS = frozenset({"submobjects", "target", "saved_state", "scene", "parents"})
+CAMERA_ATTRS = ("pixel_width", "pixel_height", "frame_width", "frame_height",
+                "frame_center", "background_color", "background_opacity")
+
+
+class _Hasher:
+    def __init__(self):
+        self.h = hashlib.blake2b(digest_size=16)
+        self.seen: dict[int, int] = {}   # id → numéro de visite (objets partagés, cycles)
+
+    def put(self, *parts):
+        for part in parts:
+            self.h.update(str(part).encode())
+            self.h.update(b"\x00")
+
+    def value(self, value):
+        if value is None or isinstance(value, (bool, int, float, str, enum.Enum, np.generic)):
+            self.put(repr(value))
+        elif isinstance(value, np.ndarray) and value.dtype != object:
+            self.put("nd", value.dtype.str, value.shape)
+            self.h.update(np.ascontiguousarray(value).data)
+        elif isinstance(value, Mobject):
+            self.mobject(value)
+        elif isinstance(value, Animation):
+            self.animation(value)
+        elif isinstance(value, (list, tuple, np.ndarray)):
+            self.put(type(value).__name__, len(value))
+            for item in value:
+                self.value(item)
+        elif isinstance(value, dict):
+            self.put("dict", len(value))
+            for key in sorted(value, key=repr):
+                self.put(repr(key))
+                self.value(value[key])
+        elif isinstance(value, functools.partial):
+            self.put("partial")
+            self.value(value.func)
+            self.value(value.args)
+            self.value(value.keywords)
+        elif isinstance(value, types.MethodType):
+            self.function(value.__func__)   # jamais l'objet lié (souvent la scène)
+        elif callable(value) and hasattr(value, "__code__"):
+            self.function(value)
+        else:
+            text = repr(value)
+            if " at 0x" in text:   # état opaque : l'empreinte ne correspond à aucune autre
+                text = f"{type(value).__qualname__}:{uuid.uuid4().hex}"
+            self.put(text)
+
+    def function(self, fn):
+        fn = inspect.unwrap(fn)
+        if not self._visit(fn):   # fonctions récursives, updaters partagés
+            return
+        code = fn.__code__
+        self.put("fn", fn.__qualname__, code.co_code.hex(), repr(code.co_consts))
+        for cell in fn.__closure__ or ():
+            try:
+                self.value(cell.cell_contents)
+            except ValueError:   # cellule vide
+                self.put("cell")
+
+    def _visit(self, obj) -> bool:
+        """Vrai à la première visite ; sinon ne hache qu'un renvoi."""
+        index = self.seen.get(id(obj))
+        if index is not None:
+            self.put("ref", index)
+            return False
+        self.seen[id(obj)] = len(self.seen)
+        return True
+
+    def attrs(self, obj):
+        self.put(type(obj).__qualname__)
+        for name, value in sorted(vars(obj).items()):
+            if name not in SKIPPED_ATTRS:
+                self.put(name)
+                self.value(value)
+
+    def mobject(self, mob: Mobject):
+        if not self._visit(mob):
+            return
+        self.attrs(mob)
+        self.put("children", len(mob.submobjects))
+        for child in mob.submobjects:
+            self.mobject(child)
+
+    def animation(self, animation: Animation):
+        if self._visit(animation):
+            self.attrs(animation)
+
+
+def mobject_fingerprint(mob: Mobject) -> str:
+    """Empreinte d'un seul mobject (et de sa famille)."""
+    hasher = _Hasher()
+    hasher.mobject(mob)
+    return hasher.h.hexdigest()
+
+
+def play_fingerprint(scene, camera) -> str:
+    """Empreinte du play en cours (après ``compile_animation_data``)."""
+    hasher = _Hasher()
+    hasher.put(type(camera).__qualname__, config.frame_rate)
+    for name in CAMERA_ATTRS:
+        hasher.put(name)
+        hasher.value(getattr(camera, name, None))
+    hasher.put("animations", len(scene.animations or ()))
+    for animation in scene.animations or ():
+        hasher.animation(animation)
+    hasher.put("mobjects", len(scene.mobjects))
+    for mob in scene.mobjects:
+        hasher.mobject(mob)
+    return hasher.h.hexdigest()
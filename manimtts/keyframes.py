@@ -0,0 +1,94 @@
+"""
+Export des images clés : la dernière image de chaque play()/wait() de
+chaque segment de PLAYLIST, en PNG, plus une planche contact.
+
+Les animations sont sautées comme pour le calendrier (NullRenderer) ; seul
+l'état final de chaque segment est rastérisé, soit environ une image par
+play au lieu de 30 à 60 par seconde de vidéo.
+"""
+
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from PIL import Image, ImageDraw
+
+from manimtts.orchestrator import RenderJob, plan_jobs, scene_class
+from manimtts.prewarm import worker_text_dirs
+from manimtts.renderers import NullRenderer
+from manimtts.scenes import ROOT, deck_tempconfig
+from manimtts.timeline import measure_scene
+
+KEYFRAMES_DIR = ROOT / "media" / "keyframes"
+THUMB_WIDTH = 320
+SHEET_COLUMNS = 6
+
+
+class KeyframeRenderer(NullRenderer):
+    """NullRenderer qui enregistre l'écran à la fin de chaque play()."""
+
+    def __init__(self, directory: Path, **kwargs):
+        super().__init__(**kwargs)
+        self.directory = Path(directory)
+        self.frames: list[Path] = []
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        self.static_image = None   # un fond figé d'un play sauté serait vide
+        CairoRenderer.update_frame(self, scene)
+        path = self.directory / f"{self.num_plays - 1:03d}.png"
+        self.camera.get_image().save(path)
+        self.frames.append(path)
+
+
+def export_job(job: RenderJob, quality: str, out_dir: Path) -> list[dict]:
+    """Images clés d'un segment (dans le processus courant)."""
+    directory = Path(out_dir) / job.name
+    directory.mkdir(parents=True, exist_ok=True)
+    with deck_tempconfig({"quality": quality}):   # workers réutilisés par pool.map
+        config.update(worker_text_dirs(config.media_dir))
+        renderer = KeyframeRenderer(directory)
+        timing = measure_scene(scene_class(job), renderer)
+    return [
+        {"job": job.name, "segment": i, "kind": seg.kind, "time": round(seg.end, 3),
+         "label": seg.label, "path": str(path)}
+        for i, (seg, path) in enumerate(zip(timing.segments, renderer.frames))
+    ]
+
+
+def contact_sheet(frames: list[dict], output: Path,
+                  thumb_width: int = THUMB_WIDTH, columns: int = SHEET_COLUMNS) -> Path:
+    """Planche contact : vignettes légendées (segment, indice, temps)."""
+    thumb_height = round(thumb_width * config.frame_height / config.frame_width)
+    caption = 16
+    rows = -(-len(frames) // columns)
+    sheet = Image.new("RGB", (columns * thumb_width, rows * (thumb_height + caption)), "black")
+    draw = ImageDraw.Draw(sheet)
+    for n, frame in enumerate(frames):
+        x = (n % columns) * thumb_width
+        y = (n // columns) * (thumb_height + caption)
+        with Image.open(frame["path"]) as im:
+            sheet.paste(im.convert("RGB").resize((thumb_width, thumb_height)), (x, y))
+        draw.text((x + 4, y + thumb_height + 2),
+                  f"{frame['job']} #{frame['segment']}  {frame['time']:.1f}s", fill="white")
+    sheet.save(output)
+    return output
+
+
+def export_keyframes(out_dir: Path = KEYFRAMES_DIR, quality: str = "medium_quality",
+                     jobs: int | None = None) -> Path:
+    """Exporte toutes les images clés en parallèle ; renvoie la planche contact."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    plan = plan_jobs()
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as pool:
+        results = list(pool.map(export_job, plan, [quality] * len(plan), [out_dir] * len(plan)))
+    frames = [frame for job_frames in results for frame in job_frames]
+    (out_dir / "index.json").write_text(json.dumps(frames, indent=2, ensure_ascii=False))
+    sheet = contact_sheet(frames, out_dir / "contact_sheet.png")
+    logger.info(f"keyframes : {len(frames)} images dans {out_dir}")
+    return sheet
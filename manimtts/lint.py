@@ -0,0 +1,148 @@
+"""
+Lint de mise en page : construct() sans rastérisation, puis contrôle de
+l'écran après chaque play()/wait().
+
+Trois défauts sont signalés :
+- ``overflow`` : une partie visible d'un mobject sort du cadre
+  (``config.frame_width`` × ``config.frame_height``) ;
+- ``overlap`` : les textes de deux mobjects de premier niveau se
+  chevauchent (texte sur texte ; un texte posé sur un rectangle du même
+  groupe n'est pas un défaut) ;
+- ``data`` : la scène lit un champ du fichier de données absent de son
+  ``DATA`` (il manquerait à sa clé de cache, voir manimtts/data.py).
+
+Chaque défaut n'est rapporté qu'une fois, au premier segment où il apparaît.
+
+Rien n'est rastérisé, mais construct() bâtit tous les mobjects (Text, Tex,
+images) : compter une quinzaine de secondes pour la PLAYLIST entière, moins
+en nommant les scènes à vérifier.
+"""
+
+from dataclasses import asdict, dataclass
+
+import numpy as np
+from manim import ImageMobject, MarkupText, SingleStringMathTex, Text, VMobject, config
+
+from manimtts.data import recording_reads, undeclared
+from manimtts.renderers import NullRenderer
+from manimtts.timeline import SceneTiming, measure_scene
+
+OVERFLOW_MARGIN = 0.02    # unités Manim tolérées au bord du cadre
+OVERLAP_MIN_AREA = 0.01   # aire de chevauchement ignorée en dessous (unités²)
+
+TEXT_TYPES = (Text, MarkupText, SingleStringMathTex)
+
+
+@dataclass(frozen=True)
+class LayoutIssue:
+    kind: str        # "overflow", "overlap" ou "data"
+    scene: str
+    segment: int     # indice du play() (0 = premier)
+    time: float      # fin du segment, en secondes depuis le début de la scène
+    detail: str
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def describe(mob) -> str:
+    for member in mob.get_family():
+        text = getattr(member, "text", None) or getattr(member, "tex_string", None)
+        if isinstance(member, TEXT_TYPES) and text:
+            text = " ".join(str(text).split())
+            return f"{type(mob).__name__}({text[:32]!r})"
+    return type(mob).__name__
+
+
+def _visible(member) -> bool:
+    if isinstance(member, ImageMobject):
+        return True
+    if isinstance(member, VMobject):
+        if member.get_fill_opacity() > 0:
+            return True
+        return member.get_stroke_opacity() > 0 and member.get_stroke_width() > 0
+    return False
+
+
+def _box(members):
+    points = [m.points for m in members if len(m.points)]
+    if not points:
+        return None
+    pts = np.concatenate(points)
+    return pts[:, 0].min(), pts[:, 1].min(), pts[:, 0].max(), pts[:, 1].max()
+
+
+def _family_box(mob, keep):
+    # les points d'une ImageMobject sont ses quatre coins
+    return _box([m for m in mob.get_family() if keep(m)])
+
+
+def _text_boxes(mob):
+    return [b for m in mob.get_family() if isinstance(m, TEXT_TYPES)
+            for b in [_family_box(m, _visible)] if b is not None]
+
+
+def _intersection(a, b) -> float:
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    return w * h if w > 0 and h > 0 else 0.0
+
+
+def check_frame(mobjects) -> list[tuple[str, str]]:
+    """Défauts de l'écran courant : [(type, détail), ...]."""
+    issues = []
+    half_w = config.frame_width / 2 + OVERFLOW_MARGIN
+    half_h = config.frame_height / 2 + OVERFLOW_MARGIN
+    texts = []
+    for mob in mobjects:
+        box = _family_box(mob, _visible)
+        if box is None:
+            continue
+        x0, y0, x1, y1 = box
+        out = max(-half_w - x0, x1 - half_w, -half_h - y0, y1 - half_h)
+        if out > 0:
+            issues.append(("overflow", f"{describe(mob)} dépasse du cadre de {out:.2f}"))
+        boxes = _text_boxes(mob)
+        if boxes:
+            texts.append((mob, boxes))
+
+    for i, (a, boxes_a) in enumerate(texts):
+        for b, boxes_b in texts[i + 1:]:
+            area = max(_intersection(p, q) for p in boxes_a for q in boxes_b)
+            if area > OVERLAP_MIN_AREA:
+                issues.append(("overlap", f"{describe(a)} chevauche {describe(b)} ({area:.2f} u²)"))
+    return issues
+
+
+class LintRenderer(NullRenderer):
+    """NullRenderer qui contrôle la mise en page à la fin de chaque play()."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.issues: list[LayoutIssue] = []
+        self.reads: set[str] = set()   # chemins de données lus (lint_scene)
+        self._seen: set[tuple[str, str]] = set()
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        end = getattr(scene, "clock", 0.0) + scene.duration
+        found = check_frame(scene.mobjects) + [
+            ("data", f"{path} lu sans être déclaré dans DATA")
+            for path in undeclared(self.reads, getattr(scene, "DATA", ()))
+        ]
+        for kind, detail in found:
+            if (kind, detail) in self._seen:
+                continue
+            self._seen.add((kind, detail))
+            self.issues.append(
+                LayoutIssue(kind, type(scene).__name__, self.num_plays - 1, end, detail)
+            )
+
+
+def lint_scene(scene_cls) -> tuple[SceneTiming, list[LayoutIssue]]:
+    """Calendrier et défauts de mise en page d'une scène (sans rendu)."""
+    renderer = LintRenderer()
+    with recording_reads() as reads:
+        renderer.reads = reads
+        timing = measure_scene(scene_cls, renderer)
+    return timing, renderer.issues
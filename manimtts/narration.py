@@ -0,0 +1,296 @@
+"""
+Narration : script SSML de chaque scène, synthétisé hors ligne et mixé au film.
+
+Chaque scène du deck porte son script dans ``NARRATION`` (balises
+``<break>`` et ``<prosody>``, comme l'exemple de SceneProsodyPrimer).
+La synthèse passe par un backend local interchangeable :
+- ``espeak-ng`` : moteur hors ligne, lit le SSML tel quel (``-m``) ;
+- ``silent`` : silence de la durée estimée du script (machines sans moteur,
+  CI) ; le film garde une piste audio de même format.
+MANIMTTS_TTS choisit le backend (``auto`` : espeak-ng s'il est installé),
+MANIMTTS_VOICE la voix, MANIMTTS_NARRATION=0 coupe la narration.
+
+Les clips sont rangés dans ``<config.media_dir>/narration`` sous le hash du
+SSML, de la voix et du backend. La synthèse démarre dans un pool de threads dès le début de
+la scène et tourne pendant le rendu des images ; le clip n'est attendu
+qu'à la fin de la scène, au moment de le poser sur la piste.
+
+Repères : un ``<mark name="..."/>`` (hors de toute autre balise) découpe le
+script en morceaux synthétisés séparément puis mis bout à bout ; la durée
+des morceaux donne la position de chaque repère (``cue_times``) sans
+rastériser une image. ``DeckScene.wait(cue=...)`` s'y cale.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import wave
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from manim import config, logger
+
+SAMPLE_RATE = 48000          # fréquence commune des pistes (concat sans ré-encodage)
+WORDS_PER_SECOND = 2.5       # débit estimé par le backend silencieux
+END = "end"                  # repère implicite : fin du script
+CUE_PATTERN = re.compile(r'<mark\s+name="([^"]+)"\s*/>')
+
+
+class EspeakBackend:
+    """espeak-ng en ligne de commande (SSML activé par ``-m``)."""
+
+    name = "espeak-ng"
+
+    def __init__(self, voice: str = "en"):
+        self.voice = voice
+
+    @staticmethod
+    def available() -> bool:
+        return shutil.which("espeak-ng") is not None
+
+    def synthesize(self, ssml: str, out: Path):
+        subprocess.run(
+            ["espeak-ng", "-m", "-v", self.voice, "-w", str(out), "--stdin"],
+            input=ssml.encode("utf-8"),
+            check=True,
+            capture_output=True,
+        )
+
+
+class SilentBackend:
+    """Silence de la durée estimée du script (mots et ``<break time>``)."""
+
+    name = "silent"
+
+    def __init__(self, voice: str = "en"):
+        self.voice = voice
+
+    @staticmethod
+    def available() -> bool:
+        return True
+
+    @staticmethod
+    def estimate(ssml: str) -> float:
+        pauses = 0.0
+        for value, unit in re.findall(r'<break[^>]*time="([\d.]+)(ms|s)"', ssml):
+            pauses += float(value) / (1000 if unit == "ms" else 1)
+        words = len(re.sub(r"<[^>]+>", " ", ssml).split())
+        return words / WORDS_PER_SECOND + pauses
+
+    def synthesize(self, ssml: str, out: Path):
+        frames = round(self.estimate(ssml) * SAMPLE_RATE)
+        with wave.open(str(out), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(SAMPLE_RATE)
+            wav.writeframes(b"\x00\x00" * frames)
+
+
+BACKENDS = {backend.name: backend for backend in (EspeakBackend, SilentBackend)}
+
+_enabled: bool | None = None
+_lock = threading.Lock()
+_pool: ThreadPoolExecutor | None = None
+_pending: dict[Path, Future] = {}   # par chemin de clip (un media_dir par rendu)
+_cues: dict[str, dict[str, float]] = {}
+
+
+@contextmanager
+def narration_settings(enabled: bool | None):
+    """Active ou coupe la narration pour les scènes rendues dans le bloc."""
+    global _enabled
+    saved, _enabled = _enabled, enabled
+    try:
+        yield
+    finally:
+        _enabled = saved
+
+
+def enabled() -> bool:
+    if _enabled is not None:
+        return _enabled
+    return os.environ.get("MANIMTTS_NARRATION", "1") != "0"
+
+
+def backend():
+    """Backend choisi par MANIMTTS_TTS / MANIMTTS_VOICE."""
+    name = os.environ.get("MANIMTTS_TTS", "auto")
+    voice = os.environ.get("MANIMTTS_VOICE", "en")
+    if name == "auto":
+        name = "espeak-ng" if EspeakBackend.available() else "silent"
+    try:
+        return BACKENDS[name](voice)
+    except KeyError:
+        raise ValueError(f"backend de synthèse inconnu : {name!r} ({sorted(BACKENDS)})") from None
+
+
+def settings_key() -> str | None:
+    """Backend et voix (clé du cache de scènes), None sans narration."""
+    if not enabled():
+        return None
+    tts = backend()
+    return f"{tts.name}:{tts.voice}"
+
+
+def clip_key(ssml: str, tts) -> str:
+    blob = json.dumps({"ssml": ssml, "backend": tts.name, "voice": tts.voice}, sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32]
+
+
+def split_cues(ssml: str) -> list[tuple[str | None, str]]:
+    """Morceaux ``(repère, ssml)`` du script, coupés aux ``<mark>``.
+
+    Le premier morceau n'a pas de repère ; chaque morceau est un ``<speak>``
+    complet (un morceau sans texte reste vide).
+    """
+    body = re.sub(r"^\s*<speak[^>]*>|</speak>\s*$", "", ssml)
+    parts = CUE_PATTERN.split(body)
+    names = [None, *parts[1::2]]
+    return [(name, f"<speak>{text}</speak>" if text.strip() else "")
+            for name, text in zip(names, parts[0::2])]
+
+
+def clip_seconds(path: Path) -> float:
+    with wave.open(str(path), "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def narration_dir() -> Path:
+    """Dossier des clips du rendu en cours (suit ``config.media_dir``)."""
+    return Path(config.media_dir) / "narration"
+
+
+def _clip_path(ssml: str, tts, directory: Path | None = None) -> Path:
+    return (directory or narration_dir()) / f"{clip_key(ssml, tts)}.wav"
+
+
+def _write(path: Path, tts, write):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp.wav")
+    write(tmp)
+    os.replace(tmp, path)   # atomique : plusieurs workers peuvent viser le même clip
+    logger.info(f"narration : {path.name} synthétisé ({tts.name}, {tts.voice})")
+
+
+def _synthesize(ssml: str, tts, path: Path) -> Path:
+    if path.exists():
+        return path
+    chunks = split_cues(ssml)
+    if len(chunks) == 1:
+        _write(path, tts, lambda out: tts.synthesize(ssml, out))
+        return path
+    # script à repères : un clip par morceau, puis concaténation
+    # (chemins tirés de ``path`` : le thread ne relit pas config.media_dir)
+    clips = [_synthesize(chunk, tts, _clip_path(chunk, tts, path.parent))
+             for _, chunk in chunks if chunk]
+
+    def join(out: Path):
+        with wave.open(str(out), "wb") as dst:
+            for i, clip in enumerate(clips):
+                with wave.open(str(clip), "rb") as src:
+                    if i == 0:
+                        dst.setparams(src.getparams())
+                    dst.writeframes(src.readframes(src.getnframes()))
+
+    _write(path, tts, join)
+    return path
+
+
+def request(ssml: str) -> Future | None:
+    """Clip du script ``ssml`` (Future[Path]) ; None pour un script vide."""
+    global _pool
+    if not ssml.strip():
+        return None
+    tts = backend()
+    path = _clip_path(ssml, tts)
+    with _lock:
+        future = _pending.get(path)
+        if future is None:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="narration")
+            future = _pool.submit(_synthesize, ssml, tts, path)
+            _pending[path] = future
+    return future
+
+
+def prefetch(scripts):
+    """Lance la synthèse de plusieurs scripts sans attendre."""
+    if enabled():
+        for ssml in scripts:
+            request(ssml)
+
+
+def cue_times(ssml: str) -> dict[str, float]:
+    """Position (s depuis le début du script) de chaque repère, et de ``END``.
+
+    Attend la synthèse (déjà en cache disque le plus souvent) : les durées
+    sont connues avant le rendu de la première image.
+    """
+    if not ssml.strip():
+        return {END: 0.0}
+    tts = backend()
+    key = clip_key(ssml, tts)
+    if key not in _cues:
+        path = request(ssml).result()
+        chunks = split_cues(ssml)
+        times, t = {}, 0.0
+        for name, chunk in chunks if len(chunks) > 1 else ():
+            if name is not None:
+                times[name] = t
+            if chunk:
+                t += clip_seconds(_clip_path(chunk, tts, path.parent))
+        times[END] = clip_seconds(path)
+        _cues[key] = times
+    return _cues[key]
+
+
+class Narration:
+    """Piste d'une scène : commencée au début de la scène, posée à la fin."""
+
+    def __init__(self, start: float, clip: Future | None):
+        self.start = start
+        self.clip = clip
+
+    @classmethod
+    def begin(cls, scene) -> "Narration | None":
+        """None si rien n'est écrit (dry-run, renderers d'outils) ou narration coupée."""
+        if not enabled() or not config.write_to_movie or scene.renderer.skip_animations:
+            return None
+        return cls(scene.renderer.time, request(scene.NARRATION))
+
+    def attach(self, scene):
+        """Pose le clip (coupé à la durée de la scène) sur la piste du film.
+
+        Une scène sans script reçoit un silence : toutes les scènes ont alors
+        une piste audio de même format et se concatènent sans ré-encodage.
+        Pour une partie de scène, seule la tranche du clip qui tombe dans le
+        film est posée (voir ``DeckRenderer.movie_start``).
+        """
+        from pydub import AudioSegment   # import local : pas de pydub pour importer END
+
+        renderer = scene.renderer
+        origin = getattr(renderer, "movie_start", None) or 0.0
+        start, end = max(self.start, origin), renderer.time
+        if end <= start:
+            return
+        writer = renderer.file_writer
+        writer.add_audio_segment(
+            AudioSegment.silent(round((end - start) * 1000), frame_rate=SAMPLE_RATE),
+            time=start - origin,
+        )
+        if self.clip is None:
+            return
+        clip = AudioSegment.from_file(self.clip.result())
+        duration = end - self.start
+        if clip.duration_seconds > duration + 0.05 and not getattr(renderer, "ended_early", False):
+            logger.warning(
+                f"{type(scene).__name__} : narration de {clip.duration_seconds:.1f}s "
+                f"pour une scène de {duration:.1f}s (coupée)"
+            )
+        window = clip[round((start - self.start) * 1000): round(duration * 1000)]
+        writer.add_audio_segment(window, time=start - origin)
@@ -0,0 +1,295 @@
+"""
+Rendu parallèle de VideoComplet : une scène (ou une carte de transition)
+par processus, puis concaténation des films sans ré-encodage. Plusieurs
+variantes (données / palette) partagent le même pool et les mêmes segments.
+
+Avec ``split_seconds``, une scène plus longue est découpée aux frontières
+de ses play() en parties rendues chacune dans son processus : la partie
+rejoue les plays qui la précèdent sans les rastériser
+(``from_animation_number``), s'arrête après son dernier
+(``upto_animation_number``), et les parties se suivent dans la concat finale.
+"""
+
+import multiprocessing
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from manim import config, logger
+
+from manimtts.cache import RenderCache, scene_fingerprint
+from manimtts.encoding import (
+    ENCODER_PROFILES, QUALITY_PROFILES, StreamingFileWriter, encoder_profile,
+)
+from manimtts.narration import narration_settings, settings_key
+from manimtts.prewarm import prewarm, worker_text_dirs
+from manimtts.renderers import DeckRenderer
+from manimtts.scenes import (
+    DECK_DIR, ROOT, deck_tempconfig, load_scene, registry, transition_scene,
+)
+from manimtts.timeline import measure_scene
+from manimtts.variants import Variant, activate
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """Un segment de la vidéo finale."""
+    index: int
+    scene: str                 # nom de classe, ou titre pour une transition
+    transition: bool = False
+    plays: tuple[int, int] | None = None   # partie : premier et dernier play (-1 : fin)
+
+    @property
+    def name(self) -> str:
+        if self.transition:
+            return f"{self.index:02d}_Transition"
+        if self.plays is not None:
+            return f"{self.index:02d}_{self.scene}_p{self.plays[0]:03d}"
+        return f"{self.index:02d}_{self.scene}"
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    quality: str = "high_quality"
+    frame_rate: float | None = None
+    media_dir: Path = field(default=ROOT / "media")
+    encoder: str | None = None     # profil x264 (None : celui de la qualité)
+    narration: bool | None = None  # piste SSML (None : MANIMTTS_NARRATION, voir narration.py)
+    split_seconds: float | None = None   # découpe des scènes plus longues (parties)
+
+    def manim_config(self, output_file: str) -> dict:
+        cfg = {
+            "quality": self.quality,
+            "media_dir": str(self.media_dir),
+            "input_file": str(DECK_DIR),   # films dans media/videos/deck/
+            "output_file": output_file,
+            "format": "mp4",
+            "write_to_movie": True,
+            "save_last_frame": False,
+            "preview": False,
+        }
+        if self.frame_rate:
+            cfg["frame_rate"] = self.frame_rate
+        return cfg
+
+    def cache_settings(self) -> dict:
+        """Réglages qui changent le film (entrent dans la clé de cache)."""
+        with narration_settings(self.narration):
+            narration = settings_key()
+        return {"quality": self.quality, "frame_rate": self.frame_rate, "format": "mp4",
+                "encoder": self.encoder_name(), "narration": narration}
+
+    def encoder_name(self) -> str:
+        return (self.encoder or os.environ.get("MANIMTTS_ENCODER")
+                or QUALITY_PROFILES.get(self.quality) or "stock")
+
+
+_DEFAULT_CACHE = object()   # cache par défaut de render_variants / render_video
+
+
+def split_plays(durations: list[float], target: float) -> list[tuple[int, int]]:
+    """Plages de plays consécutifs d'environ ``target`` secondes chacune.
+
+    Chaque plage est ``(premier, dernier)`` ; la dernière finit à -1 (fin de
+    la scène). Une scène plus courte que ``target`` reste d'un seul tenant.
+    Aucune plage ne finit au play 0 : ``upto_animation_number=0`` vaut « pas
+    de limite » pour Manim, le premier play reste donc avec le suivant.
+    """
+    ranges, first, elapsed = [], 0, 0.0
+    for i, duration in enumerate(durations[:-1]):
+        elapsed += duration
+        if i > 0 and elapsed >= target and sum(durations[i + 1:]) >= target / 2:
+            ranges.append((first, i))
+            first, elapsed = i + 1, 0.0
+    ranges.append((first, -1))
+    return ranges
+
+
+def plan_jobs(split_seconds: float | None = None,
+              narration: bool | None = None) -> list[RenderJob]:
+    """Découpe PLAYLIST en segments, dans l'ordre de la vidéo.
+
+    Avec ``split_seconds``, le calendrier de chaque scène est mesuré (sans
+    rendu) pour la découper en parties de cette durée environ ; ``narration``
+    est le réglage du rendu, puisque les repères du script calent les waits.
+    Les parties partagent l'index de leur scène : les autres segments gardent
+    le leur.
+    """
+    jobs, index = [], 0
+    for scene_name, next_scene_name in registry().PLAYLIST:
+        ranges = [None]
+        if split_seconds:
+            with narration_settings(narration):
+                timing = measure_scene(load_scene(scene_name))
+            ranges = split_plays([s.duration for s in timing.segments], split_seconds)
+            if len(ranges) == 1:
+                ranges = [None]
+        jobs += [RenderJob(index, scene_name, plays=plays) for plays in ranges]
+        index += 1
+        if next_scene_name:
+            jobs.append(RenderJob(index, next_scene_name, transition=True))
+            index += 1
+    return jobs
+
+
+def scene_class(job: RenderJob):
+    if job.transition:
+        return transition_scene(job.scene, job.index)
+    return load_scene(job.scene)
+
+
+def render_job(
+    job: RenderJob, options: RenderOptions, variant: Variant | None = None, output_file: str = ""
+) -> tuple[Path, float]:
+    """Rend un segment dans le processus courant ; renvoie (film, durée en s)."""
+    t0 = time.perf_counter()
+    if variant is not None:
+        activate(variant)
+    cfg = options.manim_config(output_file or job.name)
+    cfg.update(worker_text_dirs(options.media_dir))   # workers parallèles : voir prewarm
+    if job.plays is not None:
+        cfg["from_animation_number"], cfg["upto_animation_number"] = job.plays
+    with deck_tempconfig(cfg), \
+            encoder_profile(options.encoder_name()), narration_settings(options.narration):
+        scene = scene_class(job)()
+        scene.render()
+        movie = Path(scene.renderer.file_writer.movie_file_path)
+    return movie, time.perf_counter() - t0
+
+
+def concat_movies(parts: list[Path], output: Path, bitexact: bool = False) -> Path:
+    """Concatène des mp4 de mêmes paramètres, sans ré-encodage (-c copy)."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    listing = output.with_suffix(".concat.txt")
+    listing.write_text("".join(f"file '{p.resolve().as_posix()}'\n" for p in parts))
+    subprocess.run(
+        [
+            config.ffmpeg_executable, "-y",
+            "-loglevel", "error",
+            "-f", "concat", "-safe", "0",
+            "-i", str(listing),
+            "-c", "copy",
+            *(["-fflags", "+bitexact"] if bitexact else []),
+            str(output),
+        ],
+        check=True,
+    )
+    listing.unlink()
+    return output
+
+
+def render_variants(
+    outputs: dict[Variant, Path],
+    options: RenderOptions = RenderOptions(),
+    jobs: int | None = None,
+    cache: RenderCache | None = _DEFAULT_CACHE,
+    prewarm_texts: bool = True,
+) -> dict[Variant, Path]:
+    """Rend plusieurs variantes de la vidéo avec un seul pool de processus.
+
+    Un segment identique dans plusieurs variantes (même empreinte : même
+    source, mêmes constantes, mêmes données) n'est rendu qu'une fois.
+    ``cache`` : media/scene_cache par défaut, None pour tout rendre.
+    """
+    if cache is _DEFAULT_CACHE:
+        cache = RenderCache()   # construit à l'appel, pas à l'import du module
+    plans: dict[Variant, list[tuple[RenderJob, str]]] = {}
+    movies: dict[str, Path] = {}
+    pending: dict[str, tuple[RenderJob, Variant]] = {}
+
+    for variant in outputs:
+        activate(variant)
+        plan = plans[variant] = []
+        with deck_tempconfig({"media_dir": str(options.media_dir)}):   # clips des repères
+            planned = plan_jobs(options.split_seconds, options.narration)
+        for job in planned:
+            settings = options.cache_settings()
+            if job.plays is not None:
+                settings["plays"] = list(job.plays)
+            key = scene_fingerprint(scene_class(job), settings)
+            plan.append((job, key))
+            if key in movies or key in pending:
+                continue
+            hit = cache.get(key) if cache is not None else None
+            if hit is not None:
+                movies[key] = hit
+                logger.info(f"{variant.name}/{job.name} : en cache ({key})")
+            else:
+                pending[key] = (job, variant)
+
+    # Les scènes d'abord, les cartes de transition (3 s) comblent la fin ;
+    # à rang égal, les segments d'une même variante se suivent (moins de
+    # rechargements du fichier de scènes dans les processus).
+    order = {variant: i for i, variant in enumerate(outputs)}
+    queue = sorted(pending.items(), key=lambda kv: (kv[1][0].transition, order[kv[1][1]]))
+    if queue:
+        if prewarm_texts:
+            prewarm(options.media_dir, jobs, variants=list(outputs))
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as pool:
+            futures = {
+                pool.submit(render_job, job, options, variant, f"{job.name}_{key[:12]}"): key
+                for key, (job, variant) in queue
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                job, variant = pending[key]
+                movie, elapsed = future.result()
+                if cache is not None:
+                    movie = cache.put(key, movie)
+                movies[key] = movie
+                logger.info(f"{variant.name}/{job.name} rendu en {elapsed:.1f}s")
+
+    profile = ENCODER_PROFILES.get(options.encoder_name())
+    bitexact = profile is not None and profile.bitexact
+    return {
+        variant: concat_movies([movies[key] for _, key in plans[variant]], output, bitexact)
+        for variant, output in outputs.items()
+    }
+
+
+def render_video(
+    output: Path,
+    options: RenderOptions = RenderOptions(),
+    jobs: int | None = None,
+    cache: RenderCache | None = _DEFAULT_CACHE,
+    prewarm_texts: bool = True,
+) -> Path:
+    """Rend en parallèle les segments absents du cache puis assemble la vidéo."""
+    variant = Variant.from_env()
+    return render_variants({variant: output}, options, jobs, cache, prewarm_texts)[variant]
+
+
+def stream_video(output: Path, options: RenderOptions = RenderOptions(),
+                 jobs: int | None = None, prewarm_texts: bool = True) -> Path:
+    """Rend VideoComplet d'un seul tenant : un processus, un tube ffmpeg, un film.
+
+    Pas de films partiels ni de concat (peu d'écritures disque), mais ni
+    parallélisme ni cache de scènes : à préférer pour les machines partagées.
+    """
+    if prewarm_texts:
+        prewarm(options.media_dir, jobs)
+    cfg = {**options.manim_config("VideoComplet"), "disable_caching": True}
+    t0 = time.perf_counter()
+    with deck_tempconfig(cfg), encoder_profile(options.encoder_name()), \
+            narration_settings(options.narration):
+        renderer = DeckRenderer(file_writer_class=StreamingFileWriter)
+        scene = load_scene("VideoComplet")(renderer=renderer)
+        scene.render()
+        movie = Path(scene.renderer.file_writer.movie_file_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    shutil.move(movie, output)
+    logger.info(f"VideoComplet rendu en un passage en {time.perf_counter() - t0:.1f}s")
+    return output
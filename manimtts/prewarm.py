@@ -0,0 +1,324 @@
+"""
+Pré-génération des SVG de media/texts (Pango) et media/Tex (LaTeX).
+
+Les textes sont collectés statiquement dans le source des scènes : on suit
+les appels à T()/Text()/Tex()/MathTex() à travers les boucles, les listes en
+compréhension et les utilitaires (under_title, pattern_card, play_transition,
+...) tant que les arguments se réduisent à des constantes, y compris les
+valeurs lues via deck_data(). Les SVG sont ensuite produits en parallèle,
+avant que la première scène ne démarre ; un spec déjà en cache sur disque
+ne coûte qu'une lecture de SVG.
+"""
+
+import ast
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from manim import logger
+
+from manimtts.scenes import ROOT, deck_modules, deck_tempconfig
+from manimtts.variants import activate
+
+TEXT_CALLS = {"T", "Text"}
+TEX_CALLS = {"Tex", "MathTex"}
+PURE_CALLS = {"deck_data"}                 # sans effet de bord, évaluables ici
+STR_METHODS = {"join", "format", "upper", "lower", "replace", "strip"}
+MAX_DEPTH = 8
+WORKERS_DIR = ".workers"                  # sous media/texts et media/Tex
+
+
+class _Unknown(Exception):
+    """Expression non réductible à une constante."""
+
+
+_UNSET = object()   # variable locale de valeur inconnue (masque les globales)
+
+
+@dataclass(frozen=True)
+class TextSpec:
+    kind: str        # "Text", "Tex" ou "MathTex"
+    args: tuple
+    kwargs: tuple    # ((nom, valeur), ...) trié
+
+    def build(self):
+        import manim
+
+        return getattr(manim, self.kind)(*self.args, **dict(self.kwargs))
+
+
+class _Collector:
+    def __init__(self, module, tree: ast.Module, library: dict | None = None):
+        self.globals = vars(module)
+        self.functions = {**(library or {}),
+                          **{n.name: n for n in tree.body if isinstance(n, ast.FunctionDef)}}
+        self.classes = {n.name: n for n in tree.body if isinstance(n, ast.ClassDef)}
+        self.specs: set[TextSpec] = set()
+        self.depth = 0
+
+    # -- évaluation de constantes ------------------------------------------
+    def eval(self, node, env):
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            if node.id in env:
+                if env[node.id] is _UNSET:
+                    raise _Unknown(node.id)
+                return env[node.id]
+            if node.id in self.globals:
+                return self.globals[node.id]
+            raise _Unknown(node.id)
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return [self.eval(e, env) for e in node.elts]
+        if isinstance(node, ast.JoinedStr):
+            parts = []
+            for v in node.values:
+                if isinstance(v, ast.FormattedValue):
+                    value = self.eval(v.value, env)
+                    if v.conversion == ord("r"):
+                        value = repr(value)
+                    elif v.conversion == ord("s"):
+                        value = str(value)
+                    spec = self.eval(v.format_spec, env) if v.format_spec else ""
+                    parts.append(format(value, spec))
+                else:
+                    parts.append(v.value)
+            return "".join(parts)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            return self.eval(node.left, env) + self.eval(node.right, env)
+        if isinstance(node, ast.Attribute) and not node.attr.startswith("_"):
+            try:
+                return getattr(self.eval(node.value, env), node.attr)
+            except AttributeError:
+                raise _Unknown(node.attr)
+        if isinstance(node, ast.Call) and not node.keywords:
+            func = node.func
+            if isinstance(func, ast.Name) and func.id in PURE_CALLS and not node.args:
+                return self.eval(func, env)()
+            if isinstance(func, ast.Attribute) and func.attr in STR_METHODS:
+                target = self.eval(func.value, env)
+                if isinstance(target, str):
+                    return getattr(target, func.attr)(*[self.eval(a, env) for a in node.args])
+        raise _Unknown(ast.dump(node)[:40])
+
+    def _bind(self, target, value, env):
+        if isinstance(target, ast.Name):
+            env[target.id] = value
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for t, v in zip(target.elts, value):
+                self._bind(t, v, env)
+
+    def _unbind(self, target, env):
+        for n in ast.walk(target):
+            if isinstance(n, ast.Name):
+                env[n.id] = _UNSET
+
+    def _iterate(self, target, iter_node, env):
+        """Environnements successifs d'une boucle (un seul, non lié, si inconnu)."""
+        try:
+            values = list(self.eval(iter_node, env))
+        except (_Unknown, TypeError):
+            inner = dict(env)
+            self._unbind(target, inner)
+            yield inner
+            return
+        for value in values:
+            inner = dict(env)
+            try:
+                self._bind(target, value, inner)
+            except TypeError:
+                self._unbind(target, inner)
+            yield inner
+
+    # -- exécution abstraite -------------------------------------------------
+    def exec_body(self, body, env, ctx):
+        for stmt in body:
+            if isinstance(stmt, ast.FunctionDef):
+                ctx = {**ctx, "funcs": {**ctx["funcs"], stmt.name: stmt}}
+            elif isinstance(stmt, ast.For):
+                self.visit(stmt.iter, env, ctx)
+                for inner in self._iterate(stmt.target, stmt.iter, env):
+                    self.exec_body(stmt.body, inner, ctx)
+            elif isinstance(stmt, ast.Assign):
+                self.visit(stmt.value, env, ctx)
+                for target in stmt.targets:
+                    try:
+                        self._bind(target, self.eval(stmt.value, env), env)
+                    except (_Unknown, TypeError):
+                        self._unbind(target, env)
+            else:
+                for field in ("body", "orelse", "finalbody"):
+                    self.exec_body(getattr(stmt, field, []), env, ctx)
+                for child in ast.iter_child_nodes(stmt):
+                    if isinstance(child, ast.expr):
+                        self.visit(child, env, ctx)
+
+    def visit(self, node, env, ctx):
+        if isinstance(node, (ast.ListComp, ast.GeneratorExp, ast.SetComp)):
+            gen = node.generators[0]
+            self.visit(gen.iter, env, ctx)
+            for inner in self._iterate(gen.target, gen.iter, env):
+                self.visit(node.elt, inner, ctx)
+            return
+        if isinstance(node, ast.Call):
+            self._call(node, env, ctx)
+        for child in ast.iter_child_nodes(node):
+            self.visit(child, env, ctx)
+
+    def _call(self, node, env, ctx):
+        func = node.func
+        if isinstance(func, ast.Name) and func.id in TEXT_CALLS | TEX_CALLS:
+            self._record(func.id, node, env)
+        elif isinstance(func, ast.Name):
+            target = ctx["funcs"].get(func.id) or self.functions.get(func.id)
+            if target is not None:
+                self._inline(target, node, env, ctx, skip_self=False)
+        elif (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name)
+              and func.value.id == "self" and ctx.get("cls") is not None):
+            for item in ctx["cls"].body:
+                if isinstance(item, ast.FunctionDef) and item.name == func.attr:
+                    self._inline(item, node, env, ctx, skip_self=True)
+
+    def _inline(self, fdef, call, env, ctx, skip_self):
+        if self.depth >= MAX_DEPTH:
+            return
+        params = [a.arg for a in fdef.args.args][1 if skip_self else 0:]
+        defaults = fdef.args.defaults
+        local = dict.fromkeys(params, _UNSET)
+        for name, default in zip(params[len(params) - len(defaults):], defaults):
+            try:
+                local[name] = self.eval(default, {})
+            except _Unknown:
+                pass
+        for name, arg in zip(params, call.args):
+            try:
+                local[name] = self.eval(arg, env)
+            except _Unknown:
+                local[name] = _UNSET
+        for kw in call.keywords:
+            if kw.arg is None:
+                continue
+            try:
+                local[kw.arg] = self.eval(kw.value, env)
+            except _Unknown:
+                local[kw.arg] = _UNSET
+        self.depth += 1
+        try:
+            self.exec_body(fdef.body, local, ctx)
+        finally:
+            self.depth -= 1
+
+    def _record(self, name, call, env):
+        try:
+            args = tuple(self.eval(a, env) for a in call.args)
+            kwargs = {kw.arg: self.eval(kw.value, env) for kw in call.keywords if kw.arg}
+        except _Unknown:
+            return
+        if any(kw.arg is None for kw in call.keywords) or not args:
+            return
+        if not all(isinstance(a, str) for a in args):
+            return
+        if name in TEXT_CALLS:
+            if name == "T":
+                kwargs.setdefault("font", self.globals.get("FONT_SANS"))
+            kind = "Text"
+        else:
+            kind = name
+        try:
+            self.specs.add(TextSpec(kind, args, tuple(sorted(kwargs.items()))))
+        except TypeError:   # valeur non hachable : on laisse la scène s'en charger
+            pass
+
+    def run(self):
+        for cls in self.classes.values():
+            for item in cls.body:
+                if isinstance(item, ast.FunctionDef) and item.name == "construct":
+                    self.exec_body(item.body, {}, {"funcs": {}, "cls": cls})
+        return self.specs
+
+
+def _tree(module) -> ast.Module:
+    return ast.parse(Path(module.__file__).read_text(encoding="utf-8"))
+
+
+def collect_specs() -> set[TextSpec]:
+    """Tous les textes que les scènes demanderont, déduits de leur source.
+
+    Chaque module du deck est parcouru avec ses propres globales ; les
+    utilitaires de deck/common.py sont suivis depuis toutes les scènes.
+    """
+    common, *scenes = deck_modules()
+    library = {n.name: n for n in _tree(common).body if isinstance(n, ast.FunctionDef)}
+    specs = set()
+    for module in (common, *scenes):
+        specs |= _Collector(module, _tree(module), library).run()
+    return specs
+
+
+def _build_batch(specs: list[TextSpec], media_dir: str) -> int:
+    built = 0
+    # même configuration globale que les scènes (text_backend, ...)
+    with deck_tempconfig({"media_dir": media_dir}):
+        for spec in specs:
+            try:
+                spec.build()
+                built += 1
+            except Exception as exc:   # un texte invalide ne doit pas bloquer le rendu
+                logger.warning(f"prewarm : {spec.args[0]!r} ignoré ({exc})")
+    return built
+
+
+def prewarm(media_dir: Path = ROOT / "media", jobs: int | None = None, variants=()) -> int:
+    """Génère en parallèle les SVG de tous les textes ; renvoie leur nombre.
+
+    Avec ``variants``, l'ensemble couvre toutes les variantes (un texte commun
+    à plusieurs variantes n'est généré qu'une fois).
+    """
+    if variants:
+        found = set()
+        for variant in variants:
+            activate(variant)
+            found |= collect_specs()
+    else:
+        found = collect_specs()
+    specs = sorted(found, key=repr)
+    if not specs:
+        return 0
+    jobs = jobs or multiprocessing.cpu_count()
+    batches = [specs[i::jobs] for i in range(jobs) if specs[i::jobs]]
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(batches), mp_context=ctx) as pool:
+        built = sum(pool.map(_build_batch, batches, [str(media_dir)] * len(batches)))
+    logger.info(f"prewarm : {built}/{len(specs)} textes prêts")
+    return built
+
+
+def worker_text_dirs(media_dir) -> dict:
+    """``text_dir`` / ``tex_dir`` propres au processus courant (config Manim).
+
+    SVGMobject écrit ``<nom>_.svg`` à côté du SVG qu'il lit, puis l'efface :
+    deux workers qui construisent le même texte s'effacent ce fichier. Chaque
+    worker lit donc les SVG partagés (pré-générés) par des liens posés dans
+    son propre dossier ; ceux qu'il génère lui-même y restent.
+    """
+    dirs = {}
+    for key, name in (("text_dir", "texts"), ("tex_dir", "Tex")):
+        shared = Path(media_dir) / name
+        private = shared / WORKERS_DIR / str(os.getpid())
+        private.mkdir(parents=True, exist_ok=True)
+        present = set(os.listdir(private))
+        for entry in os.scandir(shared):
+            if entry.name in present or not entry.is_file() or not entry.name.endswith(".svg") \
+                    or entry.name.endswith("_.svg"):   # <nom>_.svg : fichier temporaire
+                continue
+            try:
+                os.link(entry.path, private / entry.name)
+            except FileExistsError:
+                pass
+            except OSError:   # système de fichiers sans liens physiques
+                shutil.copyfile(entry.path, private / entry.name)
+        dirs[key] = str(private)
+    return dirs
@@ -0,0 +1,197 @@
+"""
+Profil de rendu : où passe le temps de VideoComplet.
+
+Chaque segment de PLAYLIST est rendu normalement (images et film), mais
+avec le ProfilingRenderer, qui mesure pour chaque play()/wait() :
+- le temps total du play,
+- la rastérisation Cairo (update_frame),
+- l'envoi des images à ffmpeg (add_frame, blocage du tube compris),
+- le reste (hash, ouverture / fermeture du tube, updaters),
+- le nombre de mobjects et de points à l'écran et le pic de RSS.
+
+Le temps de construct() hors animations (création des Text, mise en page)
+est la différence entre le temps total et la somme des play.
+
+Sortie : ``report.json`` (détail par scène et par play) et ``trace.json``
+au format Chrome Trace Event, lisible par chrome://tracing, Perfetto ou
+speedscope (une ligne par segment).
+"""
+
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from manim import config, logger
+
+from manimtts.encoding import encoder_profile
+from manimtts.narration import narration_settings
+from manimtts.orchestrator import RenderJob, RenderOptions, plan_jobs, scene_class
+from manimtts.prewarm import worker_text_dirs
+from manimtts.renderers import DeckRenderer
+from manimtts.scenes import ROOT, deck_tempconfig
+from manimtts.timeline import animation_label
+
+PROFILE_DIR = ROOT / "media" / "profile"
+
+
+def peak_rss_mb() -> float:
+    """Pic de mémoire résidente du processus (Mo)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class PlayProfile:
+    index: int
+    label: str
+    start: float         # s depuis le début du segment
+    wall: float
+    raster: float
+    encode: float
+    frames: int
+    mobjects: int
+    points: int
+    peak_rss_mb: float
+
+    @property
+    def other(self) -> float:
+        return self.wall - self.raster - self.encode
+
+
+@dataclass
+class SceneProfile:
+    job: str
+    wall: float = 0.0
+    plays: list[PlayProfile] = field(default_factory=list)
+    peak_rss_mb: float = 0.0
+
+    @property
+    def construct(self) -> float:
+        return self.wall - sum(p.wall for p in self.plays)
+
+    def as_dict(self) -> dict:
+        plays = [{**asdict(p), "other": p.other} for p in self.plays]
+        return {
+            "job": self.job,
+            "wall": self.wall,
+            "construct": self.construct,
+            "raster": sum(p.raster for p in self.plays),
+            "encode": sum(p.encode for p in self.plays),
+            "frames": sum(p.frames for p in self.plays),
+            "peak_rss_mb": self.peak_rss_mb,
+            "plays": plays,
+        }
+
+
+class ProfilingRenderer(DeckRenderer):
+    """DeckRenderer instrumenté (temps par play, rastérisation, encodage)."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.plays: list[PlayProfile] = []
+        self.origin = time.perf_counter()
+        self._raster = self._encode = 0.0
+        self._frames = 0
+
+    def play(self, scene, *args, **kwargs):
+        self._raster = self._encode = 0.0
+        self._frames = 0
+        t0 = time.perf_counter()
+        super().play(scene, *args, **kwargs)
+        wall = time.perf_counter() - t0
+        family = [m for top in scene.mobjects for m in top.get_family()]
+        self.plays.append(PlayProfile(
+            index=len(self.plays),
+            label=animation_label(scene.animations or []),
+            start=t0 - self.origin,
+            wall=wall,
+            raster=self._raster,
+            encode=self._encode,
+            frames=self._frames,
+            mobjects=len(family),
+            points=sum(len(m.points) for m in family),
+            peak_rss_mb=peak_rss_mb(),
+        ))
+
+    def update_frame(self, *args, **kwargs):
+        t0 = time.perf_counter()
+        super().update_frame(*args, **kwargs)
+        self._raster += time.perf_counter() - t0
+
+    def add_frame(self, frame, num_frames: int = 1):
+        t0 = time.perf_counter()
+        super().add_frame(frame, num_frames)
+        self._encode += time.perf_counter() - t0
+        if not self.skip_animations:
+            self._frames += num_frames
+
+    def freeze_current_frame(self, duration: float):
+        t0 = time.perf_counter()
+        super().freeze_current_frame(duration)
+        self._encode += time.perf_counter() - t0
+        if not self.skip_animations:
+            self._frames += int(duration / (1 / config.frame_rate))
+
+
+def profile_job(job: RenderJob, options: RenderOptions) -> dict:
+    """Rend un segment avec le ProfilingRenderer ; renvoie son profil."""
+    cfg = {**options.manim_config(f"profile_{job.name}"), "disable_caching": True,
+           **worker_text_dirs(options.media_dir)}
+    with deck_tempconfig(cfg), \
+            encoder_profile(options.encoder_name()), narration_settings(options.narration):
+        renderer = ProfilingRenderer()
+        scene = scene_class(job)(renderer=renderer)
+        t0 = time.perf_counter()
+        scene.render()
+        wall = time.perf_counter() - t0
+    profile = SceneProfile(job.name, wall, renderer.plays, peak_rss_mb())
+    return profile.as_dict()
+
+
+def chrome_trace(profiles: list[dict]) -> dict:
+    """Profils → Chrome Trace Event (une ligne par segment, en µs)."""
+    events = []
+    for tid, prof in enumerate(profiles):
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid,
+                       "args": {"name": prof["job"]}})
+        events.append({"name": prof["job"], "cat": "scene", "ph": "X", "pid": 1, "tid": tid,
+                       "ts": 0, "dur": prof["wall"] * 1e6,
+                       "args": {"construct_s": prof["construct"], "frames": prof["frames"]}})
+        for play in prof["plays"]:
+            events.append({
+                "name": play["label"] or "play", "cat": "play", "ph": "X", "pid": 1, "tid": tid,
+                "ts": play["start"] * 1e6, "dur": play["wall"] * 1e6,
+                "args": {k: play[k] for k in ("raster", "encode", "other", "frames",
+                                              "mobjects", "points")},
+            })
+            events.append({"name": f"{prof['job']} mémoire", "ph": "C", "pid": 1,
+                           "ts": (play["start"] + play["wall"]) * 1e6,
+                           "args": {"rss_mb": play["peak_rss_mb"]}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def profile_video(out_dir: Path = PROFILE_DIR, options: RenderOptions = RenderOptions(),
+                  jobs: int | None = None, scenes=()) -> Path:
+    """Profile les segments (un processus neuf par segment : pic de RSS propre)."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    plan = [job for job in plan_jobs() if not scenes or job.scene in scenes]
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx, max_tasks_per_child=1) as pool:
+        profiles = list(pool.map(profile_job, plan, [options] * len(plan)))
+
+    report = out_dir / "report.json"
+    report.write_text(json.dumps(profiles, indent=2, ensure_ascii=False))
+    (out_dir / "trace.json").write_text(json.dumps(chrome_trace(profiles)))
+    for prof in sorted(profiles, key=lambda p: p["wall"], reverse=True):
+        logger.info(
+            f"{prof['job']:<28} {prof['wall']:7.1f}s  construct {prof['construct']:5.1f}s  "
+            f"raster {prof['raster']:6.1f}s  encode {prof['encode']:6.1f}s  "
+            f"{prof['peak_rss_mb']:6.0f} Mo"
+        )
+    return report
@@ -0,0 +1,108 @@
+"""
+Renderers Cairo : celui des scènes du deck et ceux des outils (mesure, lint, ...).
+"""
+
+from manim import config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.exceptions import EndSceneEarlyException
+
+from manimtts.encoding import DeckFileWriter
+from manimtts.fingerprint import play_fingerprint
+
+
+class DeckRenderer(CairoRenderer):
+    """Renderer des scènes du deck : écriture par DeckFileWriter.
+
+    Un wait() figé (aucun updater) n'est rastérisé qu'une fois, puis
+    confié à ``DeckFileWriter.hold_frame`` qui laisse ffmpeg le répéter.
+
+    Les films partiels sont nommés par ``play_fingerprint`` (voir
+    fingerprint.py) au lieu du hash JSON de Manim : après une retouche, seuls
+    les plays dont l'empreinte change sont de nouveau rastérisés.
+
+    Rendu d'une partie de scène (``from_animation_number`` /
+    ``upto_animation_number``) : ``movie_start`` est l'instant de la scène où
+    commence le film, ``ended_early`` indique que la scène a été coupée.
+    """
+
+    movie_start: float | None = None
+    ended_early = False
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("file_writer_class", DeckFileWriter)
+        super().__init__(**kwargs)
+
+    def play(self, scene, *args, **kwargs):
+        # CairoRenderer.play (Manim 0.18), clé du segment mise à part
+        self.skip_animations = self._original_skipping_status
+        self.update_skipping_status()
+        scene.compile_animation_data(*args, **kwargs)
+
+        key = self.segment_key(scene)
+        self.file_writer.add_partial_movie_file(key)
+        self.animations_hashes.append(key)
+
+        self.file_writer.begin_animation(not self.skip_animations)
+        scene.begin_animations()
+        self.save_static_frame_data(scene, scene.static_mobjects)
+        if scene.is_current_animation_frozen_frame():
+            self.update_frame(scene, mobjects=scene.moving_mobjects)
+            self.freeze_current_frame(scene.duration)
+        else:
+            scene.play_internal()
+        self.file_writer.end_animation(not self.skip_animations)
+        self.num_plays += 1
+
+    def update_skipping_status(self):
+        try:
+            super().update_skipping_status()
+        except EndSceneEarlyException:
+            self.ended_early = True
+            raise
+
+    def segment_key(self, scene) -> str | None:
+        """Nom du film partiel du play ; saute le rendu s'il existe déjà."""
+        if self.skip_animations:
+            self.time += scene.duration
+            return None
+        if self.movie_start is None:
+            self.movie_start = self.time
+        if config.disable_caching:
+            return f"uncached_{self.num_plays:05}"
+        key = play_fingerprint(scene, self.camera)
+        if self.file_writer.is_already_cached(key):
+            logger.info(f"Play {self.num_plays} : segment inchangé ({key})")
+            self.skip_animations = True
+            self.time += scene.duration
+        return key
+
+    def freeze_current_frame(self, duration: float):
+        dt = 1 / config.frame_rate
+        num_frames = int(duration / dt)
+        if self.skip_animations:
+            return
+        self.time += num_frames * dt
+        self.file_writer.hold_frame(self.get_frame(), num_frames)
+
+
+class NullRenderer(CairoRenderer):
+    """Exécute construct() et les animations sans rastériser ni encoder.
+
+    Les animations sont sautées (un seul pas par play, état final correct),
+    aucune image n'est dessinée : seuls le placement des mobjects et le
+    calendrier des animations sont calculés. À utiliser sous
+    ``tempconfig({"dry_run": True, ...})`` pour ne rien écrire sur disque.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("skip_animations", True)
+        super().__init__(**kwargs)
+
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def add_frame(self, *args, **kwargs):
+        pass
+
+    def freeze_current_frame(self, duration: float):
+        pass
@@ -0,0 +1,82 @@
+"""
+Accès aux scènes du paquet ``deck`` depuis les outils.
+
+``deck`` n'importe rien par lui-même : ``deck.SCENES`` associe chaque classe
+à son module et ``load_scene`` n'importe que le module demandé. Un worker
+qui rend une seule scène ne paie donc que ses propres imports.
+"""
+
+import importlib
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DECK_DIR = ROOT / "deck"
+DECK_PACKAGE = "deck"
+
+
+def registry():
+    """Le paquet ``deck`` (index des scènes et PLAYLIST, sans Manim)."""
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    return importlib.import_module(DECK_PACKAGE)
+
+
+def load_scene(name: str):
+    """Classe de scène ``name`` ; LookupError si elle n'existe pas."""
+    return registry().load(name)
+
+
+def load_common():
+    """Module ``deck.common`` (thème, utilitaires T, under_title, ...)."""
+    registry()
+    return importlib.import_module(f"{DECK_PACKAGE}.common")
+
+
+def load_theme():
+    """Module ``deck.theme`` (palette et réglages Manim, sans outils)."""
+    registry()
+    return importlib.import_module(f"{DECK_PACKAGE}.theme")
+
+
+@contextmanager
+def deck_tempconfig(cfg: dict):
+    """``tempconfig(cfg)`` par-dessus les réglages du deck (fond, texte, graine).
+
+    Les réglages de deck/theme.py ne s'exécutent qu'au premier import ;
+    chaque job les rappelle ici, puis applique ``cfg`` à la suite.
+    """
+    from manim import config, tempconfig   # ce module reste importable sans Manim
+
+    with tempconfig({}):
+        load_theme().apply_config()
+        config.update(cfg)
+        yield
+
+
+def deck_modules() -> list:
+    """Tous les modules de scènes, ``deck.common`` en tête (outils statiques)."""
+    names = dict.fromkeys([f"{DECK_PACKAGE}.common", *registry().SCENES.values()])
+    return [importlib.import_module(name) for name in names]
+
+
+def is_deck_module(name: str | None) -> bool:
+    return name == DECK_PACKAGE or (name or "").startswith(DECK_PACKAGE + ".")
+
+
+def reload_deck():
+    """Oublie les modules du deck : le prochain import relit thème et données."""
+    for name in [n for n in sys.modules if is_deck_module(n)]:
+        del sys.modules[name]
+    importlib.invalidate_caches()
+
+
+def transition_scene(title: str, index: int):
+    """Sous-classe de TransitionCard pour un titre donné."""
+    card = load_scene("TransitionCard")
+    return type(
+        f"Transition{index:02d}",
+        (card,),
+        {"title": title, "__module__": card.__module__},
+    )
@@ -0,0 +1,75 @@
+"""
+Mémoïsation des ``Text`` (Pango) pour tout le processus.
+
+Construire un ``Text`` relit et convertit le SVG produit par Pango dans
+media/texts ; une copie profonde d'un prototype déjà construit coûte bien
+moins cher. Les prototypes ne sont jamais renvoyés tels quels : chaque appel
+reçoit sa propre copie, que la scène peut déplacer ou animer librement.
+"""
+
+import os
+from collections import OrderedDict
+
+from manim import Text
+
+# Champs nommés de la clé ; les autres kwargs sont ajoutés triés à la suite.
+KEY_FIELDS = ("font", "font_size", "weight", "slant", "color", "line_spacing")
+
+
+def _hashable(value):
+    try:
+        hash(value)
+        return value
+    except TypeError:   # ManimColor, dict t2c, ...
+        return repr(value)
+
+
+class TextCache:
+    """Cache LRU de prototypes ``Text`` avec compteurs de hits / misses."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._protos: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def key(text: str, kw: dict) -> tuple:
+        named = tuple(_hashable(kw.get(k)) for k in KEY_FIELDS)
+        extra = tuple(sorted((k, _hashable(v)) for k, v in kw.items() if k not in KEY_FIELDS))
+        return (text, *named, extra)
+
+    def get(self, text: str, **kw) -> Text:
+        if self.maxsize <= 0:
+            self.misses += 1
+            return Text(text, **kw)
+
+        key = self.key(text, kw)
+        proto = self._protos.get(key)
+        if proto is None:
+            self.misses += 1
+            proto = Text(text, **kw)
+            self._protos[key] = proto
+            if len(self._protos) > self.maxsize:
+                self._protos.popitem(last=False)
+        else:
+            self.hits += 1
+            self._protos.move_to_end(key)
+        return proto.copy()
+
+    def clear(self):
+        self._protos.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._protos),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# Instance partagée par T() ; MANIMTTS_TEXT_CACHE=0 désactive le cache.
+TEXT_CACHE = TextCache(maxsize=int(os.environ.get("MANIMTTS_TEXT_CACHE", "512")))
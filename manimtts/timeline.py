@@ -0,0 +1,266 @@
+"""
+Calendrier des scènes : durée de chaque play()/wait() et budgets.
+
+Les scènes du deck héritent de ``DeckScene`` : chaque appel à ``play`` (et
+donc à ``wait``) ajoute un ``Segment`` à ``self.timeline``, sans compteur
+à tenir à la main. ``measure_scene`` exécute construct() avec le
+NullRenderer (aucune image dessinée) : la durée de toute la vidéo se
+calcule en quelques secondes et se compare aux ``TARGET_SECONDS``.
+``wait(cue=...)`` cale une attente sur un repère de la narration : la
+durée est connue dès cette mesure (voir ``manimtts.narration``).
+
+Les outils (renderers, narration, animations) ne sont importés qu'à
+l'usage : ``from manimtts.timeline import DeckScene`` ne charge que Manim.
+"""
+
+import dataclasses
+import gc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from manim import (
+    DEFAULT_WAIT_TIME, Camera, RendererType, Scene, Wait, config, logger, tempconfig,
+)
+
+if TYPE_CHECKING:
+    from manimtts.narration import Narration
+    from manimtts.renderers import NullRenderer
+
+BUDGET_TOLERANCE = 0.10   # écart relatif toléré avant de signaler une scène
+
+
+@dataclass(frozen=True)
+class Segment:
+    kind: str          # "play" ou "wait"
+    start: float       # secondes depuis le début de la scène
+    duration: float
+    label: str
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+@dataclass
+class SceneTiming:
+    scene: str
+    target: float | None
+    segments: list[Segment] = field(default_factory=list)
+
+    @property
+    def total(self) -> float:
+        return self.segments[-1].end if self.segments else 0.0
+
+    @property
+    def delta(self) -> float | None:
+        return None if self.target is None else self.total - self.target
+
+    def over_budget(self, tolerance: float = BUDGET_TOLERANCE) -> bool:
+        return self.target is not None and abs(self.delta) > tolerance * self.target
+
+    def as_dict(self) -> dict:
+        return {
+            "scene": self.scene,
+            "target": self.target,
+            "total": round(self.total, 3),
+            "segments": [
+                {"kind": s.kind, "start": round(s.start, 3),
+                 "duration": round(s.duration, 3), "label": s.label}
+                for s in self.segments
+            ],
+        }
+
+
+def animation_label(animations) -> str:
+    names = [type(a).__name__ for a in animations]
+    return ", ".join(names[:3]) + (f", +{len(names) - 3}" if len(names) > 3 else "")
+
+
+class DeckScene(Scene):
+    """Scène du deck : enregistre son calendrier et vérifie son budget."""
+
+    TARGET_SECONDS: float | None = None
+    NARRATION: str = ""          # script SSML (voir manimtts.narration)
+    narration: "Narration | None" = None
+    cue_origin: float = 0.0      # position de la scène dans le calendrier (repères)
+    _batch: list | None = None   # file des play() d'un bloc batched()
+
+    def __init__(self, renderer=None, camera_class=Camera, **kwargs):
+        self.timeline: list[Segment] = []
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            from manimtts.renderers import DeckRenderer
+            renderer = DeckRenderer(camera_class=camera_class,
+                                    skip_animations=kwargs.get("skip_animations", False))
+        super().__init__(renderer=renderer, camera_class=camera_class, **kwargs)
+
+    @property
+    def clock(self) -> float:
+        """Position courante dans la scène (s)."""
+        return self.timeline[-1].end if self.timeline else 0.0
+
+    def play(self, *args, **kwargs):
+        if self._batch is not None:
+            from manimtts.animations import compile_play
+            self._batch.append(compile_play(*args, **kwargs))
+            return
+        start = self.clock
+        super().play(*args, **kwargs)
+        animations = getattr(self, "animations", None) or []
+        kind = "wait" if animations and all(isinstance(a, Wait) for a in animations) else "play"
+        self.timeline.append(Segment(kind, start, self.duration, animation_label(animations)))
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, stop_condition=None,
+             frozen_frame: bool | None = None, cue: str | None = None):
+        """``cue`` : attendre que la narration atteigne ``<mark name=cue/>``.
+
+        La durée donnée ne sert alors que sans narration (MANIMTTS_NARRATION=0) ;
+        sinon elle est allongée ou raccourcie d'après la durée des clips
+        synthétisés (``narration.END`` : fin du script).
+        """
+        from manimtts import narration
+
+        if cue is None or not narration.enabled():
+            super().wait(duration, stop_condition, frozen_frame)
+            return
+        if self._batch is not None:
+            raise RuntimeError("wait(cue=...) n'est pas pris en charge dans un bloc batched()")
+        times = narration.cue_times(self.NARRATION)
+        if cue not in times:
+            raise LookupError(f"{type(self).__name__} : repère {cue!r} absent de NARRATION "
+                              f"({', '.join(times)})")
+        fitted = max(self.cue_origin + times[cue] - self.clock, 1 / config.frame_rate)
+        super().wait(fitted, stop_condition, frozen_frame)
+        self.timeline[-1] = dataclasses.replace(self.timeline[-1], label=f"Wait @{cue}")
+
+    @contextmanager
+    def batched(self):
+        """Regroupe les play()/wait() du bloc en un seul segment ``Batch``.
+
+        Même rendu que des appels successifs, mais un seul fichier partiel
+        (un hash, un démarrage d'encodeur). Les cibles de ``.animate`` et les
+        mobjects passés aux animations sont construits à la mise en file :
+        le bloc ne doit pas lire l'état produit par ses propres animations.
+        ``wait(stop_condition=...)`` n'est pas pris en charge dans un bloc.
+        """
+        if self._batch is not None:   # bloc imbriqué : fusionné dans le parent
+            yield
+            return
+        self._batch = []
+        try:
+            yield
+        finally:
+            queued, self._batch = self._batch, None
+        if queued:
+            from manimtts.animations import Batch
+            self.play(Batch(*queued))
+
+    @contextmanager
+    def embedded(self, scene_cls):
+        """Sous-scène jouée sur le renderer (et le calendrier) de cette scène.
+
+        Elle est libérée à la sortie du bloc (voir ``release``) : une vidéo
+        qui enchaîne les scènes n'en garde qu'une en mémoire à la fois.
+        Sa narration est posée à sa propre position dans le film.
+        """
+        writer = self.renderer.file_writer
+        sub = scene_cls(renderer=self.renderer)
+        self.renderer.file_writer = writer   # init_scene en a créé un pour la sous-scène
+        sub.timeline = self.timeline
+        sub.cue_origin = self.clock
+        from manimtts.narration import Narration
+        sub.narration = Narration.begin(sub)
+        try:
+            yield sub
+            sub.end_narration()
+        finally:
+            sub.release()
+            gc.collect()   # mobjects et updaters forment des cycles
+
+    def release(self):
+        """Détache mobjects, updaters et animations d'une scène déjà jouée."""
+        for mob in self.get_mobject_family_members():
+            mob.clear_updaters()
+        self.clear()
+        self.updaters = []
+        self.moving_mobjects = []
+        self.static_mobjects = []
+        self.animations = None
+        self.renderer.static_image = None
+
+    def get_moving_mobjects(self, *animations):
+        from manimtts.animations import Batch
+
+        expanded = []
+        for animation in animations:
+            expanded.append(animation)
+            if isinstance(animation, Batch):
+                expanded += animation.leaves()
+        return super().get_moving_mobjects(*expanded)
+
+    def timing(self) -> SceneTiming:
+        return SceneTiming(type(self).__name__, self.TARGET_SECONDS, list(self.timeline))
+
+    @classmethod
+    def prefetch_narration(cls):
+        """Lance la synthèse du script sans attendre le début de la scène."""
+        from manimtts.narration import prefetch
+        prefetch([cls.NARRATION])
+
+    def end_narration(self):
+        if self.narration is not None:
+            self.narration.attach(self)
+            self.narration = None
+
+    def setup(self):
+        from manimtts.narration import Narration
+
+        super().setup()
+        self.narration = Narration.begin(self)   # synthèse pendant le rendu
+
+    def tear_down(self):
+        super().tear_down()
+        self.end_narration()
+        timing = self.timing()
+        if timing.over_budget() and not getattr(self.renderer, "ended_early", False):
+            logger.warning(
+                f"{timing.scene} : {timing.total:.1f}s pour un budget de "
+                f"{timing.target:.0f}s ({timing.delta:+.1f}s)"
+            )
+
+
+def measure_scene(scene_cls, renderer: "NullRenderer | None" = None) -> SceneTiming:
+    """Calendrier d'une scène, sans rastérisation ni encodage."""
+    from manimtts.renderers import NullRenderer
+
+    if not issubclass(scene_cls, DeckScene):
+        raise TypeError(f"{scene_cls.__name__} n'hérite pas de DeckScene")
+    with tempconfig({"dry_run": True, "disable_caching": True, "preview": False}):
+        scene = scene_cls(renderer=renderer or NullRenderer())
+        scene.render()
+    return scene.timing()
+
+
+def measure_video() -> list[SceneTiming]:
+    """Calendrier de chaque segment de PLAYLIST (scènes et transitions), dans l'ordre."""
+    # import local : une scène qui importe DeckScene ne charge pas l'orchestrateur
+    from manimtts.orchestrator import plan_jobs, scene_class
+
+    return [measure_scene(scene_class(job)) for job in plan_jobs()]
+
+
+def format_report(timings: list[SceneTiming], target: float | None,
+                  tolerance: float = BUDGET_TOLERANCE) -> str:
+    lines = [f"{'scène':<28} {'début':>8} {'durée':>8} {'budget':>8} {'écart':>8}"]
+    start = 0.0
+    for t in timings:
+        budget = f"{t.target:8.1f}" if t.target is not None else f"{'-':>8}"
+        delta = f"{t.delta:+8.1f}" if t.target is not None else f"{'':>8}"
+        flag = "  !" if t.over_budget(tolerance) else ""
+        lines.append(f"{t.scene:<28} {start:8.1f} {t.total:8.1f} {budget} {delta}{flag}")
+        start += t.total
+    total = f"{'total':<28} {'':>8} {start:8.1f}"
+    if target is not None:
+        total += f" {target:8.1f} {start - target:+8.1f}"
+    lines.append(total)
+    return "\n".join(lines)
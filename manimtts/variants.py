@@ -0,0 +1,81 @@
+"""
+Variantes de la présentation : un fichier de données et une palette.
+
+Une variante est décrite dans un fichier JSON (liste d'objets) ::
+
+    [
+      {"name": "icnlsp-fr"},
+      {"name": "interspeech-en",
+       "data": "extracted_data/data_extraction_en.json",
+       "theme": {"ACCENT_YELLOW": "#FFB000", "FONT_SANS": "Inter"}}
+    ]
+
+``data`` est relatif au fichier de variantes ; ``theme`` remplace les
+constantes de thème de deck/theme.py (voir THEME_KEYS). Activer une
+variante positionne MANIMTTS_DATA / MANIMTTS_THEME puis oublie les modules
+du deck, relus au prochain import : les caches de processus (textes Pango,
+images) restent partagés d'une variante à l'autre.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from manimtts.data import DATA_FILE
+from manimtts.scenes import reload_deck
+
+THEME_KEYS = (
+    "BG_COLOR", "ACCENT_BLUE", "ACCENT_YELLOW", "ACCENT_PURPLE", "ACCENT_CYAN",
+    "TEXT_COLOR", "HI_GREY", "FONT_SANS",
+)
+
+
+@dataclass(frozen=True)
+class Variant:
+    name: str
+    data: Path | None = None
+    theme: tuple = ()          # ((constante, valeur), ...) trié
+
+    @classmethod
+    def from_env(cls, name: str = "default") -> "Variant":
+        """Variante décrite par l'environnement courant (rendu simple)."""
+        data = os.environ.get("MANIMTTS_DATA")
+        theme = json.loads(os.environ.get("MANIMTTS_THEME") or "{}")
+        return cls(name, Path(data) if data else None, tuple(sorted(theme.items())))
+
+
+def load_variants(path: Path) -> list[Variant]:
+    """Lit un fichier de variantes ; lève ValueError s'il est incohérent."""
+    path = Path(path)
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    variants, seen = [], set()
+    for entry in entries:
+        name = entry["name"]
+        if name in seen:
+            raise ValueError(f"variante en double : {name!r}")
+        seen.add(name)
+        theme = entry.get("theme", {})
+        unknown = sorted(set(theme) - set(THEME_KEYS))
+        if unknown:
+            raise ValueError(f"{name} : constantes de thème inconnues {unknown}")
+        data = entry.get("data")
+        variants.append(Variant(
+            name,
+            (path.parent / data).resolve() if data else None,
+            tuple(sorted(theme.items())),
+        ))
+    return variants
+
+
+_active: Variant | None = None
+
+
+def activate(variant: Variant):
+    """Rend ``variant`` courante dans ce processus (scènes rechargées au besoin)."""
+    global _active
+    if variant != _active:
+        os.environ["MANIMTTS_DATA"] = str(variant.data or DATA_FILE)
+        os.environ["MANIMTTS_THEME"] = json.dumps(dict(variant.theme))
+        reload_deck()
+        _active = variant
@@ -0,0 +1,6 @@
+"""Les tests importent ``deck`` et ``manimtts`` depuis la racine du dépôt."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
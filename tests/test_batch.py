@@ -0,0 +1,45 @@
+"""Plays regroupés par ``DeckScene.batched`` (``Batch``)."""
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import (  # noqa: E402
+    RIGHT, AnimationGroup, Circle, FadeIn, Scene, Square, Triangle, Wait, tempconfig,
+)
+
+from manimtts.animations import Batch, compile_play  # noqa: E402
+
+
+def test_leaves_unfold_nested_groups_in_order():
+    first, second, third = FadeIn(Square()), FadeIn(Circle()), FadeIn(Triangle())
+    pause = Wait(1)
+    batch = Batch(AnimationGroup(first, AnimationGroup(second, third)), pause)
+    assert [id(a) for a in batch.leaves()] == [id(a) for a in (first, second, third, pause)]
+
+
+def test_mobjects_enter_the_scene_play_by_play():
+    scene = Scene()
+    square, circle, triangle = Square(), Circle(), Triangle()
+    batch = Batch(
+        FadeIn(square),
+        Wait(1),
+        FadeIn(circle),
+        compile_play(triangle.animate.shift(RIGHT)),
+    )
+    batch._setup_scene(scene)
+    batch.begin()
+    seen = []
+    for t in (0.5, 1.5, 2.5, 3.5):
+        batch.interpolate(t / batch.run_time)
+        seen.append([id(m) for m in scene.mobjects])
+    a, b, c = id(square), id(circle), id(triangle)
+    assert seen == [[a], [a], [a, b], [a, b, c]]
+
+
+def test_each_play_lasts_whole_frames():
+    with tempconfig({"frame_rate": 10}):
+        batch = Batch(Wait(0.51), Wait(0.51), Wait(0.3))
+    # joués un par un : 6 + 6 + 3 images, et non ceil(1.32 × 10) = 14
+    assert [a.run_time for a in batch.animations] == pytest.approx([0.6, 0.6, 0.3])
+    assert batch.run_time == pytest.approx(1.5)
@@ -0,0 +1,115 @@
+"""Clé du cache de scènes (``scene_fingerprint``) : stable, et invalidée par
+le source, les constantes, les données et les images d'une scène."""
+
+import importlib.util
+import itertools
+import json
+import os
+import sys
+import textwrap
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manimtts import cache  # noqa: E402
+from manimtts.cache import scene_fingerprint  # noqa: E402
+
+SETTINGS = {"quality": "low_quality", "frame_rate": 15}
+_TICKS = itertools.count(1)
+
+PROBE = '''
+from deck.common import *
+
+SIZE = {size}
+
+
+class SceneProbe(DeckScene):
+    DATA = ("pdf_data.title",)
+
+    def construct(self):
+        self.add(load_img("probe"), Square({side}).scale(SIZE))
+'''
+
+
+def _write(path, content):
+    """Écrit ``path`` avec une mtime neuve (les caches de fichiers s'y fient)."""
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content)
+    tick = next(_TICKS) * 10**9
+    os.utime(path, ns=(tick, tick))
+
+
+@pytest.fixture
+def probe(tmp_path, monkeypatch):
+    """Écrit puis importe ``deck._probe`` ; renvoie sa classe de scène."""
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    _write(assets / "probe.png", b"first")
+    monkeypatch.setattr(cache, "ROOT", tmp_path)
+    monkeypatch.setattr(cache, "ASSETS_DIR", assets)
+    data = tmp_path / "data.json"
+    _write(data, json.dumps({"pdf_data": {"title": "A", "conference": "X"}}))
+    monkeypatch.setenv("MANIMTTS_DATA", str(data))
+    path = tmp_path / "_probe.py"
+
+    def load(size=2.0, side="1.0"):
+        _write(path, textwrap.dedent(PROBE.format(size=size, side=side)))
+        spec = importlib.util.spec_from_file_location("deck._probe", path)
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, "deck._probe", module)
+        spec.loader.exec_module(module)
+        return module.SceneProbe
+
+    load.assets, load.data = assets, data
+    return load
+
+
+def test_stable_across_calls_and_reimports(probe):
+    key = scene_fingerprint(probe(), SETTINGS)
+    assert scene_fingerprint(probe(), SETTINGS) == key
+    assert scene_fingerprint(probe(), dict(SETTINGS)) == key
+
+
+def test_render_settings_change_the_key(probe):
+    scene = probe()
+    assert scene_fingerprint(scene, SETTINGS) != scene_fingerprint(
+        scene, {**SETTINGS, "frame_rate": 30}
+    )
+
+
+def test_source_edit_changes_the_key(probe):
+    key = scene_fingerprint(probe(side="1.0"), SETTINGS)
+    assert scene_fingerprint(probe(side="1.5"), SETTINGS) != key
+
+
+def test_constant_changes_the_key(probe):
+    key = scene_fingerprint(probe(size=2.0), SETTINGS)
+    assert scene_fingerprint(probe(size=3.0), SETTINGS) != key
+
+
+def test_only_declared_data_changes_the_key(probe):
+    scene = probe()
+    key = scene_fingerprint(scene, SETTINGS)
+    _write(probe.data, json.dumps({"pdf_data": {"title": "A", "conference": "Y"}}))
+    assert scene_fingerprint(scene, SETTINGS) == key
+    _write(probe.data, json.dumps({"pdf_data": {"title": "B", "conference": "Y"}}))
+    assert scene_fingerprint(scene, SETTINGS) != key
+
+
+def test_asset_content_changes_the_key(probe):
+    scene = probe()
+    key = scene_fingerprint(scene, SETTINGS)
+    _write(probe.assets / "probe.png", b"second version")
+    assert scene_fingerprint(scene, SETTINGS) != key
+
+
+def test_tooling_stops_at_frame_modules(probe):
+    from manimtts import timeline
+
+    deps = cache._Dependencies()
+    deps.use_tooling(timeline)
+    assert {"manimtts.timeline", "manimtts.renderers", "manimtts.narration"} <= set(deps.tooling)
+    assert set(deps.tooling) <= cache.FRAME_MODULES   # pas orchestrator, bench, lint, ...
@@ -0,0 +1,54 @@
+"""Champs du fichier de données lus par les scènes, et leur déclaration ``DATA``."""
+
+from manimtts.data import BreakPrediction, Paper, deck_data, recording_reads, undeclared
+
+
+def test_reads_are_recorded_by_json_path():
+    data = deck_data()
+    with recording_reads() as reads:
+        data.paper.title_lines
+        data.objective.qwen_a.f1_score
+        data.subjective.preference
+    assert reads == {
+        "pdf_data.title",
+        "pdf_data.evaluation_objective.qwen_a_break_prediction.f1_score",
+        "pdf_data.evaluation_subjective.preference_count",
+    }
+
+
+def test_nothing_is_recorded_outside_the_block():
+    with recording_reads() as reads:
+        pass
+    deck_data().paper.title
+    assert reads == set()
+
+
+def test_declared_sections_cover_their_fields():
+    reads = {"pdf_data.title", "pdf_data.evaluation_objective.bert_baseline.f1_score"}
+    assert undeclared(reads, ("pdf_data.title", "pdf_data.evaluation_objective")) == []
+    assert undeclared(reads, ("pdf_data.title", "pdf_data.evaluation_objective.qwen_a")) == [
+        "pdf_data.evaluation_objective.bert_baseline.f1_score"
+    ]
+    assert undeclared({"pdf_data.titles"}, ("pdf_data.title",)) == ["pdf_data.titles"]
+
+
+def _paper(title="Prosody Enrichment via Cascaded Models", authors=("A. One", "B. Two", "C. Three")):
+    return Paper(title=title, authors=authors, affiliations=(), conference="X")
+
+
+def test_title_lines_cut_before_a_function_word():
+    assert _paper().title_lines == ("Prosody Enrichment", "via Cascaded Models")
+    assert _paper(title="ManimTTS").title_lines == ("ManimTTS", "")
+
+
+def test_author_lines_end_with_a_comma_only_before_a_second_line():
+    assert _paper().author_lines == ("A. One, B. Two,", "C. Three")
+    assert _paper(authors=("A. One",)).author_lines == ("A. One", "")
+
+
+def test_f1_score_percent_defaults_to_the_rounded_f1_score():
+    assert BreakPrediction(f1_score=92.06, perplexity=1.1).f1_score_percent == 92.1
+    assert BreakPrediction(f1_score=99.24, perplexity=1.0, f1_score_percent=99.0).f1_score_percent == 99.0
+    with recording_reads() as reads:
+        BreakPrediction(f1_score=92.06, perplexity=1.1)
+    assert reads == set()
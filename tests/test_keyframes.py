@@ -0,0 +1,19 @@
+"""Export des images clés d'un segment."""
+
+import pytest
+
+pytest.importorskip("manim")
+
+from PIL import Image  # noqa: E402
+
+from manimtts.keyframes import export_job  # noqa: E402
+from manimtts.orchestrator import RenderJob  # noqa: E402
+
+
+def test_one_png_per_play_and_wait(tmp_path):
+    frames = export_job(RenderJob(1, "Keyframes test", transition=True), "low_quality", tmp_path)
+    # carte de transition : play, wait, play, wait
+    assert [f["kind"] for f in frames] == ["play", "wait", "play", "wait"]
+    for frame in frames:
+        with Image.open(frame["path"]) as im:
+            assert im.size == (854, 480)
@@ -0,0 +1,84 @@
+"""Narration : durée estimée par le backend silencieux, repères ``<mark>``."""
+
+import wave
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manimtts import narration  # noqa: E402
+from manimtts.narration import END, WORDS_PER_SECOND, SilentBackend, cue_times, split_cues  # noqa: E402
+
+WORD = 1 / WORDS_PER_SECOND
+
+
+@pytest.fixture
+def silent(tmp_path, monkeypatch):
+    """Backend silencieux, clips dans un dossier neuf, aucun clip en mémoire."""
+    monkeypatch.setenv("MANIMTTS_TTS", "silent")
+    monkeypatch.setattr(narration.config, "media_dir", str(tmp_path))
+    monkeypatch.setattr(narration, "_pending", {})
+    monkeypatch.setattr(narration, "_cues", {})
+
+
+def test_estimate_counts_words_outside_tags():
+    ssml = '<speak><prosody rate="slow">Hello there</prosody> world</speak>'
+    assert SilentBackend.estimate(ssml) == pytest.approx(3 / WORDS_PER_SECOND)
+
+
+def test_estimate_adds_timed_breaks():
+    ssml = '<speak>one <break time="400ms"/> two <break time="1.5s"/></speak>'
+    assert SilentBackend.estimate(ssml) == pytest.approx(2 / WORDS_PER_SECOND + 1.9)
+
+
+def test_estimate_ignores_breaks_without_time():
+    ssml = '<speak>one <break strength="strong"/> two</speak>'
+    assert SilentBackend.estimate(ssml) == pytest.approx(2 / WORDS_PER_SECOND)
+
+
+def test_estimate_of_empty_script():
+    assert SilentBackend.estimate("<speak></speak>") == 0.0
+
+
+def test_synthesized_clip_matches_estimate(tmp_path):
+    out = tmp_path / "clip.wav"
+    SilentBackend().synthesize("<speak>one two three four five</speak>", out)
+    with wave.open(str(out), "rb") as wav:
+        assert wav.getnframes() / wav.getframerate() == pytest.approx(2.0)
+
+
+def test_split_cues_without_marks():
+    assert split_cues("<speak>Hello world</speak>") == [(None, "<speak>Hello world</speak>")]
+
+
+def test_split_cues_at_marks():
+    ssml = '<speak>one <mark name="a"/> two <mark name="b"/> three</speak>'
+    assert split_cues(ssml) == [
+        (None, "<speak>one </speak>"),
+        ("a", "<speak> two </speak>"),
+        ("b", "<speak> three</speak>"),
+    ]
+
+
+def test_split_cues_mark_at_start_and_end():
+    ssml = '<speak><mark name="a"/>one two<mark name="z"/></speak>'
+    assert split_cues(ssml) == [(None, ""), ("a", "<speak>one two</speak>"), ("z", "")]
+
+
+def test_cue_times_mark_at_start(silent):
+    times = cue_times('<speak><mark name="a"/>one two</speak>')
+    assert times == pytest.approx({"a": 0.0, END: 2 * WORD})
+
+
+def test_cue_times_mark_at_end(silent):
+    times = cue_times('<speak>one two<mark name="z"/></speak>')
+    assert times == pytest.approx({"z": 2 * WORD, END: 2 * WORD})
+
+
+def test_cue_times_empty_chunk_between_marks(silent):
+    times = cue_times('<speak>one <mark name="a"/><mark name="b"/> two three</speak>')
+    assert times == pytest.approx({"a": WORD, "b": WORD, END: 3 * WORD})
+
+
+def test_cue_times_of_empty_script():
+    assert cue_times("") == {END: 0.0}
@@ -0,0 +1,29 @@
+"""Dossiers de textes propres à chaque worker de rendu."""
+
+import os
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manimtts.prewarm import worker_text_dirs  # noqa: E402
+
+
+def test_worker_sees_shared_svgs_in_its_own_dir(tmp_path):
+    shared = tmp_path / "texts"
+    shared.mkdir()
+    (shared / "abc.svg").write_text("<svg/>")
+    (shared / "abc_.svg").write_text("<svg/>")   # temporaire d'un autre worker
+    (shared / "notes.txt").write_text("")
+    dirs = worker_text_dirs(tmp_path)
+    private = dirs["text_dir"]
+    assert sorted(os.listdir(private)) == ["abc.svg"]
+    assert os.path.samefile(os.path.join(private, "abc.svg"), shared / "abc.svg")
+    assert os.path.isdir(dirs["tex_dir"])
+
+
+def test_new_shared_svgs_are_linked_on_next_job(tmp_path):
+    (tmp_path / "texts").mkdir()
+    worker_text_dirs(tmp_path)
+    (tmp_path / "texts" / "late.svg").write_text("<svg/>")
+    assert "late.svg" in os.listdir(worker_text_dirs(tmp_path)["text_dir"])
@@ -0,0 +1,30 @@
+"""Rendu réel d'un segment court : renderer, tube ffmpeg et film final."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+pytest.importorskip("manim")
+if shutil.which("ffmpeg") is None:
+    pytest.skip("ffmpeg absent", allow_module_level=True)
+
+from manimtts.orchestrator import RenderJob, RenderOptions, render_job  # noqa: E402
+
+
+def _seconds(movie) -> float:
+    probe = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", str(movie)],
+        check=True, capture_output=True, text=True,
+    )
+    return float(json.loads(probe.stdout)["format"]["duration"])
+
+
+def test_transition_card_is_encoded(tmp_path):
+    # carte de transition : play, wait figé, play, wait (3,2 s)
+    options = RenderOptions(quality="low_quality", media_dir=tmp_path, narration=False)
+    movie, _ = render_job(RenderJob(1, "Encoding test", transition=True), options)
+    assert movie.exists() and movie.stat().st_size > 0
+    if shutil.which("ffprobe"):
+        assert _seconds(movie) == pytest.approx(3.2, abs=0.15)
@@ -0,0 +1,35 @@
+"""Découpage d'une scène en parties (``split_plays``)."""
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manimtts.orchestrator import split_plays  # noqa: E402
+
+
+def test_short_scene_stays_whole():
+    assert split_plays([2.0, 3.0, 1.0], 10.0) == [(0, -1)]
+
+
+def test_cut_on_exact_boundary():
+    assert split_plays([5.0, 5.0, 5.0, 5.0], 10.0) == [(0, 1), (2, -1)]
+
+
+def test_small_tail_is_merged():
+    # 12 s atteints au play 1, mais il ne reste que 2 s (< target / 2)
+    assert split_plays([6.0, 6.0, 2.0], 10.0) == [(0, -1)]
+
+
+def test_first_range_never_ends_at_zero():
+    # play 0 dépasse à lui seul la cible : (0, 0) vaudrait « pas de limite »
+    ranges = split_plays([30.0, 4.0, 30.0], 10.0)
+    assert ranges == [(0, 1), (2, -1)]
+    assert all(last != 0 for _, last in ranges)
+
+
+def test_ranges_cover_every_play():
+    durations = [3.0, 8.0, 1.0, 9.0, 4.0, 7.0, 2.0]
+    ranges = split_plays(durations, 10.0)
+    assert ranges[0][0] == 0 and ranges[-1][1] == -1
+    for (_, last), (first, _) in zip(ranges, ranges[1:]):
+        assert first == last + 1